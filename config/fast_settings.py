@@ -0,0 +1,114 @@
+"""
+Optional msgspec-backed fast path for settings loading.
+
+Constructing the Pydantic ``Settings`` pays import and validation cost
+that dominates startup for short-lived CLI invocations. This module
+offers a msgspec.Struct mirror of the same fields that loads straight
+from ``os.environ`` — no Pydantic machinery on the hot path.
+
+Enabled by setting ``RAG_FAST_SETTINGS=1`` (see ``get_settings``).
+Requires the optional ``msgspec`` dependency; when it is missing,
+``get_settings`` silently falls back to the Pydantic path.
+
+Note: unlike Pydantic Settings, this path does not read ``.env`` itself.
+The CLI calls ``load_dotenv()`` before reading settings, so ``.env``
+values are already in the environment by the time this runs.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+import msgspec
+
+_BASE_DIR = Path(__file__).parent.parent
+
+
+class FastSettings(msgspec.Struct, frozen=True):
+    """
+    msgspec mirror of ``config.settings.Settings``.
+
+    Field names, types, and defaults must stay in sync with the Pydantic
+    model (enforced by tests). Range validation is intentionally skipped;
+    this path trades validation for startup latency.
+    """
+
+    llm_provider: str = "openai"
+    embedding_provider: str = "openai"
+
+    openai_api_key: Optional[str] = None
+    openai_embedding_model: str = "text-embedding-3-small"
+    openai_chat_model: str = "gpt-3.5-turbo"
+    openai_temperature: float = 0.3
+
+    embedding_batch_size: int = 16
+    embedding_quantization: str = "none"
+    vector_backend: str = "chroma"
+    embedding_concurrency: int = 8
+
+    loader_workers: int = 4
+
+    chunk_size: int = 1000
+    chunk_overlap: int = 200
+
+    semantic_cache_enabled: bool = True
+    semantic_cache_threshold: float = 0.95
+    semantic_cache_size: int = 128
+
+    retrieval_top_k: int = 5
+    retrieval_search_type: str = "similarity"
+
+    base_dir: Path = _BASE_DIR
+
+    log_level: str = "INFO"
+    log_to_file: bool = True
+
+    @property
+    def data_dir(self) -> Path:
+        """Directory for storing documents."""
+        return self.base_dir / "data"
+
+    @property
+    def db_dir(self) -> Path:
+        """Directory for vector store database."""
+        return self.base_dir / "db"
+
+    @property
+    def logs_dir(self) -> Path:
+        """Directory for log files."""
+        return self.base_dir / "logs"
+
+    @property
+    def vector_store_path(self) -> Path:
+        """Path to the vector store database."""
+        return self.db_dir / "chroma_db"
+
+
+def _dec_hook(target_type, value):
+    """Coerce environment strings into types msgspec lacks natively."""
+    if target_type is Path:
+        return Path(value)
+    raise NotImplementedError(
+        f"Cannot convert {value!r} to {target_type!r}"
+    )
+
+
+def load_fast_settings() -> FastSettings:
+    """
+    Build a FastSettings instance from environment variables.
+
+    Environment variable names match the uppercased field names, same as
+    the Pydantic path (e.g. ``CHUNK_SIZE``, ``OPENAI_API_KEY``).
+
+    Returns:
+        FastSettings instance with env values applied over defaults
+    """
+    values = {}
+    for field in FastSettings.__struct_fields__:
+        raw = os.environ.get(field.upper())
+        if raw is not None:
+            values[field] = raw
+
+    return msgspec.convert(
+        values, FastSettings, strict=False, dec_hook=_dec_hook
+    )
@@ -1,5 +1,7 @@
 """Configuration management for RAG system using Pydantic Settings."""
 
+import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -49,6 +51,39 @@ class Settings(BaseSettings):
         description="Temperature for LLM generation"
     )
     
+    # Embedding Configuration
+    embedding_batch_size: int = Field(
+        default=16,
+        gt=0,
+        le=2048,
+        description="Number of chunks embedded per bulk embedding request "
+                    "(OpenAI accepts up to 2048 inputs per call)"
+    )
+    embedding_quantization: str = Field(
+        default="none",
+        description="Quantization applied to embedding vectors at write "
+                    "time (none | int8)"
+    )
+    vector_backend: str = Field(
+        default="chroma",
+        description="Vector store backend (chroma | faiss). faiss requires "
+                    "the optional faiss-cpu package"
+    )
+    embedding_concurrency: int = Field(
+        default=8,
+        gt=0,
+        description="Maximum embedding batch requests in flight concurrently "
+                    "(bounded to stay within provider rate limits)"
+    )
+
+    # Document Loading Configuration
+    loader_workers: int = Field(
+        default=4,
+        gt=0,
+        description="Worker threads used to load files in parallel during "
+                    "directory ingestion"
+    )
+
     # Text Processing Configuration
     chunk_size: int = Field(
         default=1000,
@@ -61,6 +96,26 @@ class Settings(BaseSettings):
         description="Overlap between consecutive chunks"
     )
     
+    # Semantic Cache Configuration
+    semantic_cache_enabled: bool = Field(
+        default=True,
+        description="Return cached answers for semantically similar re-asks "
+                    "instead of re-running retrieval and generation"
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.95,
+        gt=0,
+        le=1,
+        description="Minimum cosine similarity between a new question and a "
+                    "cached one to count as a cache hit"
+    )
+    semantic_cache_size: int = Field(
+        default=128,
+        gt=0,
+        description="Maximum number of question/answer pairs kept in the "
+                    "semantic cache (LRU eviction)"
+    )
+
     # Retrieval Configuration
     retrieval_top_k: int = Field(
         default=5,
@@ -78,22 +133,24 @@ class Settings(BaseSettings):
         description="Base directory of the project"
     )
     
-    @property
+    # Derived paths are cached per instance: they are accessed in hot
+    # ingestion loops and would otherwise build a new Path on every access.
+    @cached_property
     def data_dir(self) -> Path:
         """Directory for storing documents."""
         return self.base_dir / "data"
-    
-    @property
+
+    @cached_property
     def db_dir(self) -> Path:
         """Directory for vector store database."""
         return self.base_dir / "db"
-    
-    @property
+
+    @cached_property
     def logs_dir(self) -> Path:
         """Directory for log files."""
         return self.base_dir / "logs"
-    
-    @property
+
+    @cached_property
     def vector_store_path(self) -> Path:
         """Path to the vector store database."""
         return self.db_dir / "chroma_db"
@@ -115,17 +172,38 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=None)
 def get_settings(**overrides) -> Settings:
     """
     Factory function to create Settings instance with optional overrides.
-    
+
+    Results are memoized per override combination: constructing Settings
+    re-reads the .env file and re-validates every field, which is pure
+    overhead when called from every component's __init__. Call
+    ``get_settings.cache_clear()`` if environment variables change at
+    runtime (mainly relevant in tests).
+
     Args:
         **overrides: Keyword arguments to override default settings
-    
+
     Returns:
         Settings instance
-    
+
     Example:
         settings = get_settings(openai_api_key="sk-...")
+
+    Note:
+        With ``RAG_FAST_SETTINGS=1`` and the optional ``msgspec``
+        dependency installed, the no-override call returns a
+        ``FastSettings`` struct instead — same fields and derived paths,
+        loaded from the environment without Pydantic validation cost.
     """
+    if not overrides and os.environ.get("RAG_FAST_SETTINGS") == "1":
+        try:
+            from config.fast_settings import load_fast_settings
+
+            return load_fast_settings()
+        except ImportError:
+            pass  # msgspec not installed — use the validated path
+
     return Settings(**overrides)
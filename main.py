@@ -3,10 +3,12 @@
 import argparse
 import os
 import sys
+from collections import defaultdict
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+from src.document_loader import get_document_loader
 from src.rag_pipeline import RAGPipeline
 from src.utils.logger import setup_logger
 
@@ -154,8 +156,7 @@ Supported file types: PDF, TXT, DOCX, DOC, MD
                     print("Error: --list-files requires --directory")
                     sys.exit(1)
                 
-                from src.document_loader import DocumentLoader
-                doc_loader = DocumentLoader()
+                doc_loader = get_document_loader()
                 
                 # Parse file types if provided
                 file_types = None
@@ -175,16 +176,17 @@ Supported file types: PDF, TXT, DOCX, DOC, MD
                     print(f"{'='*60}")
                     
                     if files:
-                        # Group files by extension
-                        from collections import defaultdict
+                        # Group files by extension. list_files returns
+                        # paths already sorted, so stable partitioning
+                        # keeps each group sorted without re-sorting.
                         files_by_type = defaultdict(list)
                         for f in files:
                             files_by_type[f.suffix].append(f)
-                        
+
                         total_files = 0
-                        for ext, file_list in sorted(files_by_type.items()):
+                        for ext, file_list in files_by_type.items():
                             print(f"\n{ext.upper()} files ({len(file_list)}):")
-                            for f in sorted(file_list):
+                            for f in file_list:
                                 print(f"  - {f.relative_to(args.directory)}")
                             total_files += len(file_list)
                         
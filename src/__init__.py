@@ -3,6 +3,63 @@ RAG (Retrieval-Augmented Generation) System
 
 A modular and production-ready implementation of a RAG pipeline
 for document-based question answering.
+
+Public classes are exported lazily: ``import src`` is cheap and heavy
+submodules load on first attribute access. Note that ``from src import *``
+necessarily resolves every name in ``__all__`` and therefore imports all
+submodules eagerly — prefer importing the names you need.
 """
 
+import importlib
+
 __version__ = "1.0.0"
+
+# Public classes re-exported lazily: importing ``src`` stays cheap and the
+# heavy submodules (LangChain, Chroma, ...) are only imported when a name
+# is first accessed.
+_LAZY = {
+    "RAGPipeline": ("src.rag_pipeline", "RAGPipeline"),
+    "DocumentLoader": ("src.document_loader", "DocumentLoader"),
+    "TextProcessor": ("src.text_processor", "TextProcessor"),
+    "VectorStore": ("src.vector_store", "VectorStore"),
+    "DocumentRetriever": ("src.retriever", "DocumentRetriever"),
+    "ResponseGenerator": ("src.generator", "ResponseGenerator"),
+}
+
+__all__ = ["__version__", *_LAZY]
+
+
+def __getattr__(name):
+    """
+    Resolve a lazy export on first access.
+
+    The resolved attribute is written back into module globals so later
+    lookups short-circuit through normal attribute access instead of
+    re-entering ``__getattr__``.
+    """
+    try:
+        module_path, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    resolved = getattr(importlib.import_module(module_path), attr)
+    globals()[name] = resolved
+    return resolved
+
+
+def __dir__():
+    """List lazy exports without importing them (keeps dir()/IDEs cheap)."""
+    return sorted({*globals(), *__all__})
+
+
+def load_all() -> None:
+    """
+    Eagerly resolve every lazy export.
+
+    Useful before forking workers or in long-running servers where
+    first-access import latency inside a request is undesirable.
+    """
+    for name in _LAZY:
+        __getattr__(name)
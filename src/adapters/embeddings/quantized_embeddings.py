@@ -0,0 +1,86 @@
+"""Int8 scalar quantization wrapper for embedding providers."""
+
+from typing import List
+
+import numpy as np
+
+from src.ports.embedding_provider import BaseEmbeddingProvider
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class Int8QuantizedEmbeddingAdapter(BaseEmbeddingProvider):
+    """
+    Wraps any BaseEmbeddingProvider and applies int8 scalar quantization.
+
+    Each vector is quantized with a per-vector scale (max|v| / 127),
+    rounded to int8, then dequantized before being handed to the vector
+    store. The index therefore holds exactly the information an
+    int8-compressed store would hold — 8 bits per dimension instead of
+    32 — which typically costs <1% recall at top-5.
+
+    The LangChain Chroma integration only accepts float vectors, so the
+    byte-level storage saving depends on the backend; what this wrapper
+    guarantees is that retrieval quality already reflects the int8
+    precision budget, making the trade-off safe to adopt store-side.
+    """
+
+    def __init__(self, inner: BaseEmbeddingProvider) -> None:
+        """
+        Initialize the quantization wrapper.
+
+        Args:
+            inner: The embedding provider whose vectors are quantized.
+        """
+        self._inner = inner
+        logger.info(
+            f"Int8QuantizedEmbeddingAdapter ready (wrapping {type(inner).__name__})"
+        )
+
+    @staticmethod
+    def _quantize(vector: List[float]) -> List[float]:
+        """
+        Round-trip a vector through int8 with a per-vector scale.
+
+        Args:
+            vector: Raw embedding vector from the inner provider.
+
+        Returns:
+            The vector after int8 quantization and dequantization.
+        """
+        values = np.asarray(vector, dtype=np.float32)
+        scale = float(np.max(np.abs(values))) / 127.0 if values.size else 0.0
+        if scale == 0.0:
+            return values.tolist()
+
+        quantized = np.clip(np.round(values / scale), -127, 127).astype(np.int8)
+        return (quantized.astype(np.float32) * scale).tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed documents via the inner provider and quantize each vector.
+
+        Args:
+            texts: List of document strings to embed.
+
+        Returns:
+            List of int8-quantized embedding vectors, one per input text.
+        """
+        vectors = self._inner.embed_documents(texts)
+        return [self._quantize(vector) for vector in vectors]
+
+    def embed_query(self, text: str) -> List[float]:
+        """
+        Embed a query via the inner provider and quantize the vector.
+
+        Args:
+            text: The query string to embed.
+
+        Returns:
+            The int8-quantized embedding vector.
+        """
+        return self._quantize(self._inner.embed_query(text))
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"Int8QuantizedEmbeddingAdapter(inner={self._inner!r})"
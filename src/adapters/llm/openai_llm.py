@@ -1,5 +1,7 @@
 """OpenAI adapter for the LLM provider port."""
 
+from functools import lru_cache
+
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 
@@ -9,6 +11,19 @@ from src.utils.logger import setup_logger
 logger = setup_logger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _shared_chat_client(model: str, temperature: float, api_key: str) -> ChatOpenAI:
+    """
+    Return a ChatOpenAI client shared across adapters with the same config.
+
+    Each ChatOpenAI instance owns its own httpx connection pool, so
+    constructing one per adapter pays a fresh TCP/TLS handshake per
+    query path. Sharing a client per (model, temperature, api_key)
+    combination reuses keep-alive connections instead.
+    """
+    return ChatOpenAI(model=model, temperature=temperature, api_key=api_key)
+
+
 class OpenAILLMAdapter(BaseLLMProvider):
     """
     Concrete implementation of BaseLLMProvider using OpenAI's chat models.
@@ -28,11 +43,7 @@ class OpenAILLMAdapter(BaseLLMProvider):
             api_key:     OpenAI API key. Passed explicitly to avoid relying
                          on global environment state.
         """
-        self._llm = ChatOpenAI(
-            model=model,
-            temperature=temperature,
-            api_key=api_key,
-        )
+        self._llm = _shared_chat_client(model, temperature, api_key)
         logger.info(f"OpenAILLMAdapter ready (model={model}, temperature={temperature})")
 
     def generate(self, system_prompt: str, user_message: str) -> str:
@@ -59,6 +70,53 @@ class OpenAILLMAdapter(BaseLLMProvider):
         response = self._llm.invoke(messages)
         return response.content
 
+    async def agenerate(self, system_prompt: str, user_message: str) -> str:
+        """
+        Async variant of generate() using OpenAI's async client.
+
+        Allows multiple chat requests to be in flight concurrently
+        (e.g. via asyncio.gather) instead of serializing HTTP round-trips.
+
+        Args:
+            system_prompt: Instructions / context built by the generator.
+            user_message:  The user's question.
+
+        Returns:
+            The model's reply as a plain string.
+        """
+        messages = [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=user_message),
+        ]
+
+        logger.debug("Sending async request to OpenAI chat API")
+        response = await self._llm.ainvoke(messages)
+        return response.content
+
+    def stream(self, system_prompt: str, user_message: str):
+        """
+        Stream the reply token-by-token using OpenAI's streaming API.
+
+        Lets callers render output at time-to-first-token instead of
+        waiting for the complete response.
+
+        Args:
+            system_prompt: Instructions / context built by the generator.
+            user_message:  The user's question.
+
+        Yields:
+            Chunks of the model's reply, in order.
+        """
+        messages = [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=user_message),
+        ]
+
+        logger.debug("Streaming request to OpenAI chat API")
+        for chunk in self._llm.stream(messages):
+            if chunk.content:
+                yield chunk.content
+
     def __repr__(self) -> str:  # pragma: no cover
         return (
             f"OpenAILLMAdapter("
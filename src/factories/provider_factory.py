@@ -81,7 +81,7 @@ def create_embedding_provider(settings: Settings, api_key: str) -> BaseEmbedding
     if name == "openai":
         from src.adapters.embeddings.openai_embeddings import OpenAIEmbeddingAdapter
 
-        return OpenAIEmbeddingAdapter(
+        provider = OpenAIEmbeddingAdapter(
             model=settings.openai_embedding_model,
             api_key=api_key,
         )
@@ -89,14 +89,32 @@ def create_embedding_provider(settings: Settings, api_key: str) -> BaseEmbedding
     # ── future providers ──────────────────────────────────────────────────
     # elif name == "ollama":
     #     from src.adapters.embeddings.ollama_embeddings import OllamaEmbeddingAdapter
-    #     return OllamaEmbeddingAdapter(model=settings.ollama_embedding_model)
+    #     provider = OllamaEmbeddingAdapter(model=settings.ollama_embedding_model)
     #
     # elif name == "azure":
     #     from src.adapters.embeddings.azure_embeddings import AzureEmbeddingAdapter
-    #     return AzureEmbeddingAdapter(...)
+    #     provider = AzureEmbeddingAdapter(...)
     # ─────────────────────────────────────────────────────────────────────
 
-    raise ValueError(
-        f"Unsupported embedding provider: '{settings.embedding_provider}'. "
-        f"Supported values: 'openai'."
-    )
+    else:
+        raise ValueError(
+            f"Unsupported embedding provider: '{settings.embedding_provider}'. "
+            f"Supported values: 'openai'."
+        )
+
+    quantization = settings.embedding_quantization.lower()
+
+    if quantization == "int8":
+        from src.adapters.embeddings.quantized_embeddings import (
+            Int8QuantizedEmbeddingAdapter,
+        )
+
+        provider = Int8QuantizedEmbeddingAdapter(provider)
+    elif quantization != "none":
+        raise ValueError(
+            f"Unsupported embedding quantization: "
+            f"'{settings.embedding_quantization}'. Supported values: "
+            f"'none', 'int8'."
+        )
+
+    return provider
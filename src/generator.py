@@ -1,6 +1,7 @@
 """Response generator module for LLM-based answer generation."""
 
-from typing import List, Tuple
+import asyncio
+from typing import Iterator, List, Tuple
 
 from langchain_core.documents import Document
 
@@ -50,7 +51,29 @@ Context:
         self.llm_provider = llm_provider
         self.system_prompt_template = system_prompt or self.DEFAULT_SYSTEM_PROMPT
 
+        # Split the template around {context} once so each query only
+        # concatenates three strings instead of re-running str.format's
+        # field parser over the whole template.
+        prefix, placeholder, suffix = self.system_prompt_template.partition("{context}")
+        self._has_context_slot = bool(placeholder)
+        self._prompt_prefix = prefix
+        self._prompt_suffix = suffix
+
         logger.info("ResponseGenerator initialized")
+
+    def _build_system_prompt(self, context: str) -> str:
+        """
+        Assemble the system prompt for the given context string.
+
+        Args:
+            context: Formatted retrieval context
+
+        Returns:
+            The system prompt with context substituted in
+        """
+        if not self._has_context_slot:
+            return self.system_prompt_template
+        return f"{self._prompt_prefix}{context}{self._prompt_suffix}"
     
     def _format_context(self, documents: List[Document]) -> str:
         """
@@ -62,11 +85,12 @@ Context:
         Returns:
             Formatted context string
         """
-        context_parts = []
-        for i, doc in enumerate(documents, 1):
-            context_parts.append(f"Source {i}:\n{doc.page_content}")
-        
-        return "\n\n".join(context_parts)
+        # Feed join directly from a generator — no intermediate list of
+        # parts to allocate, which matters for large retrieval batches.
+        return "\n\n".join(
+            f"Source {i}:\n{doc.page_content}"
+            for i, doc in enumerate(documents, 1)
+        )
     
     def generate(
         self,
@@ -83,15 +107,15 @@ Context:
         Returns:
             Tuple of (generated answer string, source documents used)
         """
-        logger.info(f"Generating response for query")
-        logger.debug(f"Query: {query}")
-        logger.debug(f"Using {len(context_documents)} context documents")
+        logger.info("Generating response for query")
+        logger.debug("Query: %s", query)
+        logger.debug("Using %d context documents", len(context_documents))
         
         # Format context
         context = self._format_context(context_documents)
 
         # Build prompts
-        system_prompt = self.system_prompt_template.format(context=context)
+        system_prompt = self._build_system_prompt(context)
         user_message = f"Question: {query}"
 
         # Generate response — delegate to the injected provider
@@ -99,28 +123,111 @@ Context:
             answer = self.llm_provider.generate(system_prompt, user_message)
 
             logger.info("Response generated successfully")
-            logger.debug(f"Answer length: {len(answer)} characters")
+            logger.debug("Answer length: %d characters", len(answer))
 
             return answer, context_documents
 
         except Exception as e:
-            logger.error(f"Error generating response: {e}")
+            logger.error("Error generating response: %s", e)
             raise
     
+    async def agenerate(
+        self,
+        query: str,
+        context_documents: List[Document]
+    ) -> Tuple[str, List[Document]]:
+        """
+        Async variant of generate().
+
+        Uses the provider's async path so multiple generations can run
+        concurrently (e.g. batched queries via asyncio.gather).
+
+        Args:
+            query: User's question or query
+            context_documents: Retrieved documents to use as context
+
+        Returns:
+            Tuple of (generated answer string, source documents used)
+        """
+        logger.info("Generating response for query (async)")
+        logger.debug("Query: %s", query)
+        logger.debug("Using %d context documents", len(context_documents))
+
+        context = self._format_context(context_documents)
+
+        system_prompt = self._build_system_prompt(context)
+        user_message = f"Question: {query}"
+
+        try:
+            answer = await self.llm_provider.agenerate(system_prompt, user_message)
+
+            logger.info("Response generated successfully")
+            logger.debug("Answer length: %d characters", len(answer))
+
+            return answer, context_documents
+
+        except Exception as e:
+            logger.error("Error generating response: %s", e)
+            raise
+
+    def generate_batch(
+        self,
+        items: List[Tuple[str, List[Document]]],
+    ) -> List[Tuple[str, List[Document]]]:
+        """
+        Generate responses for several (query, documents) pairs at once.
+
+        All generations are dispatched concurrently through agenerate,
+        overlapping the provider's network round-trips instead of paying
+        them serially.
+
+        Args:
+            items: List of (query, context documents) pairs
+
+        Returns:
+            List of (answer, source documents) tuples, in input order
+        """
+        logger.info("Generating %d response(s) in batch", len(items))
+
+        async def _run() -> List[Tuple[str, List[Document]]]:
+            return list(
+                await asyncio.gather(
+                    *(self.agenerate(query, documents) for query, documents in items)
+                )
+            )
+
+        return asyncio.run(_run())
+
     def generate_streaming(
         self,
         query: str,
         context_documents: List[Document]
-    ):
+    ) -> Iterator[str]:
         """
-        Generate a streaming response (future enhancement).
-        
+        Generate a streaming response to the query.
+
+        Chunks are yielded as the provider produces them, so callers can
+        render the answer at time-to-first-token instead of waiting for
+        the full generation.
+
         Args:
             query: User's question or query
             context_documents: Retrieved documents to use as context
-        
+
         Yields:
             Chunks of the generated response
         """
-        # Future: implement streaming response
-        raise NotImplementedError("Streaming generation not yet implemented")
+        logger.info("Generating streaming response for query")
+        logger.debug("Using %d context documents", len(context_documents))
+
+        context = self._format_context(context_documents)
+
+        system_prompt = self._build_system_prompt(context)
+        user_message = f"Question: {query}"
+
+        try:
+            yield from self.llm_provider.stream(system_prompt, user_message)
+            logger.info("Streaming response completed")
+        except Exception as e:
+            logger.error("Error generating response: %s", e)
+            raise
@@ -0,0 +1,116 @@
+"""Sidecar manifest tracking which files have already been ingested."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class IngestManifest:
+    """
+    Records a fingerprint for every ingested file.
+
+    Each entry maps an absolute file path to its (mtime_ns, size) pair.
+    On re-ingestion, files whose fingerprint still matches can be skipped
+    entirely — no re-parse, no re-chunk, no re-embed. This makes
+    iterative workflows (add two PDFs to a 500-file corpus, re-run
+    ingest) pay only for what actually changed.
+    """
+
+    def __init__(self, manifest_path: Path):
+        """
+        Initialize an empty manifest.
+
+        Args:
+            manifest_path: Where the manifest JSON is persisted
+                          (conventionally next to the vector store).
+        """
+        self.manifest_path = manifest_path
+        self._entries: Dict[str, List[int]] = {}
+
+    @classmethod
+    def load(cls, manifest_path: Path) -> "IngestManifest":
+        """
+        Load a manifest from disk, or return an empty one if absent.
+
+        A corrupt manifest is treated as empty — worst case, files are
+        re-ingested rather than wrongly skipped.
+
+        Args:
+            manifest_path: Path to the manifest JSON file
+
+        Returns:
+            IngestManifest instance
+        """
+        manifest = cls(manifest_path)
+
+        if manifest_path.exists():
+            try:
+                with open(manifest_path, encoding="utf-8") as f:
+                    manifest._entries = json.load(f)
+                logger.debug(
+                    f"Loaded ingest manifest with {len(manifest._entries)} entries"
+                )
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable ingest manifest: {e}")
+                manifest._entries = {}
+
+        return manifest
+
+    def is_current(self, file_path: Path) -> bool:
+        """
+        Check whether a file is already ingested and unchanged.
+
+        Args:
+            file_path: Path to the candidate file
+
+        Returns:
+            True if the file's mtime and size match the recorded entry
+        """
+        entry = self._entries.get(str(file_path.resolve()))
+        if entry is None:
+            return False
+
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return False
+
+        return entry == [stat.st_mtime_ns, stat.st_size]
+
+    def record(self, file_path: Path) -> None:
+        """
+        Record (or refresh) the fingerprint for a file.
+
+        Args:
+            file_path: Path to the file that was just ingested
+        """
+        stat = file_path.stat()
+        self._entries[str(file_path.resolve())] = [stat.st_mtime_ns, stat.st_size]
+
+    def save(self) -> None:
+        """
+        Persist the manifest atomically (write to temp file, then rename).
+        """
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.manifest_path.parent, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.manifest_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        logger.debug(f"Saved ingest manifest ({len(self._entries)} entries)")
+
+    def __len__(self) -> int:
+        return len(self._entries)
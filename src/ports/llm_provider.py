@@ -1,6 +1,7 @@
 """Port (interface) for LLM providers."""
 
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 
 class BaseLLMProvider(ABC):
@@ -24,3 +25,35 @@ class BaseLLMProvider(ABC):
             The model's response as a plain string.
         """
         ...
+
+    async def agenerate(self, system_prompt: str, user_message: str) -> str:
+        """
+        Async variant of generate().
+
+        Providers with a native async client should override this; the
+        default falls back to the synchronous path.
+
+        Args:
+            system_prompt: Instructions / context for the model.
+            user_message:  The user's question or input.
+
+        Returns:
+            The model's response as a plain string.
+        """
+        return self.generate(system_prompt, user_message)
+
+    def stream(self, system_prompt: str, user_message: str) -> Iterator[str]:
+        """
+        Stream a response as the model produces it.
+
+        Providers with a native streaming client should override this;
+        the default yields the full synchronous response in one piece.
+
+        Args:
+            system_prompt: Instructions / context for the model.
+            user_message:  The user's question or input.
+
+        Yields:
+            Chunks of the model's response, in order.
+        """
+        yield self.generate(system_prompt, user_message)
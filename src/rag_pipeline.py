@@ -1,23 +1,32 @@
 """Main RAG Pipeline orchestrator."""
 
+import asyncio
+import gc
+import sys
 from pathlib import Path
 from typing import List, Optional, Tuple
 
 from langchain_core.documents import Document
 
 from config.settings import Settings, get_settings
-from src.document_loader import DocumentLoader
+from src.document_loader import get_document_loader
 from src.factories.provider_factory import create_embedding_provider, create_llm_provider
 from src.generator import ResponseGenerator
+from src.ingest_manifest import IngestManifest
 from src.ports.embedding_provider import BaseEmbeddingProvider
 from src.ports.llm_provider import BaseLLMProvider
 from src.retriever import DocumentRetriever
+from src.semantic_cache import SemanticQueryCache
 from src.text_processor import TextProcessor
 from src.utils.logger import setup_logger
 from src.vector_store import VectorStore
 
 logger = setup_logger(__name__)
 
+# Chunks buffered before each embed-and-persist flush during streaming
+# directory ingestion; bounds resident memory regardless of corpus size
+_INGEST_FLUSH_SIZE = 256
+
 
 class RAGPipeline:
     """
@@ -98,7 +107,7 @@ class RAGPipeline:
         persist_dir = vector_store_path or self.settings.vector_store_path
 
         # Initialize components
-        self.document_loader = DocumentLoader()
+        self.document_loader = get_document_loader()
         self.text_processor = TextProcessor(
             chunk_size=self.settings.chunk_size,
             chunk_overlap=self.settings.chunk_overlap,
@@ -106,9 +115,19 @@ class RAGPipeline:
         self.vector_store = VectorStore(
             embedding_provider=_emb,
             persist_directory=persist_dir,
+            embedding_batch_size=self.settings.embedding_batch_size,
         )
         self.retriever: Optional[DocumentRetriever] = None
         self.generator = ResponseGenerator(llm_provider=_llm)
+        self.semantic_cache: Optional[SemanticQueryCache] = (
+            SemanticQueryCache(
+                embedding_provider=_emb,
+                threshold=self.settings.semantic_cache_threshold,
+                max_size=self.settings.semantic_cache_size,
+            )
+            if self.settings.semantic_cache_enabled
+            else None
+        )
 
         self._is_initialized = False
 
@@ -129,7 +148,12 @@ class RAGPipeline:
         1. Loads documents from the specified source
         2. Splits them into chunks
         3. Creates embeddings and stores in vector database
-        
+
+        When ingesting a directory into an existing store, an ingest
+        manifest (mtime + size per file) is consulted so unchanged files
+        are skipped and only new or modified files are parsed, chunked
+        and embedded.
+
         Args:
             file_path: Path to a single document file
             directory: Path to a directory of documents
@@ -137,39 +161,165 @@ class RAGPipeline:
                        If None, loads all supported types
             force_recreate: If True, recreates vector store even if it exists
             recursive: If True, search subdirectories when loading from directory
-        
+
         Raises:
             ValueError: If neither file_path nor directory is provided
         """
         logger.info("Starting document ingestion")
-        
+
+        # The manifest lives next to the vector store; only directory
+        # ingestion maintains it (single files are cheap to re-ingest).
+        manifest = None
+        if directory is not None:
+            manifest = IngestManifest.load(
+                self.vector_store.persist_directory.parent / "ingest_manifest.json"
+            )
+
         # Check if vector store already exists
         if not force_recreate and self.vector_store.persist_directory.exists():
             logger.info("Vector store already exists. Loading existing store.")
             self.vector_store.load_existing()
             self.retriever = DocumentRetriever(self.vector_store)
             self._is_initialized = True
+
+            if manifest is not None:
+                self._ingest_incrementally(
+                    directory, file_types, recursive, manifest
+                )
             return
-        
-        # Load documents
-        documents = self.document_loader.load_documents(
-            file_path=file_path,
-            directory=directory,
-            file_types=file_types,
-            recursive=recursive
-        )
-        
-        # Split into chunks
-        chunks = self.text_processor.split_documents(documents)
-        
-        # Create vector store
-        self.vector_store.create_from_documents(chunks)
-        
+
+        if directory is not None:
+            # Directories are streamed file by file so the resident set
+            # stays bounded regardless of corpus size
+            self._ingest_streaming(directory, file_types, recursive, manifest)
+            if manifest is not None:
+                manifest.save()
+        else:
+            # Single files are small enough to process eagerly
+            documents = self.document_loader.load_documents(file_path=file_path)
+
+            # Split into chunks and drop exact duplicates so repeated
+            # boilerplate is only embedded once
+            chunks = self.text_processor.split_documents(documents)
+            chunks = self.text_processor.deduplicate_chunks(chunks)
+
+            # Create vector store
+            self.vector_store.create_from_documents(chunks)
+
         # Initialize retriever
         self.retriever = DocumentRetriever(self.vector_store)
-        
+
         self._is_initialized = True
         logger.info("Document ingestion completed successfully")
+
+    def _ingest_streaming(
+        self,
+        directory: Path,
+        file_types: Optional[List[str]],
+        recursive: bool,
+        manifest: Optional[IngestManifest],
+    ) -> None:
+        """
+        Stream a directory into a fresh vector store, file by file.
+
+        Each file is loaded, chunked and deduplicated as it arrives;
+        chunks are flushed to the store every ``_INGEST_FLUSH_SIZE``
+        chunks and their references dropped, so memory stays bounded
+        instead of holding the whole corpus before the first embedding.
+
+        Args:
+            directory: Directory being ingested
+            file_types: Extension filter forwarded to the loader
+            recursive: Whether subdirectories are searched
+            manifest: Manifest updated per successfully loaded file,
+                     or None when no manifest is maintained
+
+        Raises:
+            ValueError: If no documents could be loaded from any files
+        """
+        seen_hashes: set = set()
+        buffer: List[Document] = []
+        store_created = False
+        total_chunks = 0
+
+        def _flush() -> None:
+            nonlocal store_created, total_chunks
+            batch = buffer[:]
+            buffer.clear()
+            if store_created:
+                self.vector_store.add_documents(batch)
+            else:
+                self.vector_store.create_from_documents(batch)
+                store_created = True
+            total_chunks += len(batch)
+            del batch
+            # Flushed chunks are unreachable now; reclaim them before
+            # the next file instead of waiting for a full collection
+            gc.collect()
+
+        for path, documents in self.document_loader.iter_directory(
+            directory, file_types, recursive
+        ):
+            chunks = self.text_processor.split_documents(documents)
+            buffer.extend(
+                self.text_processor.deduplicate_chunks(chunks, seen=seen_hashes)
+            )
+            if manifest is not None:
+                manifest.record(path)
+
+            if len(buffer) >= _INGEST_FLUSH_SIZE:
+                _flush()
+
+        if buffer:
+            _flush()
+
+        if not store_created:
+            raise ValueError("No documents could be loaded from any files")
+
+        logger.info(
+            f"Streamed {total_chunks} chunk(s) into the vector store"
+        )
+
+    def _ingest_incrementally(
+        self,
+        directory: Path,
+        file_types: Optional[List[str]],
+        recursive: bool,
+        manifest: IngestManifest,
+    ) -> None:
+        """
+        Add only new or changed files from a directory to an existing store.
+
+        Args:
+            directory: Directory being re-ingested
+            file_types: Extension filter forwarded to the loader
+            recursive: Whether subdirectories are searched
+            manifest: Manifest of already-ingested file fingerprints
+        """
+        files = self.document_loader.list_files(directory, file_types, recursive)
+        stale = [path for path in files if not manifest.is_current(path)]
+
+        if not stale:
+            logger.info("All files unchanged since last ingestion; nothing to do")
+            return
+
+        logger.info("Incrementally ingesting %d new/changed file(s)", len(stale))
+
+        documents = []
+        for path in stale:
+            try:
+                documents.extend(self.document_loader.load_file(path))
+            except Exception as e:
+                logger.error("Failed to load %s: %s", path.name, e)
+                continue
+            manifest.record(path)
+
+        if documents:
+            chunks = self.text_processor.split_documents(documents)
+            chunks = self.text_processor.deduplicate_chunks(chunks)
+            self.vector_store.add_documents(chunks)
+
+        manifest.save()
     
     def load_existing_index(self) -> None:
         """
@@ -210,21 +360,165 @@ class RAGPipeline:
                 "load_existing_index() first"
             )
         
-        logger.info(f"Processing query: {question[:100]}...")
-        
+        logger.info("Processing query: %s...", question[:100])
+
+        # Semantically similar re-asks skip retrieval and generation
+        if self.semantic_cache is not None:
+            cached = self.semantic_cache.get(question)
+            if cached is not None:
+                answer, sources = cached
+                return (answer, sources) if return_sources else (answer, None)
+
         # Retrieve relevant documents
         relevant_docs = self.retriever.retrieve(question)
-        
+
         # Generate response
         answer, sources = self.generator.generate(question, relevant_docs)
-        
+
+        if self.semantic_cache is not None:
+            self.semantic_cache.put(question, answer, sources)
+
         logger.info("Query processed successfully")
-        
+
         if return_sources:
             return answer, sources
         else:
             return answer, None
-    
+
+    async def aquery(
+        self,
+        question: str,
+        return_sources: bool = True
+    ) -> Tuple[str, Optional[List[Document]]]:
+        """
+        Async variant of query().
+
+        Retrieval and generation both use their async paths, so multiple
+        questions can be processed concurrently with asyncio.gather.
+
+        Args:
+            question: The question to ask
+            return_sources: Whether to return source documents
+
+        Returns:
+            Tuple of (answer string, list of source documents if requested)
+
+        Raises:
+            RuntimeError: If pipeline is not initialized
+        """
+        if not self._is_initialized:
+            raise RuntimeError(
+                "Pipeline not initialized. Call ingest_documents() or "
+                "load_existing_index() first"
+            )
+
+        logger.info("Processing query (async): %s...", question[:100])
+
+        if self.semantic_cache is not None:
+            cached = self.semantic_cache.get(question)
+            if cached is not None:
+                answer, sources = cached
+                return (answer, sources) if return_sources else (answer, None)
+
+        relevant_docs = await self.retriever.aretrieve(question)
+
+        answer, sources = await self.generator.agenerate(question, relevant_docs)
+
+        if self.semantic_cache is not None:
+            self.semantic_cache.put(question, answer, sources)
+
+        logger.info("Query processed successfully")
+
+        if return_sources:
+            return answer, sources
+        else:
+            return answer, None
+
+    def batch_query(
+        self,
+        questions: List[str],
+        return_sources: bool = True,
+        max_concurrency: int = 8,
+    ) -> List[Tuple[str, Optional[List[Document]]]]:
+        """
+        Answer several questions concurrently.
+
+        Questions are fanned out over the async query path with a bounded
+        number in flight, so N questions cost roughly N / max_concurrency
+        serial round-trips instead of N.
+
+        Args:
+            questions: Questions to answer
+            return_sources: Whether to return source documents per answer
+            max_concurrency: Maximum questions processed at once
+
+        Returns:
+            List of (answer, sources) tuples in the same order as the
+            input questions
+
+        Raises:
+            RuntimeError: If pipeline is not initialized
+        """
+        if not self._is_initialized:
+            raise RuntimeError(
+                "Pipeline not initialized. Call ingest_documents() or "
+                "load_existing_index() first"
+            )
+
+        logger.info(
+            f"Processing batch of {len(questions)} questions "
+            f"(max_concurrency={max_concurrency})"
+        )
+
+        async def _run() -> List[Tuple[str, Optional[List[Document]]]]:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _one(question: str):
+                async with semaphore:
+                    return await self.aquery(question, return_sources)
+
+            return await asyncio.gather(*(_one(q) for q in questions))
+
+        return asyncio.run(_run())
+
+    def _stream_query(self, question: str) -> Tuple[str, List[Document]]:
+        """
+        Answer a question, printing tokens as the provider streams them.
+
+        Semantic-cache hits are printed whole; misses retrieve, stream
+        the generation to stdout, then populate the cache like query().
+
+        Args:
+            question: The question to ask
+
+        Returns:
+            Tuple of (full answer string, source documents used)
+        """
+        if self.semantic_cache is not None:
+            cached = self.semantic_cache.get(question)
+            if cached is not None:
+                answer, sources = cached
+                print(f"\n{'='*60}")
+                print(f"ANSWER:\n{answer}")
+                return answer, sources
+
+        documents = self.retriever.retrieve(question)
+
+        print(f"\n{'='*60}")
+        print("ANSWER:")
+        pieces: List[str] = []
+        for token in self.generator.generate_streaming(question, documents):
+            pieces.append(token)
+            sys.stdout.write(token)
+            sys.stdout.flush()
+        print()
+        answer = "".join(pieces)
+
+        if self.semantic_cache is not None:
+            self.semantic_cache.put(question, answer, documents)
+
+        return answer, documents
+
     def interactive_chat(self) -> None:
         """
         Start an interactive chat session.
@@ -257,13 +551,10 @@ class RAGPipeline:
                     print("Please enter a question.\n")
                     continue
                 
-                # Process query
-                answer, sources = self.query(user_input)
-                
-                # Display answer
-                print(f"\n{'='*60}")
-                print(f"ANSWER:\n{answer}")
-                
+                # Process query — tokens are printed as they stream in,
+                # so the answer starts appearing at time-to-first-token
+                answer, sources = self._stream_query(user_input)
+
                 # Display sources
                 if sources:
                     print(f"\n{'-'*60}")
@@ -282,5 +573,5 @@ class RAGPipeline:
                 logger.info("Interactive chat session interrupted")
                 break
             except Exception as e:
-                logger.error(f"Error during chat: {e}")
+                logger.error("Error during chat: %s", e)
                 print(f"\nError: {e}\n")
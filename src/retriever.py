@@ -1,10 +1,12 @@
 """Retriever module for document retrieval operations."""
 
+import logging
 from typing import List
 
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
 
+from config.settings import get_settings
 from src.utils.logger import setup_logger
 from src.vector_store import VectorStore
 
@@ -22,43 +24,62 @@ class DocumentRetriever:
     def __init__(
         self,
         vector_store: VectorStore,
-        search_type: str = "similarity",
-        top_k: int = 5
+        search_type: str = None,
+        top_k: int = None
     ):
         """
         Initialize the document retriever.
-        
+
+        Settings are resolved once here so the per-query paths never
+        touch configuration lookups.
+
         Args:
             vector_store: VectorStore instance to use for retrieval
             search_type: Type of search (similarity, mmr, etc.).
-                        Defaults to "similarity"
-            top_k: Number of documents to retrieve. Defaults to 5
+                        If None, uses default settings
+            top_k: Number of documents to retrieve. If None, uses
+                  default settings
         """
+        settings = get_settings()
         self.vector_store = vector_store
-        self.search_type = search_type
-        self.top_k = top_k
-        
+        self.search_type = search_type or settings.retrieval_search_type
+        self.top_k = top_k or settings.retrieval_top_k
+
+        # LangChain retriever wrappers memoized per k, so the hot query
+        # path skips rebuilding the wrapper on every call
+        self._retriever_by_k: dict = {}
+
         logger.info(
             f"DocumentRetriever initialized with search_type={self.search_type}, "
             f"top_k={self.top_k}"
         )
     
-    def get_retriever(self) -> BaseRetriever:
+    def get_retriever(self, k: int = None) -> BaseRetriever:
         """
         Get a LangChain retriever instance.
-        
+
+        Instances are built once per k and reused, so repeated queries
+        pay the wrapper construction cost only on the first call.
+
+        Args:
+            k: Number of documents to retrieve. If None, uses instance value
+
         Returns:
             BaseRetriever configured with current settings
         """
         if self.vector_store.vectorstore is None:
             raise RuntimeError("Vector store not initialized")
-        
-        retriever = self.vector_store.vectorstore.as_retriever(
-            search_type=self.search_type,
-            search_kwargs={"k": self.top_k}
-        )
-        
-        logger.debug("Created retriever instance")
+
+        k = k or self.top_k
+        retriever = self._retriever_by_k.get(k)
+        if retriever is None:
+            retriever = self.vector_store.vectorstore.as_retriever(
+                search_type=self.search_type,
+                search_kwargs={"k": k}
+            )
+            self._retriever_by_k[k] = retriever
+            logger.debug("Created retriever instance (k=%d)", k)
+
         return retriever
     
     def retrieve(self, query: str, k: int = None) -> List[Document]:
@@ -74,11 +95,38 @@ class DocumentRetriever:
         """
         k = k or self.top_k
         
-        logger.info(f"Retrieving documents for query (k={k})")
-        logger.debug(f"Query: {query[:100]}...")
-        
-        retriever = self.get_retriever()
+        logger.info("Retrieving documents for query (k=%d)", k)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Query: %s...", query[:100])
+
+        retriever = self.get_retriever(k)
         documents = retriever.invoke(query)
-        
-        logger.info(f"Retrieved {len(documents)} documents")
+
+        logger.info("Retrieved %d documents", len(documents))
+        return documents
+
+    async def aretrieve(self, query: str, k: int = None) -> List[Document]:
+        """
+        Async variant of retrieve().
+
+        Uses the LangChain retriever's async invocation so several
+        queries can be served concurrently.
+
+        Args:
+            query: Query string to search for
+            k: Number of documents to retrieve. If None, uses instance value
+
+        Returns:
+            List of relevant Document objects
+        """
+        k = k or self.top_k
+
+        logger.info("Retrieving documents for query (k=%d, async)", k)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Query: %s...", query[:100])
+
+        retriever = self.get_retriever(k)
+        documents = await retriever.ainvoke(query)
+
+        logger.info("Retrieved %d documents", len(documents))
         return documents
@@ -0,0 +1,147 @@
+"""Semantic cache for previously answered queries."""
+
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+
+from src.ports.embedding_provider import BaseEmbeddingProvider
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class SemanticQueryCache:
+    """
+    Caches (question, answer, sources) tuples keyed by question embedding.
+
+    A semantically similar re-ask (cosine similarity above the threshold)
+    returns the cached answer in microseconds instead of re-running
+    retrieval and LLM generation. Entries are evicted least-recently-used
+    once the cache is full, and optionally after a TTL.
+    """
+
+    def __init__(
+        self,
+        embedding_provider: BaseEmbeddingProvider,
+        threshold: float = 0.95,
+        max_size: int = 128,
+        ttl_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            embedding_provider: Provider used to embed incoming questions.
+                               Reuse the pipeline's provider so cached and
+                               live queries share one embedding space.
+            threshold: Minimum cosine similarity for a cache hit
+            max_size: Maximum number of entries before LRU eviction
+            ttl_seconds: Entry lifetime in seconds. If None, entries
+                        never expire
+        """
+        self.embedding_provider = embedding_provider
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+
+        # question -> (unit vector, answer, sources, insertion time);
+        # ordered so the first entry is always the least recently used
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+        logger.info(
+            f"SemanticQueryCache initialized "
+            f"(threshold={threshold}, max_size={max_size})"
+        )
+
+    def _embed(self, question: str) -> np.ndarray:
+        """Embed a question and normalize to unit length."""
+        vector = np.asarray(
+            self.embedding_provider.embed_query(question), dtype=np.float32
+        )
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def _evict_expired(self) -> None:
+        """Drop entries older than the TTL, if one is configured."""
+        if self.ttl_seconds is None:
+            return
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = [
+            question
+            for question, (_, _, _, stored_at) in self._entries.items()
+            if stored_at < cutoff
+        ]
+        for question in expired:
+            del self._entries[question]
+
+    def get(self, question: str) -> Optional[Tuple[str, List[Document]]]:
+        """
+        Look up a cached answer for a semantically similar question.
+
+        Args:
+            question: The incoming question
+
+        Returns:
+            Tuple of (answer, sources) on a hit, None on a miss
+        """
+        self._evict_expired()
+        if not self._entries:
+            return None
+
+        query_vector = self._embed(question)
+
+        best_question = None
+        best_score = -1.0
+        for cached_question, (vector, _, _, _) in self._entries.items():
+            score = float(np.dot(query_vector, vector))
+            if score > best_score:
+                best_score = score
+                best_question = cached_question
+
+        if best_score >= self.threshold:
+            logger.info(
+                f"Semantic cache hit (similarity={best_score:.3f})"
+            )
+            self._entries.move_to_end(best_question)
+            _, answer, sources, _ = self._entries[best_question]
+            return answer, sources
+
+        logger.debug("Semantic cache miss (best similarity=%.3f)", best_score)
+        return None
+
+    def put(
+        self,
+        question: str,
+        answer: str,
+        sources: List[Document],
+    ) -> None:
+        """
+        Store an answered question in the cache.
+
+        Args:
+            question: The question that was asked
+            answer: The generated answer
+            sources: Source documents used for the answer
+        """
+        self._evict_expired()
+        while len(self._entries) >= self.max_size:
+            self._entries.popitem(last=False)
+
+        self._entries[question] = (
+            self._embed(question),
+            answer,
+            sources,
+            time.monotonic(),
+        )
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,16 +1,51 @@
 """Text processing module for document chunking and splitting."""
 
-from typing import List
+import hashlib
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
+import numpy as np
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from config.settings import get_settings
+from src.utils.fastmath import mean_length
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _build_splitter(
+    chunk_size: int,
+    chunk_overlap: int,
+    separators: Tuple[str, ...],
+) -> RecursiveCharacterTextSplitter:
+    """
+    Build (and memoize) a RecursiveCharacterTextSplitter.
+
+    Splitter construction compiles the separator regexes on every call;
+    processors are routinely created with identical parameters (pipeline
+    per ingest, one per test), so the compiled splitter is shared across
+    instances. Safe because split calls never mutate splitter state.
+
+    Args:
+        chunk_size: Size of each text chunk
+        chunk_overlap: Overlap between chunks
+        separators: Separator strings, as a tuple so the key is hashable
+
+    Returns:
+        A configured RecursiveCharacterTextSplitter instance
+    """
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        separators=list(separators),
+        add_start_index=True,
+    )
+
+
 class TextProcessor:
     """
     Handles text processing operations including document chunking.
@@ -44,40 +79,219 @@ class TextProcessor:
             "",
         ]
         
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=self.chunk_size,
-            chunk_overlap=self.chunk_overlap,
-            separators=self.separators,
-            add_start_index=True,
+        self.text_splitter = _build_splitter(
+            self.chunk_size,
+            self.chunk_overlap,
+            tuple(self.separators),
         )
-        
+
+        # For the default separators, chunk boundaries are computed with
+        # a single compiled-regex scan plus searchsorted over the match
+        # offsets — the per-character recursion of the LangChain splitter
+        # dominates CPU on large corpora. Custom separators keep the
+        # LangChain splitter for exact compatibility.
+        self._use_fast_path = separators is None
+        self._sep_re = re.compile(
+            "|".join(re.escape(s) for s in self.separators if s)
+        )
+
+        # tiktoken encoder resolved lazily on first split; False marks
+        # that resolution failed so it is only attempted once
+        self._token_encoder = None
+
         logger.info(
             f"TextProcessor initialized with chunk_size={self.chunk_size}, "
             f"chunk_overlap={self.chunk_overlap}"
         )
     
+    def _fast_split_text(self, text: str) -> List[Tuple[int, str]]:
+        """
+        Compute chunk boundaries for a text with the vectorized fast path.
+
+        One regex scan collects every separator offset; greedy packing
+        then picks the furthest boundary within chunk_size per chunk and
+        steps back chunk_overlap characters (snapped forward to the next
+        boundary) for the following one.
+
+        Args:
+            text: Raw document text
+
+        Returns:
+            List of (start_index, chunk_text) tuples covering the text
+        """
+        n = len(text)
+        if n <= self.chunk_size:
+            return [(0, text)] if text.strip() else []
+
+        boundaries = np.fromiter(
+            (match.end() for match in self._sep_re.finditer(text)),
+            dtype=np.int64,
+        )
+
+        chunks = []
+        start = 0
+        while start < n:
+            limit = start + self.chunk_size
+            if limit >= n:
+                chunks.append((start, text[start:]))
+                break
+
+            # Furthest separator boundary within the window; hard cut at
+            # the limit when a single token exceeds chunk_size
+            idx = int(np.searchsorted(boundaries, limit, side="right")) - 1
+            if idx >= 0 and boundaries[idx] > start:
+                cut = int(boundaries[idx])
+            else:
+                cut = limit
+            chunks.append((start, text[start:cut]))
+
+            next_start = cut - self.chunk_overlap
+            if next_start <= start:
+                next_start = cut
+            else:
+                # Snap the overlapped start forward to a boundary so the
+                # next chunk begins on a token edge when possible
+                jdx = int(np.searchsorted(boundaries, next_start, side="left"))
+                if jdx < len(boundaries) and boundaries[jdx] < cut:
+                    next_start = int(boundaries[jdx])
+            start = next_start
+
+        # Strip whitespace the same way the LangChain splitter does,
+        # keeping start_index pointing at the first retained character
+        cleaned = []
+        for start_index, chunk_text in chunks:
+            lstripped = chunk_text.lstrip()
+            stripped = lstripped.rstrip()
+            if not stripped:
+                continue
+            cleaned.append(
+                (start_index + (len(chunk_text) - len(lstripped)), stripped)
+            )
+        return cleaned
+
     def split_documents(self, documents: List[Document]) -> List[Document]:
         """
         Split documents into smaller chunks.
-        
+
         Args:
             documents: List of Document objects to split
-        
+
         Returns:
             List of chunked Document objects
         """
         logger.info(f"Splitting {len(documents)} documents into chunks")
-        
-        chunks = self.text_splitter.split_documents(documents)
-        
-        avg_chunk_size = (
-            sum(len(chunk.page_content) for chunk in chunks) // len(chunks)
-            if chunks else 0
+
+        if self._use_fast_path:
+            chunks = []
+            for document in documents:
+                for start_index, chunk_text in self._fast_split_text(
+                    document.page_content
+                ):
+                    metadata = dict(document.metadata)
+                    metadata["start_index"] = start_index
+                    chunks.append(
+                        Document(page_content=chunk_text, metadata=metadata)
+                    )
+        else:
+            chunks = self.text_splitter.split_documents(documents)
+
+        if chunks:
+            self._annotate_token_counts(chunks)
+
+        avg_chunk_size = mean_length(
+            np.fromiter(
+                (len(chunk.page_content) for chunk in chunks),
+                dtype=np.int64,
+                count=len(chunks),
+            )
         )
-        
+
         logger.info(
             f"Created {len(chunks)} chunks with average size of "
             f"{avg_chunk_size} characters"
         )
-        
+
         return chunks
+
+    def _annotate_token_counts(self, chunks: List[Document]) -> None:
+        """
+        Store each chunk's token count in its metadata as ``n_tokens``.
+
+        Counts come from one encode_batch pass through tiktoken's Rust
+        tokenizer, letting the vector store pack embedding requests by
+        token budget instead of a fixed document count. Skipped silently
+        when tiktoken is unavailable.
+
+        Args:
+            chunks: Chunked Document objects, annotated in place
+        """
+        if self._token_encoder is None:
+            try:
+                import tiktoken
+
+                try:
+                    self._token_encoder = tiktoken.encoding_for_model(
+                        get_settings().openai_embedding_model
+                    )
+                except KeyError:
+                    self._token_encoder = tiktoken.get_encoding("cl100k_base")
+            except Exception as e:
+                # tiktoken missing, or its vocabulary file could not be
+                # fetched (offline environments) — token packing is an
+                # optimization, not a requirement
+                logger.debug(f"Token counting unavailable: {e}")
+                self._token_encoder = False
+
+        if self._token_encoder is False:
+            return
+
+        encoded = self._token_encoder.encode_batch(
+            [chunk.page_content for chunk in chunks]
+        )
+        for chunk, tokens in zip(chunks, encoded):
+            chunk.metadata["n_tokens"] = len(tokens)
+
+    @staticmethod
+    def deduplicate_chunks(
+        chunks: List[Document],
+        seen: Optional[set] = None,
+    ) -> List[Document]:
+        """
+        Drop chunks whose text is identical to an earlier chunk.
+
+        Repeated boilerplate (PDF headers/footers, legal disclaimers)
+        otherwise gets embedded once per occurrence, paying API cost for
+        vectors that are exact duplicates. Chunks are compared by a
+        blake2b hash of their page_content; the first occurrence wins.
+
+        Args:
+            chunks: List of chunked Document objects
+            seen: Optional set of content hashes from earlier calls,
+                 updated in place. Pass the same set across batches to
+                 deduplicate a streamed ingestion globally
+
+        Returns:
+            List of Document objects with exact-duplicate texts removed,
+            in original order
+        """
+        if seen is None:
+            seen = set()
+        unique_chunks = []
+
+        for chunk in chunks:
+            digest = hashlib.blake2b(
+                chunk.page_content.encode("utf-8"), digest_size=16
+            ).digest()
+            if digest in seen:
+                continue
+            seen.add(digest)
+            unique_chunks.append(chunk)
+
+        dropped = len(chunks) - len(unique_chunks)
+        if dropped:
+            logger.info(
+                f"Deduplicated chunks: dropped {dropped} exact duplicate(s), "
+                f"{len(unique_chunks)} remaining"
+            )
+
+        return unique_chunks
@@ -0,0 +1,36 @@
+"""Vectorized numeric helpers for hot-path computations."""
+
+import numpy as np
+
+
+def mean_length(lengths: np.ndarray) -> int:
+    """
+    Compute the integer mean of an array of lengths.
+
+    Args:
+        lengths: 1D integer array of lengths
+
+    Returns:
+        Floor of the mean, or 0 for an empty array
+    """
+    if lengths.size == 0:
+        return 0
+    return int(lengths.sum() // lengths.size)
+
+
+def l2_normalize_2d(vectors: np.ndarray) -> np.ndarray:
+    """
+    Normalize each row of a 2D array to unit L2 norm.
+
+    Zero rows are left unchanged rather than dividing by zero, matching
+    how the int8 quantization adapter guards all-zero vectors.
+
+    Args:
+        vectors: 2D float array, one embedding per row
+
+    Returns:
+        Array of the same shape with unit-norm rows
+    """
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.maximum(norms, np.finfo(vectors.dtype).tiny, out=norms)
+    return vectors / norms
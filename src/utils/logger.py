@@ -1,12 +1,67 @@
 """Centralized logging configuration for the RAG system."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
 from config.settings import get_settings
 
+# Shared queue and background listener for file logging. Handing records
+# to the queue is O(1); the listener thread performs the blocking disk
+# writes, so hot-path log calls never wait on the filesystem.
+_log_queue: Optional["queue.Queue"] = None
+_queue_listener: Optional[QueueListener] = None
+
+# One shared formatter for every handler — Formatter parses its format
+# string at construction and is stateless afterwards, so building it
+# per logger just repeats that work
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+
+def _get_file_queue_handler(log_level: str) -> QueueHandler:
+    """
+    Return a queue handler feeding the shared background file writer.
+
+    The underlying FileHandler and its listener thread are created once
+    per process, on first use, and flushed at interpreter exit.
+
+    Args:
+        log_level: Logging level for the handler
+
+    Returns:
+        QueueHandler connected to the shared log queue
+    """
+    global _log_queue, _queue_listener
+
+    if _log_queue is None:
+        settings = get_settings()
+        settings.logs_dir.mkdir(parents=True, exist_ok=True)
+
+        file_handler = logging.FileHandler(
+            settings.logs_dir / "rag_system.log",
+            encoding="utf-8"
+        )
+        file_handler.setLevel(getattr(logging, log_level.upper()))
+        file_handler.setFormatter(_FORMATTER)
+
+        _log_queue = queue.Queue(-1)
+        _queue_listener = QueueListener(
+            _log_queue, file_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
+        atexit.register(_queue_listener.stop)
+
+    handler = QueueHandler(_log_queue)
+    handler.setLevel(getattr(logging, log_level.upper()))
+    return handler
+
 
 def setup_logger(
     name: str,
@@ -15,52 +70,44 @@ def setup_logger(
 ) -> logging.Logger:
     """
     Configure and return a logger instance.
-    
+
     Args:
         name: Name of the logger (typically __name__ of the calling module)
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
                   If None, uses default settings
         log_to_file: Whether to log to file. If None, uses default settings
-    
+
     Returns:
         Configured logger instance
     """
+    logger = logging.getLogger(name)
+
+    # Already configured — skip the settings lookup and handler work
+    # entirely; only an explicit log_level override is applied
+    if logger.handlers:
+        if log_level is not None:
+            logger.setLevel(getattr(logging, log_level.upper()))
+        return logger
+
     # Get default settings (without requiring API key)
     settings = get_settings()
-    
+
     log_level = log_level or settings.log_level
     log_to_file = log_to_file if log_to_file is not None else settings.log_to_file
-    
-    logger = logging.getLogger(name)
+
     logger.setLevel(getattr(logging, log_level.upper()))
-    
-    # Avoid duplicate handlers
-    if logger.handlers:
-        return logger
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, log_level.upper()))
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
     logger.addHandler(console_handler)
-    
-    # File handler
+
+    # File logging goes through the shared background queue so log calls
+    # on hot paths never block on disk I/O
     if log_to_file:
-        settings.logs_dir.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(
-            settings.logs_dir / "rag_system.log",
-            encoding="utf-8"
-        )
-        file_handler.setLevel(getattr(logging, log_level.upper()))
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    
+        logger.addHandler(_get_file_queue_handler(log_level))
+
     return logger
 
 
@@ -1,16 +1,77 @@
 """Vector store module for embeddings and similarity search."""
 
+import asyncio
+import hashlib
 from pathlib import Path
 from typing import List, Optional
 
+from chromadb.config import Settings as ChromaSettings
 from langchain_community.vectorstores import Chroma
 from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore as LangChainVectorStore
 
+from config.settings import get_settings
 from src.ports.embedding_provider import BaseEmbeddingProvider
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Supported vector store backends
+_BACKENDS = frozenset({"chroma", "faiss"})
+
+# Token budget per embedding request, just under the OpenAI per-request
+# ceiling; used when chunks carry n_tokens metadata from the splitter
+_EMBED_TOKEN_BUDGET = 8000
+
+# Hard cap on inputs per embedding request (OpenAI accepts up to 2048)
+_EMBED_INPUT_CAP = 2048
+
+# Telemetry posts events on every collection write; disabling it keeps
+# the ingest write path free of that per-operation overhead
+_CHROMA_CLIENT_SETTINGS = ChromaSettings(anonymized_telemetry=False)
+
+
+def _content_ids(documents: List[Document]) -> List[str]:
+    """
+    Derive a deterministic ID for each chunk from its text.
+
+    Content-hash IDs make ingestion idempotent: re-adding a chunk whose
+    text is already stored upserts in place instead of duplicating it.
+    BLAKE2b is faster than SHA-256 and 16 digest bytes are ample for
+    collision-free chunk identity.
+
+    Args:
+        documents: Chunks to derive IDs for
+
+    Returns:
+        One hex digest per document, in order
+    """
+    return [
+        hashlib.blake2b(
+            doc.page_content.encode("utf-8"), digest_size=16
+        ).hexdigest()
+        for doc in documents
+    ]
+
+
+def _faiss_class():
+    """
+    Import and return the LangChain FAISS vector store class.
+
+    Raises:
+        ImportError: If the optional faiss-cpu package is not installed
+    """
+    try:
+        import faiss  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "The 'faiss' backend requires the faiss-cpu package. "
+            "Install it with: pip install faiss-cpu"
+        ) from e
+
+    from langchain_community.vectorstores import FAISS
+    return FAISS
+
 
 class VectorStore:
     """
@@ -24,20 +85,40 @@ class VectorStore:
         self,
         embedding_provider: BaseEmbeddingProvider,
         persist_directory: Optional[Path] = None,
+        embedding_batch_size: Optional[int] = None,
+        backend: Optional[str] = None,
     ):
         """
         Initialize the vector store.
 
         Args:
-            embedding_provider: Any object that implements BaseEmbeddingProvider.
-                                The vector store does not know (or care) whether
-                                it is OpenAI, Ollama, HuggingFace, etc.
-            persist_directory:  Directory to persist the Chroma database.
-                                If None, must be set before any operation.
+            embedding_provider:   Any object that implements BaseEmbeddingProvider.
+                                  The vector store does not know (or care) whether
+                                  it is OpenAI, Ollama, HuggingFace, etc.
+            persist_directory:    Directory to persist the database.
+                                  If None, must be set before any operation.
+            embedding_batch_size: Documents embedded per bulk embedding call.
+                                  If None, uses default settings.
+            backend:              Vector store backend ('chroma' or 'faiss').
+                                  If None, uses default settings.
+
+        Raises:
+            ValueError: If the backend is not supported
         """
         self.embedding_provider = embedding_provider
         self.persist_directory = persist_directory
-        self.vectorstore: Optional[Chroma] = None
+        self.embedding_batch_size = (
+            embedding_batch_size or get_settings().embedding_batch_size
+        )
+        self.backend = backend or get_settings().vector_backend
+        # Resolved once so the per-query search path skips settings lookups
+        self._default_k = get_settings().retrieval_top_k
+        if self.backend not in _BACKENDS:
+            raise ValueError(
+                f"Unsupported vector backend: {self.backend}. "
+                f"Supported backends: {', '.join(sorted(_BACKENDS))}"
+            )
+        self.vectorstore: Optional[LangChainVectorStore] = None
 
         if persist_directory is None:
             logger.warning(
@@ -47,56 +128,277 @@ class VectorStore:
 
         logger.info("VectorStore initialized")
     
-    def create_from_documents(self, documents: List[Document]) -> Chroma:
+    def create_from_documents(self, documents: List[Document]) -> LangChainVectorStore:
         """
         Create a new vector store from documents.
-        
+
+        Documents are embedded in batches of ``embedding_batch_size`` so each
+        batch becomes a single bulk embedding request, amortizing HTTP
+        round-trip latency instead of paying it per chunk.
+
         Args:
             documents: List of Document objects to embed and store
-        
+
         Returns:
-            Chroma vector store instance
+            Backend vector store instance
         """
-        logger.info(f"Creating vector store from {len(documents)} documents")
-        
+        logger.info("Creating vector store from %d documents", len(documents))
+
         self.persist_directory.parent.mkdir(parents=True, exist_ok=True)
-        
-        self.vectorstore = Chroma.from_documents(
+
+        # First batch creates the store; remaining batches are appended,
+        # each triggering one embed_documents() call.
+        batches = list(self._iter_batches(documents)) or [documents]
+        self.vectorstore = self._create_store(batches[0])
+
+        for batch in batches[1:]:
+            logger.debug("Embedding batch of %d document(s)", len(batch))
+            self._add_batch(batch)
+
+        self._persist()
+        logger.info("Vector store created and persisted to %s", self.persist_directory)
+        return self.vectorstore
+
+    def _iter_batches(self, documents: List[Document]):
+        """
+        Slice documents into embedding batches.
+
+        When every document carries ``n_tokens`` metadata (set during
+        chunking), batches are packed greedily up to the per-request
+        token budget, maximizing throughput per API call. Otherwise the
+        fixed ``embedding_batch_size`` slicing is used.
+
+        Args:
+            documents: Documents to batch
+
+        Yields:
+            Lists of documents, one per embedding request
+        """
+        if documents and all("n_tokens" in doc.metadata for doc in documents):
+            batch: List[Document] = []
+            batch_tokens = 0
+            for doc in documents:
+                n_tokens = doc.metadata["n_tokens"]
+                if batch and (
+                    batch_tokens + n_tokens > _EMBED_TOKEN_BUDGET
+                    or len(batch) >= _EMBED_INPUT_CAP
+                ):
+                    yield batch
+                    batch = []
+                    batch_tokens = 0
+                batch.append(doc)
+                batch_tokens += n_tokens
+            if batch:
+                yield batch
+        else:
+            batch_size = self.embedding_batch_size
+            for start in range(0, len(documents), batch_size):
+                yield documents[start:start + batch_size]
+
+    def _create_store(self, documents: List[Document]):
+        """
+        Build a new backend store from an initial batch of documents.
+
+        Args:
+            documents: First batch of documents to embed and store
+
+        Returns:
+            The backend vector store instance
+        """
+        if self.backend == "faiss":
+            return _faiss_class().from_documents(
+                documents=documents,
+                embedding=self.embedding_provider,
+            )
+        return Chroma.from_documents(
             documents=documents,
             embedding=self.embedding_provider,
-            persist_directory=str(self.persist_directory)
+            persist_directory=str(self.persist_directory),
+            client_settings=_CHROMA_CLIENT_SETTINGS,
+            ids=_content_ids(documents),
         )
-        
-        logger.info(f"Vector store created and persisted to {self.persist_directory}")
+
+    def _add_batch(self, batch: List[Document]) -> None:
+        """
+        Append one embedded batch with content IDs where supported.
+
+        Args:
+            batch: Documents for a single embedding request
+        """
+        if self.backend == "chroma":
+            self.vectorstore.add_documents(batch, ids=_content_ids(batch))
+        else:
+            self.vectorstore.add_documents(batch)
+
+    def _filter_new(self, documents: List[Document]) -> List[Document]:
+        """
+        Drop chunks whose content is already present in the store.
+
+        Embedding is the wall-clock dominant ingestion cost, so chunks
+        whose content hash matches a stored ID are skipped before any
+        embedding call. Only Chroma can be asked cheaply which IDs
+        exist; other backends embed everything.
+
+        Args:
+            documents: Candidate chunks to append
+
+        Returns:
+            Documents whose content is not yet stored
+        """
+        if self.backend != "chroma" or self.vectorstore is None:
+            return documents
+
+        ids = _content_ids(documents)
+        try:
+            existing = set(
+                self.vectorstore.get(ids=list(set(ids)), include=[])["ids"]
+            )
+        except Exception as e:
+            logger.debug("Could not check existing chunk IDs: %s", e)
+            return documents
+
+        fresh = [
+            doc
+            for doc, chunk_id in zip(documents, ids)
+            if chunk_id not in existing
+        ]
+        if len(fresh) < len(documents):
+            logger.info(
+                "Skipping %d already-embedded chunk(s)",
+                len(documents) - len(fresh),
+            )
+        return fresh
+
+    def _persist(self) -> None:
+        """
+        Flush the store to disk for backends that persist explicitly.
+
+        Chroma writes through to its persist directory on every add;
+        FAISS keeps the index in memory until saved.
+        """
+        if self.backend == "faiss" and self.vectorstore is not None:
+            self.vectorstore.save_local(str(self.persist_directory))
+
+    async def acreate_from_documents(
+        self,
+        documents: List[Document],
+        concurrency: Optional[int] = None,
+    ) -> LangChainVectorStore:
+        """
+        Async variant of create_from_documents().
+
+        Embedding batches are dispatched concurrently via asyncio.gather,
+        bounded by a semaphore so the number of in-flight requests stays
+        within provider rate limits. For network-bound ingestion this turns
+        N serial round-trips into roughly N / concurrency wall-clock trips.
+
+        Args:
+            documents:   List of Document objects to embed and store
+            concurrency: Maximum batches in flight at once.
+                         If None, uses ``settings.embedding_concurrency``.
+
+        Returns:
+            Backend vector store instance
+        """
+        concurrency = concurrency or get_settings().embedding_concurrency
+
+        logger.info(
+            f"Creating vector store from {len(documents)} documents "
+            f"(async, concurrency={concurrency})"
+        )
+
+        self.persist_directory.parent.mkdir(parents=True, exist_ok=True)
+
+        # First batch creates the store synchronously; remaining batches
+        # are embedded and appended concurrently.
+        batches = list(self._iter_batches(documents)) or [documents]
+        self.vectorstore = await asyncio.to_thread(
+            self._create_store, batches[0]
+        )
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _add_batch_async(batch: List[Document]) -> None:
+            async with semaphore:
+                await asyncio.to_thread(self._add_batch, batch)
+
+        if batches[1:]:
+            await asyncio.gather(
+                *(_add_batch_async(batch) for batch in batches[1:])
+            )
+
+        self._persist()
+        logger.info("Vector store created and persisted to %s", self.persist_directory)
         return self.vectorstore
-    
-    def load_existing(self) -> Chroma:
+
+    def add_documents(self, documents: List[Document]) -> None:
+        """
+        Append documents to an already-initialized vector store.
+
+        Chunks whose content is already stored are skipped before any
+        embedding happens, making repeated ingestion of overlapping
+        corpora idempotent. The rest are embedded in batches of
+        ``embedding_batch_size``, same as during store creation.
+
+        Args:
+            documents: List of Document objects to embed and append
+
+        Raises:
+            RuntimeError: If vector store is not initialized
+        """
+        if self.vectorstore is None:
+            raise RuntimeError(
+                "Vector store not initialized. Call load_existing() or "
+                "create_from_documents() first"
+            )
+
+        documents = self._filter_new(documents)
+        if not documents:
+            logger.info("All documents already present in vector store")
+            return
+
+        logger.info("Adding %d document(s) to vector store", len(documents))
+
+        for batch in self._iter_batches(documents):
+            self._add_batch(batch)
+
+        self._persist()
+
+    def load_existing(self) -> LangChainVectorStore:
         """
         Load an existing vector store from disk.
         
         Returns:
-            Chroma vector store instance
+            Backend vector store instance
         
         Raises:
             FileNotFoundError: If the vector store does not exist
         """
         if not self.persist_directory.exists():
-            logger.error(f"Vector store not found at {self.persist_directory}")
+            logger.error("Vector store not found at %s", self.persist_directory)
             raise FileNotFoundError(
                 f"Vector store not found at {self.persist_directory}"
             )
         
-        logger.info(f"Loading existing vector store from {self.persist_directory}")
-        
-        self.vectorstore = Chroma(
-            persist_directory=str(self.persist_directory),
-            embedding_function=self.embedding_provider
-        )
-        
+        logger.info("Loading existing vector store from %s", self.persist_directory)
+
+        if self.backend == "faiss":
+            self.vectorstore = _faiss_class().load_local(
+                str(self.persist_directory),
+                self.embedding_provider,
+                allow_dangerous_deserialization=True,
+            )
+        else:
+            self.vectorstore = Chroma(
+                persist_directory=str(self.persist_directory),
+                embedding_function=self.embedding_provider,
+                client_settings=_CHROMA_CLIENT_SETTINGS,
+            )
+
         logger.info("Vector store loaded successfully")
         return self.vectorstore
     
-    def get_or_create(self, documents: Optional[List[Document]] = None) -> Chroma:
+    def get_or_create(self, documents: Optional[List[Document]] = None) -> LangChainVectorStore:
         """
         Get existing vector store or create a new one if it doesn't exist.
         
@@ -105,7 +407,7 @@ class VectorStore:
                       Required if store doesn't exist
         
         Returns:
-            Chroma vector store instance
+            Backend vector store instance
         
         Raises:
             ValueError: If store doesn't exist and no documents provided
@@ -122,14 +424,14 @@ class VectorStore:
     def similarity_search(
         self,
         query: str,
-        k: int = 5,
+        k: int = None,
     ) -> List[Document]:
         """
         Perform similarity search on the vector store.
-        
+
         Args:
             query: Query string to search for
-            k: Number of results to return. Defaults to 5.
+            k: Number of results to return. If None, uses default settings.
 
         Returns:
             List of most similar Document objects
@@ -140,9 +442,11 @@ class VectorStore:
         if self.vectorstore is None:
             raise RuntimeError("Vector store not initialized. Call load_existing() or create_from_documents() first")
 
-        logger.debug(f"Performing similarity search for query with k={k}")
+        k = k if k is not None else self._default_k
+
+        logger.debug("Performing similarity search for query with k=%d", k)
         
         results = self.vectorstore.similarity_search(query, k=k)
         
-        logger.debug(f"Found {len(results)} similar documents")
+        logger.debug("Found %d similar documents", len(results))
         return results
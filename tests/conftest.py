@@ -13,6 +13,80 @@ from src.ports.embedding_provider import BaseEmbeddingProvider
 from src.ports.llm_provider import BaseLLMProvider
 
 
+def pytest_configure(config):
+    """
+    Pre-warm the heavy import chains once per process.
+
+    Under pytest-xdist each worker re-imports test modules lazily; the
+    langchain/pydantic chains behind these modules take hundreds of
+    milliseconds to resolve, so importing them before collection keeps
+    that cost out of the first test's runtime on every worker.
+    """
+    import langchain_core.documents  # noqa: F401
+
+    import src.rag_pipeline  # noqa: F401
+    import src.retriever  # noqa: F401
+    import src.vector_store  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_chat_client_cache() -> Generator[None, None, None]:
+    """
+    Reset the shared ChatOpenAI client cache between tests.
+
+    The adapter memoizes clients per (model, temperature, api_key), which
+    would otherwise leak a mock client created under one test's patch
+    into later tests using the same configuration.
+    """
+    from src.adapters.llm.openai_llm import _shared_chat_client
+
+    _shared_chat_client.cache_clear()
+    yield
+    _shared_chat_client.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_document_loader_cache() -> Generator[None, None, None]:
+    """
+    Reset the shared DocumentLoader singleton between tests.
+
+    get_document_loader memoizes one instance per process, which would
+    otherwise carry state across tests that expect a fresh loader.
+    """
+    from src.document_loader import get_document_loader
+
+    get_document_loader.cache_clear()
+    yield
+    get_document_loader.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def loader():
+    """
+    Provide one DocumentLoader shared across the whole test session.
+
+    DocumentLoader is stateless, so constructing it once amortizes the
+    init cost over every test that needs an instance.
+    """
+    from src.document_loader import DocumentLoader
+
+    return DocumentLoader()
+
+
+@pytest.fixture(scope="session")
+def default_settings():
+    """
+    Provide one default Settings instance for the whole session.
+
+    Pydantic validates every field on construction; tests that only
+    read attributes of the defaults share a single instance instead of
+    re-validating per test.
+    """
+    from config.settings import Settings
+
+    return Settings()
+
+
 @pytest.fixture
 def mock_api_key() -> str:
     """Provide a mock API key for testing (provider-agnostic)."""
@@ -45,32 +119,37 @@ def mock_embedding_provider() -> BaseEmbeddingProvider:
 
 
 @pytest.fixture
-def set_test_api_key(mock_api_key: str) -> Generator[str, None, None]:
+def set_test_api_key(mock_api_key: str, monkeypatch) -> str:
     """
     Set mock API key in environment for test duration.
 
     Kept for backwards compatibility with tests that still rely on
     environment-level key injection (e.g. third-party libs that read
-    OPENAI_API_KEY internally).
+    OPENAI_API_KEY internally). Uses monkeypatch so the mutation is
+    rolled back even if the test errors, keeping workers free of
+    hidden ordering dependencies under parallel runs.
     """
-    original_key = os.environ.get("OPENAI_API_KEY")
-    os.environ["OPENAI_API_KEY"] = mock_api_key
-    yield mock_api_key
-    if original_key:
-        os.environ["OPENAI_API_KEY"] = original_key
-    else:
-        os.environ.pop("OPENAI_API_KEY", None)
+    monkeypatch.setenv("OPENAI_API_KEY", mock_api_key)
+    return mock_api_key
+
+
+# tmpfs keeps the many tiny files tests create out of real disk I/O;
+# fall back to the default temp location where /dev/shm doesn't exist
+_TMPFS_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
 
 
 @pytest.fixture
 def temp_directory() -> Generator[Path, None, None]:
     """
     Create a temporary directory for test files.
-    
+
+    Backed by tmpfs (/dev/shm) on Linux so file-heavy tests never wait
+    on disk.
+
     Yields:
         Path to temporary directory
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with tempfile.TemporaryDirectory(dir=_TMPFS_DIR) as temp_dir:
         yield Path(temp_dir)
 
 
@@ -108,10 +187,14 @@ def sample_pdf_file(temp_directory: Path) -> Path:
     return temp_directory / "sample.pdf"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_documents() -> list[Document]:
     """
     Create sample Document objects for testing.
+
+    Session-scoped: consumers only read these documents (splitters copy
+    into new Documents; stores are mocked), so one allocation serves
+    the whole run.
     
     Returns:
         List of sample Document objects
@@ -132,7 +215,7 @@ def sample_documents() -> list[Document]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def long_document() -> Document:
     """
     Create a long Document object for chunking tests.
@@ -147,7 +230,7 @@ def long_document() -> Document:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_query() -> str:
     """
     Provide a sample query string for testing.
@@ -170,3 +253,21 @@ def temp_vector_store_path(temp_directory: Path) -> Path:
         Path for vector store database
     """
     return temp_directory / "test_chroma_db"
+
+
+@pytest.fixture
+def existing_vector_store_path(temp_vector_store_path: Path) -> Path:
+    """
+    Provide a vector store path whose directory already exists.
+
+    Tests that load or reuse a store need the directory pre-created;
+    doing the mkdir here keeps that setup out of every test body.
+
+    Args:
+        temp_vector_store_path: Vector store path fixture
+
+    Returns:
+        Path to an existing (empty) vector store directory
+    """
+    temp_vector_store_path.mkdir(parents=True, exist_ok=True)
+    return temp_vector_store_path
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.adapters.embeddings.openai_embeddings import OpenAIEmbeddingAdapter
+from src.adapters.embeddings.quantized_embeddings import Int8QuantizedEmbeddingAdapter
 from src.adapters.llm.openai_llm import OpenAILLMAdapter
 from src.ports.embedding_provider import BaseEmbeddingProvider
 from src.ports.llm_provider import BaseLLMProvider
@@ -87,6 +88,20 @@ class TestOpenAILLMAdapter:
         assert system.content == "sys prompt"
         assert human.content == "user msg"
 
+    def test_identical_configs_share_client(self):
+        """Adapters with the same config must share one underlying client."""
+        with patch("src.adapters.llm.openai_llm.ChatOpenAI"):
+            first = OpenAILLMAdapter("gpt-3.5-turbo", 0.3, "key")
+            second = OpenAILLMAdapter("gpt-3.5-turbo", 0.3, "key")
+        assert first._llm is second._llm
+
+    def test_different_configs_get_distinct_clients(self):
+        """Adapters with different configs must not share a client."""
+        with patch("src.adapters.llm.openai_llm.ChatOpenAI", side_effect=lambda **kw: MagicMock()):
+            first = OpenAILLMAdapter("gpt-3.5-turbo", 0.3, "key")
+            second = OpenAILLMAdapter("gpt-4", 0.3, "key")
+        assert first._llm is not second._llm
+
     def test_generate_propagates_exception(self):
         """generate() must re-raise any exception from the underlying LLM."""
         adapter, mock_llm = self._make_adapter()
@@ -180,3 +195,54 @@ class TestOpenAIEmbeddingAdapter:
         result = adapter.embed_query("test")
         assert isinstance(result, list)
         assert all(isinstance(v, float) for v in result)
+
+
+# ---------------------------------------------------------------------------
+# Int8QuantizedEmbeddingAdapter
+# ---------------------------------------------------------------------------
+
+class TestInt8QuantizedEmbeddingAdapter:
+    """Tests for Int8QuantizedEmbeddingAdapter."""
+
+    def _make_adapter(self) -> tuple[Int8QuantizedEmbeddingAdapter, MagicMock]:
+        """Return (adapter, mock_inner) wrapping a mocked provider."""
+        inner = MagicMock(spec=BaseEmbeddingProvider)
+        return Int8QuantizedEmbeddingAdapter(inner), inner
+
+    # ── contract ────────────────────────────────────────────────────────────
+
+    def test_is_base_embedding_provider_subclass(self):
+        """Wrapper must satisfy the BaseEmbeddingProvider port."""
+        assert issubclass(Int8QuantizedEmbeddingAdapter, BaseEmbeddingProvider)
+
+    # ── quantization ────────────────────────────────────────────────────────
+
+    def test_embed_documents_preserves_shape(self):
+        """Quantized output must keep one vector per input text."""
+        adapter, inner = self._make_adapter()
+        inner.embed_documents.return_value = [[0.1, -0.5, 0.9], [1.0, 0.0, -1.0]]
+        result = adapter.embed_documents(["a", "b"])
+        assert len(result) == 2
+        assert all(len(vector) == 3 for vector in result)
+
+    def test_quantization_roundtrip_is_close(self):
+        """Dequantized values must stay within one quantization step."""
+        adapter, inner = self._make_adapter()
+        original = [0.1, -0.5, 0.9, 0.0]
+        inner.embed_query.return_value = original
+        result = adapter.embed_query("query")
+        step = max(abs(v) for v in original) / 127.0
+        assert all(abs(a - b) <= step for a, b in zip(result, original))
+
+    def test_zero_vector_passes_through(self):
+        """An all-zero vector must not divide by zero."""
+        adapter, inner = self._make_adapter()
+        inner.embed_query.return_value = [0.0, 0.0, 0.0]
+        assert adapter.embed_query("query") == [0.0, 0.0, 0.0]
+
+    def test_delegates_to_inner_provider(self):
+        """embed_documents must delegate to the wrapped provider."""
+        adapter, inner = self._make_adapter()
+        inner.embed_documents.return_value = [[0.5]]
+        adapter.embed_documents(["text"])
+        inner.embed_documents.assert_called_once_with(["text"])
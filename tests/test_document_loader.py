@@ -1,12 +1,15 @@
 """Unit tests for document_loader module."""
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
-
 import pytest
 from langchain_core.documents import Document
 
-from src.document_loader import SUPPORTED_LOADERS, DocumentLoader
+from src.document_loader import (
+    SUPPORTED_LOADERS,
+    DocumentLoader,
+    _resolve_loader,
+    get_document_loader,
+)
 
 
 class TestDocumentLoaderInitialization:
@@ -17,6 +20,12 @@ class TestDocumentLoaderInitialization:
         loader = DocumentLoader()
         assert loader is not None
 
+    def test_get_document_loader_returns_shared_instance(self):
+        """Test that get_document_loader reuses a single instance."""
+        first = get_document_loader()
+        second = get_document_loader()
+        assert first is second
+
 
 class TestGetSupportedExtensions:
     """Tests for get_supported_extensions method."""
@@ -40,50 +49,57 @@ class TestGetSupportedExtensions:
 class TestLoadFile:
     """Tests for load_file method."""
     
-    def test_raises_error_for_nonexistent_file(self, temp_directory: Path):
+    def test_raises_error_for_nonexistent_file(self, loader, temp_directory: Path):
         """Test that loading nonexistent file raises FileNotFoundError."""
-        loader = DocumentLoader()
         nonexistent_file = temp_directory / "missing.txt"
         
         with pytest.raises(FileNotFoundError):
             loader.load_file(nonexistent_file)
     
-    def test_raises_error_for_unsupported_extension(self, temp_directory: Path):
+    def test_raises_error_for_unsupported_extension(self, loader, temp_directory: Path):
         """Test that loading unsupported file type raises ValueError."""
-        loader = DocumentLoader()
         unsupported_file = temp_directory / "test.xyz"
         unsupported_file.touch()
         
         with pytest.raises(ValueError):
             loader.load_file(unsupported_file)
     
-    def test_loads_txt_file_successfully(self, sample_txt_file: Path):
+    def test_loads_txt_file_successfully(self, loader, sample_txt_file: Path):
         """Test that text file is loaded successfully."""
-        loader = DocumentLoader()
         documents = loader.load_file(sample_txt_file)
         
         assert isinstance(documents, list)
     
-    def test_returns_documents_list(self, sample_txt_file: Path):
+    def test_returns_documents_list(self, loader, sample_txt_file: Path):
         """Test that load_file returns a list of Document objects."""
-        loader = DocumentLoader()
         documents = loader.load_file(sample_txt_file)
         
         assert all(isinstance(doc, Document) for doc in documents)
     
-    def test_uses_correct_loader_for_pdf(self, sample_pdf_file: Path):
+    def test_uses_correct_loader_for_pdf(self, loader, sample_pdf_file: Path):
         """Test that PDF files use the correct loader class."""
         # Instead of trying to load an empty PDF, just verify the loader
         # would be selected correctly based on extension
-        loader = DocumentLoader()
         
-        # Verify PDF is in supported loaders
+        # Verify PDF is in supported loaders and resolves to the fast
+        # MuPDF-backed loader, or its pure-Python fallback when pymupdf
+        # is not installed
+        import importlib.util
+
         assert '.pdf' in SUPPORTED_LOADERS
-        assert SUPPORTED_LOADERS['.pdf'].__name__ == 'PyPDFLoader'
+        if importlib.util.find_spec('fitz') is not None:
+            assert _resolve_loader('.pdf').__name__ == 'PyMuPDFLoader'
+        else:
+            assert _resolve_loader('.pdf').__name__ == 'PyPDFLoader'
+
+    def test_loader_resolution_is_cached(self):
+        """Test that resolved loader classes are cached between calls."""
+        first = _resolve_loader('.txt')
+        second = _resolve_loader('.txt')
+        assert first is second
     
-    def test_handles_loader_exception(self, temp_directory: Path):
+    def test_handles_loader_exception(self, loader, temp_directory: Path):
         """Test that loader exceptions are propagated."""
-        loader = DocumentLoader()
         txt_file = temp_directory / "test.txt"
         txt_file.write_bytes(b'\x80\x81\x82')  # Invalid UTF-8
         
@@ -91,48 +107,68 @@ class TestLoadFile:
             loader.load_file(txt_file)
 
 
+class TestLazyLoadFile:
+    """Tests for lazy_load_file method."""
+
+    def test_returns_iterator(self, loader, sample_txt_file: Path):
+        """Test that lazy_load_file returns a lazy iterator, not a list."""
+        result = loader.lazy_load_file(sample_txt_file)
+
+        assert not isinstance(result, list)
+
+    def test_yields_documents(self, loader, sample_txt_file: Path):
+        """Test that iterating yields Document objects."""
+        documents = list(loader.lazy_load_file(sample_txt_file))
+
+        assert len(documents) >= 1
+        assert all(isinstance(doc, Document) for doc in documents)
+
+    def test_raises_error_for_unsupported_extension(self, loader, temp_directory: Path):
+        """Test that unsupported file types raise ValueError on iteration."""
+        unsupported_file = temp_directory / "test.xyz"
+        unsupported_file.touch()
+
+        with pytest.raises(ValueError):
+            list(loader.lazy_load_file(unsupported_file))
+
+
 class TestListFiles:
     """Tests for list_files method."""
     
-    def test_raises_error_for_nonexistent_directory(self, temp_directory: Path):
+    def test_raises_error_for_nonexistent_directory(self, loader, temp_directory: Path):
         """Test that nonexistent directory raises FileNotFoundError."""
-        loader = DocumentLoader()
         nonexistent_dir = temp_directory / "missing"
         
         with pytest.raises(FileNotFoundError):
             loader.list_files(nonexistent_dir)
     
-    def test_raises_error_for_file_path(self, sample_txt_file: Path):
+    def test_raises_error_for_file_path(self, loader, sample_txt_file: Path):
         """Test that file path instead of directory raises ValueError."""
-        loader = DocumentLoader()
         
         with pytest.raises(ValueError):
             loader.list_files(sample_txt_file)
     
-    def test_returns_empty_list_for_empty_directory(self, temp_directory: Path):
+    def test_returns_empty_list_for_empty_directory(self, loader, temp_directory: Path):
         """Test that empty directory returns empty list."""
-        loader = DocumentLoader()
         files = loader.list_files(temp_directory)
         
         assert files == []
     
-    def test_finds_txt_files(self, temp_directory: Path):
+    def test_finds_txt_files(self, loader, temp_directory: Path):
         """Test that text files are found in directory."""
         (temp_directory / "file1.txt").touch()
         (temp_directory / "file2.txt").touch()
         
-        loader = DocumentLoader()
         files = loader.list_files(temp_directory, file_types=['.txt'])
         
         assert len(files) == 2
     
-    def test_finds_multiple_file_types(self, temp_directory: Path):
+    def test_finds_multiple_file_types(self, loader, temp_directory: Path):
         """Test that multiple file types are found."""
         (temp_directory / "doc.txt").touch()
         (temp_directory / "doc.pdf").touch()
         (temp_directory / "doc.md").touch()
         
-        loader = DocumentLoader()
         files = loader.list_files(
             temp_directory, 
             file_types=['.txt', '.pdf']
@@ -140,44 +176,40 @@ class TestListFiles:
         
         assert len(files) == 2
     
-    def test_recursive_search_finds_nested_files(self, temp_directory: Path):
+    def test_recursive_search_finds_nested_files(self, loader, temp_directory: Path):
         """Test that recursive search finds files in subdirectories."""
         subdir = temp_directory / "subdir"
         subdir.mkdir()
         (temp_directory / "root.txt").touch()
         (subdir / "nested.txt").touch()
         
-        loader = DocumentLoader()
         files = loader.list_files(temp_directory, recursive=True)
         
         assert len(files) == 2
     
-    def test_non_recursive_ignores_subdirectories(self, temp_directory: Path):
+    def test_non_recursive_ignores_subdirectories(self, loader, temp_directory: Path):
         """Test that non-recursive search ignores subdirectories."""
         subdir = temp_directory / "subdir"
         subdir.mkdir()
         (temp_directory / "root.txt").touch()
         (subdir / "nested.txt").touch()
         
-        loader = DocumentLoader()
         files = loader.list_files(temp_directory, recursive=False)
         
         assert len(files) == 1
     
-    def test_normalizes_extensions_without_dot(self, temp_directory: Path):
+    def test_normalizes_extensions_without_dot(self, loader, temp_directory: Path):
         """Test that extensions without dot are normalized correctly."""
         (temp_directory / "file.txt").touch()
         
-        loader = DocumentLoader()
         files = loader.list_files(temp_directory, file_types=['txt'])
         
         assert len(files) == 1
     
-    def test_filters_unsupported_file_types(self, temp_directory: Path):
+    def test_filters_unsupported_file_types(self, loader, temp_directory: Path):
         """Test that unsupported file types are filtered out."""
         (temp_directory / "file.txt").touch()
         
-        loader = DocumentLoader()
         files = loader.list_files(
             temp_directory, 
             file_types=['.txt', '.xyz']
@@ -185,57 +217,83 @@ class TestListFiles:
         
         assert len(files) == 1
     
-    def test_returns_sorted_file_list(self, temp_directory: Path):
+    def test_returns_sorted_file_list(self, loader, temp_directory: Path):
         """Test that returned files are sorted."""
         (temp_directory / "c.txt").touch()
         (temp_directory / "a.txt").touch()
         (temp_directory / "b.txt").touch()
         
-        loader = DocumentLoader()
         files = loader.list_files(temp_directory)
         
         assert files[0].name == "a.txt"
     
-    def test_none_file_types_includes_all_supported(self, temp_directory: Path):
+    def test_none_file_types_includes_all_supported(self, loader, temp_directory: Path):
         """Test that None file_types includes all supported formats."""
         (temp_directory / "doc.txt").touch()
         (temp_directory / "doc.pdf").touch()
         (temp_directory / "doc.md").touch()
         
-        loader = DocumentLoader()
         files = loader.list_files(temp_directory, file_types=None)
-        
+
         assert len(files) == 3
 
+    def test_skips_excluded_directories(self, loader, temp_directory: Path):
+        """Test that built-in excluded directories are pruned from the walk."""
+        git_dir = temp_directory / ".git"
+        git_dir.mkdir()
+        (git_dir / "hidden.txt").touch()
+        (temp_directory / "visible.txt").touch()
+
+        files = loader.list_files(temp_directory)
+
+        assert [f.name for f in files] == ["visible.txt"]
+
+    def test_skips_custom_excluded_directories(self, loader, temp_directory: Path):
+        """Test that exclude_dirs prunes caller-specified directories."""
+        skipped = temp_directory / "drafts"
+        skipped.mkdir()
+        (skipped / "draft.txt").touch()
+        (temp_directory / "final.txt").touch()
+
+        files = loader.list_files(temp_directory, exclude_dirs=["drafts"])
+
+        assert [f.name for f in files] == ["final.txt"]
+
+    def test_limit_returns_first_files_in_sorted_order(self, loader, temp_directory: Path):
+        """Test that limit bounds the result to the smallest names."""
+        for name in ("c.txt", "a.txt", "b.txt"):
+            (temp_directory / name).touch()
+
+        files = loader.list_files(temp_directory, limit=2)
+
+        assert [f.name for f in files] == ["a.txt", "b.txt"]
+
 
 class TestLoadDirectory:
     """Tests for load_directory method."""
     
-    def test_loads_all_files_in_directory(self, temp_directory: Path):
+    def test_loads_all_files_in_directory(self, loader, temp_directory: Path):
         """Test that all supported files in directory are loaded."""
         (temp_directory / "file1.txt").write_text("content1")
         (temp_directory / "file2.txt").write_text("content2")
         
-        loader = DocumentLoader()
         documents = loader.load_directory(temp_directory)
         
         assert len(documents) >= 2
     
-    def test_returns_document_list(self, temp_directory: Path):
+    def test_returns_document_list(self, loader, temp_directory: Path):
         """Test that load_directory returns list of Documents."""
         (temp_directory / "file.txt").write_text("content")
         
-        loader = DocumentLoader()
         documents = loader.load_directory(temp_directory)
         
         assert isinstance(documents, list)
     
-    def test_filters_by_file_types(self, temp_directory: Path):
+    def test_filters_by_file_types(self, loader, temp_directory: Path):
         """Test that only specified file types are loaded."""
         (temp_directory / "file.txt").write_text("content")
         (temp_directory / "file.md").write_text("# Title")
         
-        loader = DocumentLoader()
         documents = loader.load_directory(
             temp_directory,
             file_types=['.txt']
@@ -244,9 +302,70 @@ class TestLoadDirectory:
         assert all('.txt' in str(doc.metadata.get('source', '')) 
                   for doc in documents if doc.metadata)
     
-    def test_empty_directory_returns_empty_list(self, temp_directory: Path):
+    def test_empty_directory_returns_empty_list(self, loader, temp_directory: Path):
         """Test that empty directory raises ValueError."""
-        loader = DocumentLoader()
-        
+
         with pytest.raises(ValueError, match="No supported files found"):
             loader.load_directory(temp_directory)
+
+
+class TestParallelLoadDirectory:
+    """Tests for parallel loading in load_directory."""
+
+    def test_loads_many_files_in_parallel(self, loader, temp_directory: Path):
+        """Test that a directory above the parallel threshold loads fully."""
+        for i in range(8):
+            (temp_directory / f"file{i}.txt").write_text(f"content {i}")
+
+        documents = loader.load_directory(temp_directory, max_workers=4)
+
+        assert len(documents) == 8
+
+    def test_parallel_results_preserve_file_order(self, loader, temp_directory: Path):
+        """Test that documents come back in sorted file order."""
+        for i in range(6):
+            (temp_directory / f"file{i}.txt").write_text(f"content {i}")
+
+        documents = loader.load_directory(temp_directory, max_workers=4)
+
+        sources = [doc.metadata.get("source", "") for doc in documents]
+        assert sources == sorted(sources)
+
+    def test_serial_fallback_for_small_ingests(self, loader, temp_directory: Path):
+        """Test that small directories still load with max_workers=1."""
+        (temp_directory / "only.txt").write_text("content")
+
+        documents = loader.load_directory(temp_directory, max_workers=1)
+
+        assert len(documents) == 1
+
+
+class TestIterDirectory:
+    """Tests for iter_directory generator."""
+
+    def test_yields_path_and_documents(self, loader, temp_directory: Path):
+        """Test that iter_directory yields (path, documents) tuples."""
+        (temp_directory / "file1.txt").write_text("content1")
+        (temp_directory / "file2.txt").write_text("content2")
+
+        results = list(loader.iter_directory(temp_directory))
+
+        assert len(results) == 2
+        for file_path, documents in results:
+            assert isinstance(file_path, Path)
+            assert isinstance(documents, list)
+
+    def test_is_lazy(self, loader, temp_directory: Path):
+        """Test that iter_directory returns a generator, not a list."""
+        (temp_directory / "file.txt").write_text("content")
+
+        iterator = loader.iter_directory(temp_directory)
+
+        assert not isinstance(iterator, list)
+        assert next(iterator) is not None
+
+    def test_empty_directory_raises_error(self, loader, temp_directory: Path):
+        """Test that empty directory raises ValueError."""
+
+        with pytest.raises(ValueError, match="No supported files found"):
+            list(loader.iter_directory(temp_directory))
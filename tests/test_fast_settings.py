@@ -0,0 +1,88 @@
+"""Unit tests for the optional msgspec fast settings path."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+msgspec = pytest.importorskip("msgspec")
+
+from config.fast_settings import FastSettings, load_fast_settings  # noqa: E402
+from config.settings import Settings, get_settings  # noqa: E402
+
+
+class TestFastSettingsDefaults:
+    """Tests for FastSettings default values."""
+
+    def test_initialization_with_defaults(self):
+        """Test that FastSettings initializes with default values."""
+        settings = FastSettings()
+        assert settings is not None
+
+    def test_defaults_match_pydantic_settings(self):
+        """Test that defaults agree with the Pydantic model field by field."""
+        fast = FastSettings()
+        slow = Settings(openai_api_key=None)
+        for field in FastSettings.__struct_fields__:
+            assert getattr(fast, field) == getattr(slow, field), field
+
+    def test_field_names_match_pydantic_settings(self):
+        """Test that the struct mirrors every Pydantic field."""
+        assert set(FastSettings.__struct_fields__) == set(Settings.model_fields)
+
+    def test_derived_paths_match_pydantic_settings(self):
+        """Test that derived path properties agree with the Pydantic model."""
+        fast = FastSettings()
+        slow = Settings()
+        assert fast.data_dir == slow.data_dir
+        assert fast.db_dir == slow.db_dir
+        assert fast.logs_dir == slow.logs_dir
+        assert fast.vector_store_path == slow.vector_store_path
+
+
+class TestLoadFastSettings:
+    """Tests for load_fast_settings environment loading."""
+
+    @patch.dict(os.environ, {"CHUNK_SIZE": "800"})
+    def test_loads_int_from_env(self):
+        """Test that integer fields are coerced from env strings."""
+        settings = load_fast_settings()
+        assert settings.chunk_size == 800
+
+    @patch.dict(os.environ, {"LOG_TO_FILE": "false"})
+    def test_loads_bool_from_env(self):
+        """Test that boolean fields are coerced from env strings."""
+        settings = load_fast_settings()
+        assert settings.log_to_file is False
+
+    @patch.dict(os.environ, {"BASE_DIR": "/tmp/rag-base"})
+    def test_loads_path_from_env(self):
+        """Test that path fields are coerced from env strings."""
+        settings = load_fast_settings()
+        assert settings.base_dir == Path("/tmp/rag-base")
+
+
+class TestGetSettingsDispatch:
+    """Tests for the RAG_FAST_SETTINGS dispatch in get_settings."""
+
+    @patch.dict(os.environ, {"RAG_FAST_SETTINGS": "1"})
+    def test_fast_flag_returns_fast_settings(self):
+        """Test that the env flag routes to the msgspec path."""
+        get_settings.cache_clear()
+        settings = get_settings()
+        get_settings.cache_clear()
+        assert isinstance(settings, FastSettings)
+
+    def test_default_returns_pydantic_settings(self):
+        """Test that without the flag the Pydantic path is used."""
+        get_settings.cache_clear()
+        settings = get_settings()
+        assert isinstance(settings, Settings)
+
+    @patch.dict(os.environ, {"RAG_FAST_SETTINGS": "1"})
+    def test_overrides_always_use_pydantic_path(self):
+        """Test that overrides bypass the fast path for full validation."""
+        settings = get_settings(chunk_size=321)
+        assert isinstance(settings, Settings)
+        assert settings.chunk_size == 321
@@ -0,0 +1,42 @@
+"""Unit tests for fastmath utilities."""
+
+import numpy as np
+
+from src.utils.fastmath import l2_normalize_2d, mean_length
+
+
+class TestMeanLength:
+    """Tests for mean_length."""
+
+    def test_empty_array_returns_zero(self):
+        """Test that an empty array yields 0 instead of dividing by zero."""
+        assert mean_length(np.array([], dtype=np.int64)) == 0
+
+    def test_matches_integer_division(self):
+        """Test that the result equals Python's floor-division mean."""
+        lengths = [3, 5, 8, 13]
+        expected = sum(lengths) // len(lengths)
+        assert mean_length(np.array(lengths, dtype=np.int64)) == expected
+
+
+class TestL2Normalize2D:
+    """Tests for l2_normalize_2d."""
+
+    def test_rows_have_unit_norm(self):
+        """Test that every nonzero row normalizes to unit length."""
+        vectors = np.array([[3.0, 4.0], [0.5, 0.5]])
+        normalized = l2_normalize_2d(vectors)
+        norms = np.linalg.norm(normalized, axis=1)
+        assert np.allclose(norms, 1.0)
+
+    def test_zero_row_stays_zero(self):
+        """Test that an all-zero row is left unchanged."""
+        vectors = np.array([[0.0, 0.0], [1.0, 0.0]])
+        normalized = l2_normalize_2d(vectors)
+        assert np.allclose(normalized[0], 0.0)
+
+    def test_direction_is_preserved(self):
+        """Test that normalization only rescales each row."""
+        vectors = np.array([[3.0, 4.0]])
+        normalized = l2_normalize_2d(vectors)
+        assert np.allclose(normalized, [[0.6, 0.8]])
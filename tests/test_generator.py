@@ -1,5 +1,7 @@
 """Unit tests for generator module."""
 
+import asyncio
+
 import pytest
 from langchain_core.documents import Document
 
@@ -47,6 +49,35 @@ class TestResponseGeneratorInitialization:
         assert generator.system_prompt_template == custom_prompt
 
 
+class TestBuildSystemPrompt:
+    """Tests for precomputed system prompt assembly."""
+
+    def test_matches_str_format_output(self, mock_llm_provider: BaseLLMProvider):
+        """Test that split-and-join assembly equals str.format."""
+        generator = ResponseGenerator(llm_provider=mock_llm_provider)
+        context = "Some retrieved context"
+        expected = generator.system_prompt_template.format(context=context)
+        assert generator._build_system_prompt(context) == expected
+
+    def test_custom_prompt_with_placeholder(self, mock_llm_provider: BaseLLMProvider):
+        """Test that a custom template's {context} slot is filled."""
+        generator = ResponseGenerator(
+            llm_provider=mock_llm_provider,
+            system_prompt="Before {context} after",
+        )
+        assert generator._build_system_prompt("MIDDLE") == "Before MIDDLE after"
+
+    def test_prompt_without_placeholder_unchanged(
+        self, mock_llm_provider: BaseLLMProvider
+    ):
+        """Test that a template without {context} is returned as-is."""
+        generator = ResponseGenerator(
+            llm_provider=mock_llm_provider,
+            system_prompt="No placeholder here",
+        )
+        assert generator._build_system_prompt("ignored") == "No placeholder here"
+
+
 class TestFormatContext:
     """Tests for _format_context method."""
 
@@ -196,3 +227,91 @@ class TestGenerate:
         with pytest.raises(RuntimeError, match="provider error"):
             generator.generate(sample_query, sample_documents)
 
+
+class TestAGenerate:
+    """Tests for agenerate method."""
+
+    def test_returns_answer_and_sources(
+        self,
+        mock_llm_provider: BaseLLMProvider,
+        sample_query: str,
+        sample_documents: list[Document],
+    ):
+        """Test that agenerate returns the provider's async answer."""
+        mock_llm_provider.agenerate.return_value = "Async answer"  # type: ignore
+        generator = ResponseGenerator(llm_provider=mock_llm_provider)
+        answer, sources = asyncio.run(
+            generator.agenerate(sample_query, sample_documents)
+        )
+        assert answer == "Async answer"
+        assert sources == sample_documents
+
+    def test_delegates_to_provider_agenerate(
+        self,
+        mock_llm_provider: BaseLLMProvider,
+        sample_query: str,
+        sample_documents: list[Document],
+    ):
+        """Test that agenerate delegates to llm_provider.agenerate."""
+        mock_llm_provider.agenerate.return_value = "Async answer"  # type: ignore
+        generator = ResponseGenerator(llm_provider=mock_llm_provider)
+        asyncio.run(generator.agenerate(sample_query, sample_documents))
+        mock_llm_provider.agenerate.assert_called_once()  # type: ignore
+
+
+
+class TestGenerateStreaming:
+    """Tests for generate_streaming method."""
+
+    def test_yields_provider_chunks_in_order(
+        self,
+        mock_llm_provider: BaseLLMProvider,
+        sample_query: str,
+        sample_documents: list[Document],
+    ):
+        """Test that chunks from the provider stream are yielded in order."""
+        mock_llm_provider.stream.return_value = iter(["Hello", " ", "world"])  # type: ignore
+        generator = ResponseGenerator(llm_provider=mock_llm_provider)
+        chunks = list(
+            generator.generate_streaming(sample_query, sample_documents)
+        )
+        assert chunks == ["Hello", " ", "world"]
+
+    def test_passes_context_and_question_to_provider(
+        self,
+        mock_llm_provider: BaseLLMProvider,
+        sample_query: str,
+        sample_documents: list[Document],
+    ):
+        """Test that the streamed prompt includes context and question."""
+        mock_llm_provider.stream.return_value = iter(["chunk"])  # type: ignore
+        generator = ResponseGenerator(llm_provider=mock_llm_provider)
+        list(generator.generate_streaming(sample_query, sample_documents))
+
+        system_prompt, user_message = mock_llm_provider.stream.call_args[0]  # type: ignore
+        assert sample_documents[0].page_content in system_prompt
+        assert sample_query in user_message
+
+
+class TestGenerateBatch:
+    """Tests for generate_batch method."""
+
+    def test_returns_results_in_input_order(
+        self,
+        mock_llm_provider: BaseLLMProvider,
+        sample_documents: list[Document],
+    ):
+        """Test that batch results line up with the input pairs."""
+        mock_llm_provider.agenerate.side_effect = [  # type: ignore
+            "Answer one",
+            "Answer two",
+        ]
+        generator = ResponseGenerator(llm_provider=mock_llm_provider)
+        results = generator.generate_batch(
+            [
+                ("First question?", sample_documents),
+                ("Second question?", sample_documents),
+            ]
+        )
+        assert [answer for answer, _ in results] == ["Answer one", "Answer two"]
+        assert all(sources == sample_documents for _, sources in results)
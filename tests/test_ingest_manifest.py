@@ -0,0 +1,74 @@
+"""Unit tests for ingest_manifest module."""
+
+from pathlib import Path
+
+from src.ingest_manifest import IngestManifest
+
+
+class TestIngestManifestLoad:
+    """Tests for IngestManifest.load."""
+
+    def test_missing_file_returns_empty_manifest(self, temp_directory: Path):
+        """Test that a nonexistent manifest loads as empty."""
+        manifest = IngestManifest.load(temp_directory / "manifest.json")
+        assert len(manifest) == 0
+
+    def test_corrupt_file_returns_empty_manifest(self, temp_directory: Path):
+        """Test that a corrupt manifest is treated as empty, not fatal."""
+        manifest_path = temp_directory / "manifest.json"
+        manifest_path.write_text("{not json")
+        manifest = IngestManifest.load(manifest_path)
+        assert len(manifest) == 0
+
+    def test_roundtrip_preserves_entries(
+        self, temp_directory: Path, sample_txt_file: Path
+    ):
+        """Test that save/load round-trips recorded entries."""
+        manifest_path = temp_directory / "manifest.json"
+        manifest = IngestManifest(manifest_path)
+        manifest.record(sample_txt_file)
+        manifest.save()
+
+        reloaded = IngestManifest.load(manifest_path)
+        assert len(reloaded) == 1
+        assert reloaded.is_current(sample_txt_file)
+
+
+class TestIngestManifestFingerprint:
+    """Tests for is_current fingerprint checks."""
+
+    def test_unrecorded_file_is_not_current(self, sample_txt_file: Path):
+        """Test that files never recorded are reported stale."""
+        manifest = IngestManifest(Path("unused.json"))
+        assert not manifest.is_current(sample_txt_file)
+
+    def test_recorded_file_is_current(self, sample_txt_file: Path):
+        """Test that an unchanged recorded file is reported current."""
+        manifest = IngestManifest(Path("unused.json"))
+        manifest.record(sample_txt_file)
+        assert manifest.is_current(sample_txt_file)
+
+    def test_modified_file_is_stale(self, sample_txt_file: Path):
+        """Test that changing a file's content invalidates its entry."""
+        import os
+
+        manifest = IngestManifest(Path("unused.json"))
+        manifest.record(sample_txt_file)
+
+        sample_txt_file.write_text("completely different content now")
+        # Force a different mtime even on coarse-grained filesystems
+        stat = sample_txt_file.stat()
+        os.utime(sample_txt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        assert not manifest.is_current(sample_txt_file)
+
+    def test_deleted_file_is_stale(self, temp_directory: Path):
+        """Test that a recorded file that disappeared is reported stale."""
+        file_path = temp_directory / "gone.txt"
+        file_path.write_text("content")
+
+        manifest = IngestManifest(Path("unused.json"))
+        manifest.record(file_path)
+        file_path.unlink()
+
+        assert not manifest.is_current(file_path)
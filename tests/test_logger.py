@@ -4,9 +4,29 @@ import logging
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+
 from src.utils.logger import setup_logger
 
 
+@pytest.fixture(autouse=True)
+def _cleanup_created_loggers():
+    """
+    Detach handlers from loggers created during each test.
+
+    Every test here configures uniquely named loggers, whose handlers
+    would otherwise pile up in the logging registry for the rest of the
+    session and flush to stdout on unrelated log calls.
+    """
+    before = set(logging.Logger.manager.loggerDict)
+    yield
+    for name in set(logging.Logger.manager.loggerDict) - before:
+        created = logging.getLogger(name)
+        for handler in created.handlers[:]:
+            handler.close()
+            created.removeHandler(handler)
+
+
 class TestSetupLogger:
     """Tests for setup_logger function."""
     
@@ -51,14 +71,29 @@ class TestSetupLogger:
         assert logger.level == logging.DEBUG
     
     @patch('src.utils.logger.get_settings')
-    def test_creates_logs_directory(self, mock_get_settings: Mock, temp_directory: Path):
+    def test_creates_logs_directory(
+        self,
+        mock_get_settings: Mock,
+        temp_directory: Path,
+        monkeypatch,
+    ):
         """Test that logs directory is created if it doesn't exist."""
+        import sys
+
+        # src.utils re-exports a Logger named 'logger', shadowing the
+        # submodule attribute — go through sys.modules for the module
+        logger_module = sys.modules["src.utils.logger"]
+
         mock_settings = Mock()
         mock_settings.log_level = "INFO"
         mock_settings.log_to_file = True
         mock_settings.logs_dir = temp_directory / "new_logs"
         mock_get_settings.return_value = mock_settings
-        
+
+        # Force a fresh queue listener so the patched logs_dir is used
+        monkeypatch.setattr(logger_module, "_log_queue", None)
+        monkeypatch.setattr(logger_module, "_queue_listener", None)
+
         setup_logger("test_dir_creation")
         assert mock_settings.logs_dir.exists()
 
@@ -81,19 +116,21 @@ class TestLoggerHandlers:
         mock_get_settings: Mock,
         temp_directory: Path
     ):
-        """Test that logger has FileHandler when log_to_file is True."""
+        """Test that logger gets a queue handler when log_to_file is True."""
+        from logging.handlers import QueueHandler
+
         mock_settings = Mock()
         mock_settings.log_level = "INFO"
         mock_settings.log_to_file = True
         mock_settings.logs_dir = temp_directory
         mock_get_settings.return_value = mock_settings
-        
+
         logger = setup_logger("test_file_handler")
-        file_handlers = [
-            h for h in logger.handlers 
-            if isinstance(h, logging.FileHandler)
+        queue_handlers = [
+            h for h in logger.handlers
+            if isinstance(h, QueueHandler)
         ]
-        assert len(file_handlers) > 0
+        assert len(queue_handlers) > 0
     
     @patch('src.utils.logger.get_settings')
     def test_no_file_handler_when_disabled(self, mock_get_settings: Mock):
@@ -116,9 +153,15 @@ class TestLoggerFormatting:
     """Tests for logger message formatting."""
     
     def test_handlers_have_formatter(self):
-        """Test that all handlers have a formatter set."""
+        """Test that direct handlers have a formatter set."""
+        from logging.handlers import QueueHandler
+
         logger = setup_logger("test_formatter")
         for handler in logger.handlers:
+            # Queue handlers delegate formatting to the background
+            # listener's file handler
+            if isinstance(handler, QueueHandler):
+                continue
             assert handler.formatter is not None
     
     def test_formatter_includes_timestamp(self):
@@ -125,3 +125,35 @@ class TestCreateEmbeddingProvider:
                 api_key="test-key",
             )
         assert isinstance(provider, BaseEmbeddingProvider)
+
+
+class TestEmbeddingQuantization:
+    """Tests for quantization wrapping in create_embedding_provider."""
+
+    def test_int8_setting_wraps_provider(self):
+        """embedding_quantization='int8' must wrap the adapter."""
+        from src.adapters.embeddings.quantized_embeddings import (
+            Int8QuantizedEmbeddingAdapter,
+        )
+
+        settings = _settings()
+        settings = settings.model_copy(update={"embedding_quantization": "int8"})
+        with patch("src.adapters.embeddings.openai_embeddings.OpenAIEmbeddings"):
+            provider = create_embedding_provider(settings, api_key="test-key")
+        assert isinstance(provider, Int8QuantizedEmbeddingAdapter)
+
+    def test_none_setting_returns_bare_provider(self):
+        """The default quantization must leave the adapter unwrapped."""
+        from src.adapters.embeddings.openai_embeddings import OpenAIEmbeddingAdapter
+
+        with patch("src.adapters.embeddings.openai_embeddings.OpenAIEmbeddings"):
+            provider = create_embedding_provider(_settings(), api_key="test-key")
+        assert isinstance(provider, OpenAIEmbeddingAdapter)
+
+    def test_unknown_quantization_raises_value_error(self):
+        """Unknown quantization names must raise ValueError."""
+        settings = _settings()
+        settings = settings.model_copy(update={"embedding_quantization": "fp4"})
+        with patch("src.adapters.embeddings.openai_embeddings.OpenAIEmbeddings"):
+            with pytest.raises(ValueError, match="fp4"):
+                create_embedding_provider(settings, api_key="test-key")
@@ -1,7 +1,9 @@
 """Unit tests for rag_pipeline module."""
 
+import re
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
 
 import pytest
 from langchain_core.documents import Document
@@ -10,6 +12,17 @@ from src.ports.embedding_provider import BaseEmbeddingProvider
 from src.ports.llm_provider import BaseLLMProvider
 from src.rag_pipeline import RAGPipeline
 
+# Document is a Pydantic model, so every construction runs field
+# validation. The tests only read these, so one prototype of each is
+# built at import and shared.
+_CHUNK_DOC = Document(page_content="chunk")
+_RESULT_DOC = Document(page_content="result")
+_SOURCE_DOC = Document(page_content="source")
+
+# Precompiled so pytest.raises(match=...) doesn't re-compile the
+# pattern on every run
+_NO_SOURCE_RE = re.compile("Either file_path or directory must be provided")
+
 
 def make_pipeline(
     mock_llm_provider: BaseLLMProvider,
@@ -25,6 +38,74 @@ def make_pipeline(
     )
 
 
+@pytest.fixture(scope="module")
+def base_pipeline() -> RAGPipeline:
+    """
+    One read-only pipeline shared by the attribute-inspection tests.
+
+    Construction wires up the loader, processor, vector store and
+    generator; tests that only assert on those attributes share a
+    single instance instead of rebuilding the whole stack each time.
+    """
+    return RAGPipeline(
+        api_key="",
+        llm_provider=MagicMock(spec=BaseLLMProvider),
+        embedding_provider=MagicMock(spec=BaseEmbeddingProvider),
+    )
+
+
+@pytest.fixture
+def patched_rag(monkeypatch, temp_directory: Path) -> SimpleNamespace:
+    """
+    Patch the pipeline's collaborator classes with pre-wired mocks.
+
+    Replaces the per-test ``@patch`` decorator stacks: monkeypatch swaps
+    every collaborator in one pass (and rolls it back automatically),
+    and tests receive the underlying instance mocks ready to assert
+    against or reconfigure.
+    """
+    chunks = [_CHUNK_DOC]
+
+    # Call-tracking Mocks only where a test asserts on the call; plain
+    # SimpleNamespace attribute bags elsewhere — they skip Mock's
+    # auto-attribute and call-recording machinery entirely.
+    loader = Mock()
+    loader.iter_directory.return_value = iter([])
+
+    text_processor = SimpleNamespace(
+        split_documents=lambda *args, **kwargs: chunks,
+        deduplicate_chunks=lambda *args, **kwargs: chunks,
+    )
+
+    vector_store = Mock()
+    vector_store.persist_directory = temp_directory / "vector_db"
+    vector_store.create_from_documents.return_value = None
+    vector_store.vectorstore = SimpleNamespace()
+
+    retriever = SimpleNamespace(
+        retrieve=lambda *args, **kwargs: [_RESULT_DOC]
+    )
+
+    monkeypatch.setattr(
+        "src.rag_pipeline.get_document_loader", Mock(return_value=loader)
+    )
+    monkeypatch.setattr(
+        "src.rag_pipeline.TextProcessor", Mock(return_value=text_processor)
+    )
+    monkeypatch.setattr("src.rag_pipeline.VectorStore", Mock(return_value=vector_store))
+    monkeypatch.setattr(
+        "src.rag_pipeline.DocumentRetriever", Mock(return_value=retriever)
+    )
+
+    return SimpleNamespace(
+        loader=loader,
+        text_processor=text_processor,
+        vector_store=vector_store,
+        retriever=retriever,
+        chunks=chunks,
+    )
+
+
 class TestRAGPipelineInitialization:
     """Tests for RAGPipeline initialization."""
 
@@ -47,59 +128,22 @@ class TestRAGPipelineInitialization:
         pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
         assert pipeline is not None
 
-    def test_document_loader_is_created(
-        self,
-        mock_llm_provider: BaseLLMProvider,
-        mock_embedding_provider: BaseEmbeddingProvider,
-    ):
-        """Test that document_loader instance is created."""
-        pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
-        assert pipeline.document_loader is not None
-
-    def test_text_processor_is_created(
-        self,
-        mock_llm_provider: BaseLLMProvider,
-        mock_embedding_provider: BaseEmbeddingProvider,
-    ):
-        """Test that text_processor instance is created."""
-        pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
-        assert pipeline.text_processor is not None
-
-    def test_vector_store_is_created(
-        self,
-        mock_llm_provider: BaseLLMProvider,
-        mock_embedding_provider: BaseEmbeddingProvider,
-    ):
-        """Test that vector_store instance is created."""
-        pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
-        assert pipeline.vector_store is not None
-
-    def test_generator_is_created(
-        self,
-        mock_llm_provider: BaseLLMProvider,
-        mock_embedding_provider: BaseEmbeddingProvider,
-    ):
-        """Test that generator instance is created."""
-        pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
-        assert pipeline.generator is not None
-
-    def test_retriever_initially_none(
-        self,
-        mock_llm_provider: BaseLLMProvider,
-        mock_embedding_provider: BaseEmbeddingProvider,
-    ):
-        """Test that retriever is None before initialization."""
-        pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
-        assert pipeline.retriever is None
-
-    def test_is_initialized_flag_starts_false(
-        self,
-        mock_llm_provider: BaseLLMProvider,
-        mock_embedding_provider: BaseEmbeddingProvider,
+    @pytest.mark.parametrize(
+        ("attr", "check"),
+        [
+            ("document_loader", lambda value: value is not None),
+            ("text_processor", lambda value: value is not None),
+            ("vector_store", lambda value: value is not None),
+            ("generator", lambda value: value is not None),
+            ("retriever", lambda value: value is None),
+            ("_is_initialized", lambda value: value is False),
+        ],
+    )
+    def test_initial_pipeline_attributes(
+        self, base_pipeline: RAGPipeline, attr: str, check
     ):
-        """Test that _is_initialized flag starts as False."""
-        pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
-        assert pipeline._is_initialized is False
+        """Test that a fresh pipeline exposes each attribute in its initial state."""
+        assert check(getattr(base_pipeline, attr))
 
     def test_providers_reach_components(
         self,
@@ -163,190 +207,210 @@ class TestIngestDocuments:
             mock_embedding_provider,
             vector_store_path=temp_vector_store_path,
         )
-        with pytest.raises(ValueError, match="Either file_path or directory must be provided"):
+        with pytest.raises(ValueError, match=_NO_SOURCE_RE):
             pipeline.ingest_documents()
 
-    @patch("src.rag_pipeline.VectorStore")
-    @patch("src.rag_pipeline.TextProcessor")
     def test_loads_single_file(
         self,
-        mock_text_processor_class: Mock,
-        mock_vector_store_class: Mock,
+        patched_rag: SimpleNamespace,
         mock_llm_provider: BaseLLMProvider,
         mock_embedding_provider: BaseEmbeddingProvider,
         sample_txt_file: Path,
     ):
         """Test that single file ingestion sets _is_initialized."""
-        mock_text_proc = Mock()
-        mock_text_proc.split_documents.return_value = [Document(page_content="chunk")]
-        mock_text_processor_class.return_value = mock_text_proc
-
-        mock_vector = Mock()
-        mock_vector.persist_directory = Mock()
-        mock_vector.persist_directory.exists.return_value = False
-        mock_vector.create_from_documents.return_value = Mock()
-        mock_vector.vectorstore = Mock()
-        mock_vector_store_class.return_value = mock_vector
-
         pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
         pipeline.ingest_documents(file_path=sample_txt_file)
 
         assert pipeline._is_initialized
 
-    @patch("src.rag_pipeline.VectorStore")
-    @patch("src.rag_pipeline.TextProcessor")
-    @patch("src.rag_pipeline.DocumentLoader")
     def test_loads_directory(
         self,
-        mock_loader_class: Mock,
-        mock_text_processor_class: Mock,
-        mock_vector_store_class: Mock,
+        patched_rag: SimpleNamespace,
         mock_llm_provider: BaseLLMProvider,
         mock_embedding_provider: BaseEmbeddingProvider,
         temp_directory: Path,
     ):
-        """Test that directory ingestion calls load_documents."""
-        mock_loader = Mock()
-        mock_loader.load_documents.return_value = [Document(page_content="doc")]
-        mock_loader_class.return_value = mock_loader
-
-        mock_text_proc = Mock()
-        mock_text_proc.split_documents.return_value = [Document(page_content="chunk")]
-        mock_text_processor_class.return_value = mock_text_proc
+        """Test that directory ingestion streams files through iter_directory."""
+        doc_file = temp_directory / "doc.txt"
+        doc_file.write_text("content")
 
-        mock_vector = Mock()
-        mock_vector.persist_directory = temp_directory / "vector_db"
-        mock_vector.create_from_documents.return_value = Mock()
-        mock_vector_store_class.return_value = mock_vector
+        patched_rag.loader.iter_directory.return_value = iter(
+            [(doc_file, [_SOURCE_DOC])]
+        )
 
         pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
         pipeline.ingest_documents(directory=temp_directory)
 
-        mock_loader.load_documents.assert_called_once()
+        patched_rag.loader.iter_directory.assert_called_once()
+        patched_rag.vector_store.create_from_documents.assert_called_once_with(
+            patched_rag.chunks
+        )
 
-    @patch("src.rag_pipeline.VectorStore")
-    @patch("src.rag_pipeline.TextProcessor")
     def test_creates_retriever_after_ingestion(
         self,
-        mock_text_processor_class: Mock,
-        mock_vector_store_class: Mock,
+        patched_rag: SimpleNamespace,
         mock_llm_provider: BaseLLMProvider,
         mock_embedding_provider: BaseEmbeddingProvider,
         sample_txt_file: Path,
     ):
         """Test that retriever is created after successful ingestion."""
-        mock_text_proc = Mock()
-        mock_text_proc.split_documents.return_value = [Document(page_content="chunk")]
-        mock_text_processor_class.return_value = mock_text_proc
-
-        mock_vector = Mock()
-        mock_vector.persist_directory = Mock()
-        mock_vector.persist_directory.exists.return_value = False
-        mock_vector.create_from_documents.return_value = Mock()
-        mock_vector.vectorstore = Mock()
-        mock_vector_store_class.return_value = mock_vector
-
         pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
         pipeline.ingest_documents(file_path=sample_txt_file)
 
         assert pipeline.retriever is not None
 
 
+@pytest.fixture
+def ready_pipeline(
+    patched_rag: SimpleNamespace,
+    mock_llm_provider: BaseLLMProvider,
+    mock_embedding_provider: BaseEmbeddingProvider,
+) -> RAGPipeline:
+    """
+    Pipeline already past ingestion, ready to answer queries.
+
+    The query tests only exercise query(); marking the pipeline
+    initialized and wiring the mocked retriever here keeps each of
+    them from repeating the same post-ingestion setup.
+    """
+    pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
+    pipeline._is_initialized = True
+    pipeline.retriever = patched_rag.retriever
+    return pipeline
+
+
 class TestQuery:
     """Tests for query method."""
 
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [("query", ("test query",)), ("interactive_chat", ())],
+    )
     def test_raises_error_when_not_initialized(
-        self,
-        mock_llm_provider: BaseLLMProvider,
-        mock_embedding_provider: BaseEmbeddingProvider,
+        self, base_pipeline: RAGPipeline, method: str, args: tuple
     ):
-        """Test that RuntimeError is raised when querying uninitialized pipeline."""
-        pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
+        """Test that RuntimeError is raised on an uninitialized pipeline."""
         with pytest.raises(RuntimeError):
-            pipeline.query("test query")
+            getattr(base_pipeline, method)(*args)
 
-    @patch("src.rag_pipeline.DocumentRetriever")
     def test_returns_tuple(
         self,
-        mock_retriever_class: Mock,
+        ready_pipeline: RAGPipeline,
         mock_llm_provider: BaseLLMProvider,
-        mock_embedding_provider: BaseEmbeddingProvider,
         sample_query: str,
     ):
         """Test that query returns a tuple."""
-        mock_retriever = Mock()
-        mock_retriever.retrieve.return_value = [Document(page_content="result")]
-        mock_retriever_class.return_value = mock_retriever
         mock_llm_provider.generate.return_value = "answer"  # type: ignore
 
-        pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
-        pipeline._is_initialized = True
-        pipeline.retriever = mock_retriever
-
-        result = pipeline.query(sample_query)
+        result = ready_pipeline.query(sample_query)
         assert isinstance(result, tuple)
 
-    @patch("src.rag_pipeline.DocumentRetriever")
     def test_returns_answer_and_sources(
         self,
-        mock_retriever_class: Mock,
+        ready_pipeline: RAGPipeline,
         mock_llm_provider: BaseLLMProvider,
-        mock_embedding_provider: BaseEmbeddingProvider,
         sample_query: str,
     ):
         """Test that query returns the answer from the provider and sources."""
-        source_doc = Document(page_content="source")
-        mock_retriever = Mock()
-        mock_retriever.retrieve.return_value = [source_doc]
-        mock_retriever_class.return_value = mock_retriever
         mock_llm_provider.generate.return_value = "Generated answer"  # type: ignore
 
+        answer, sources = ready_pipeline.query(sample_query)
+        assert answer == "Generated answer"
+        assert isinstance(sources, list)
+
+
+class TestAQuery:
+    """Tests for async aquery method."""
+
+    def test_raises_error_when_not_initialized(
+        self,
+        mock_llm_provider: BaseLLMProvider,
+        mock_embedding_provider: BaseEmbeddingProvider,
+    ):
+        """Test that RuntimeError is raised when querying uninitialized pipeline."""
+        import asyncio
+
+        pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
+        with pytest.raises(RuntimeError):
+            asyncio.run(pipeline.aquery("test query"))
+
+    def test_returns_answer_and_sources(
+        self,
+        mock_llm_provider: BaseLLMProvider,
+        mock_embedding_provider: BaseEmbeddingProvider,
+        sample_query: str,
+    ):
+        """Test that aquery runs the async retrieval and generation path."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        source_doc = _SOURCE_DOC
+        mock_retriever = Mock()
+        mock_retriever.aretrieve = AsyncMock(return_value=[source_doc])
+        mock_llm_provider.agenerate.return_value = "Generated answer"  # type: ignore
+
         pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
         pipeline._is_initialized = True
         pipeline.retriever = mock_retriever
 
-        answer, sources = pipeline.query(sample_query)
+        answer, sources = asyncio.run(pipeline.aquery(sample_query))
         assert answer == "Generated answer"
-        assert isinstance(sources, list)
+        assert sources == [source_doc]
 
 
-class TestInteractiveChat:
-    """Tests for interactive_chat method."""
+class TestBatchQuery:
+    """Tests for batch_query method."""
 
     def test_raises_error_when_not_initialized(
         self,
         mock_llm_provider: BaseLLMProvider,
         mock_embedding_provider: BaseEmbeddingProvider,
     ):
-        """Test that RuntimeError is raised when chatting with uninitialized pipeline."""
+        """Test that RuntimeError is raised for an uninitialized pipeline."""
         pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
         with pytest.raises(RuntimeError):
-            pipeline.interactive_chat()
+            pipeline.batch_query(["a", "b"])
+
+    def test_preserves_question_order(
+        self,
+        mock_llm_provider: BaseLLMProvider,
+        mock_embedding_provider: BaseEmbeddingProvider,
+    ):
+        """Test that answers come back in input order."""
+        from unittest.mock import AsyncMock
+
+        mock_retriever = Mock()
+        mock_retriever.aretrieve = AsyncMock(return_value=[])
+        mock_llm_provider.agenerate.side_effect = (  # type: ignore
+            lambda system, user: f"answer to {user}"
+        )
+
+        pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
+        pipeline._is_initialized = True
+        pipeline.retriever = mock_retriever
+        pipeline.semantic_cache = None
 
+        results = pipeline.batch_query(["first?", "second?"])
 
+        assert len(results) == 2
+        assert "first?" in results[0][0]
+        assert "second?" in results[1][0]
+
+
+@pytest.mark.slow
 class TestRAGPipelineIntegration:
     """Integration tests for RAGPipeline workflow."""
 
-    @patch("src.rag_pipeline.DocumentRetriever")
     def test_complete_workflow(
         self,
-        mock_retriever_class: Mock,
+        ready_pipeline: RAGPipeline,
         mock_llm_provider: BaseLLMProvider,
-        mock_embedding_provider: BaseEmbeddingProvider,
         sample_query: str,
     ):
         """Test complete workflow: init → mark initialized → query."""
-        source_doc = Document(page_content="result")
-        mock_retriever = Mock()
-        mock_retriever.retrieve.return_value = [source_doc]
-        mock_retriever_class.return_value = mock_retriever
         mock_llm_provider.generate.return_value = "answer"  # type: ignore
 
-        pipeline = make_pipeline(mock_llm_provider, mock_embedding_provider)
-        pipeline._is_initialized = True
-        pipeline.retriever = mock_retriever
-
-        answer, sources = pipeline.query(sample_query)
+        answer, sources = ready_pipeline.query(sample_query)
         assert isinstance(answer, str)
         assert isinstance(sources, list)
 
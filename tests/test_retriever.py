@@ -1,6 +1,7 @@
 """Unit tests for retriever module."""
 
-from unittest.mock import Mock, patch
+import copy
+from unittest.mock import Mock
 
 import pytest
 from langchain_core.documents import Document
@@ -8,20 +9,32 @@ from langchain_core.documents import Document
 from src.retriever import DocumentRetriever
 from src.vector_store import VectorStore
 
+# Mock(spec=...) re-introspects the class with dir() on every call;
+# shallow-copying one prototype skips that work (~4x faster). Copies
+# share child mocks, so the stand-in is used purely as an attribute bag
+# here — tests assert on the wrapped vectorstore mocks, never on the
+# store mock itself.
+_VS_PROTO = Mock(spec=VectorStore)
+
+
+def _mock_vector_store() -> Mock:
+    """Cheap per-test VectorStore stand-in cloned from one spec'd prototype."""
+    return copy.copy(_VS_PROTO)
+
 
 class TestDocumentRetrieverInitialization:
     """Tests for DocumentRetriever initialization."""
     
-    def test_initialization_with_defaults(self, set_test_api_key: str):
+    def test_initialization_with_defaults(self):
         """Test that DocumentRetriever initializes with default settings."""
-        mock_vector_store = Mock(spec=VectorStore)
+        mock_vector_store = _mock_vector_store()
         retriever = DocumentRetriever(vector_store=mock_vector_store)
         
         assert retriever is not None
     
-    def test_initialization_with_custom_search_type(self, set_test_api_key: str):
+    def test_initialization_with_custom_search_type(self):
         """Test that custom search_type is set correctly."""
-        mock_vector_store = Mock(spec=VectorStore)
+        mock_vector_store = _mock_vector_store()
         retriever = DocumentRetriever(
             vector_store=mock_vector_store,
             search_type="mmr"
@@ -29,9 +42,9 @@ class TestDocumentRetrieverInitialization:
         
         assert retriever.search_type == "mmr"
     
-    def test_initialization_with_custom_top_k(self, set_test_api_key: str):
+    def test_initialization_with_custom_top_k(self):
         """Test that custom top_k is set correctly."""
-        mock_vector_store = Mock(spec=VectorStore)
+        mock_vector_store = _mock_vector_store()
         retriever = DocumentRetriever(
             vector_store=mock_vector_store,
             top_k=10
@@ -39,23 +52,23 @@ class TestDocumentRetrieverInitialization:
         
         assert retriever.top_k == 10
     
-    def test_vector_store_is_stored(self, set_test_api_key: str):
+    def test_vector_store_is_stored(self):
         """Test that vector_store instance is stored correctly."""
-        mock_vector_store = Mock(spec=VectorStore)
+        mock_vector_store = _mock_vector_store()
         retriever = DocumentRetriever(vector_store=mock_vector_store)
         
         assert retriever.vector_store == mock_vector_store
     
-    def test_default_search_type_from_settings(self, set_test_api_key: str):
+    def test_default_search_type_from_settings(self):
         """Test that default search_type comes from settings."""
-        mock_vector_store = Mock(spec=VectorStore)
+        mock_vector_store = _mock_vector_store()
         retriever = DocumentRetriever(vector_store=mock_vector_store)
         
         assert retriever.search_type is not None
     
-    def test_default_top_k_from_settings(self, set_test_api_key: str):
+    def test_default_top_k_from_settings(self):
         """Test that default top_k comes from settings."""
-        mock_vector_store = Mock(spec=VectorStore)
+        mock_vector_store = _mock_vector_store()
         retriever = DocumentRetriever(vector_store=mock_vector_store)
         
         assert retriever.top_k > 0
@@ -64,24 +77,21 @@ class TestDocumentRetrieverInitialization:
 class TestGetRetriever:
     """Tests for get_retriever method."""
     
-    def test_raises_error_if_vectorstore_not_initialized(
-        self,
-        set_test_api_key: str
-    ):
+    def test_raises_error_if_vectorstore_not_initialized(self):
         """Test that error is raised if vectorstore is None."""
-        mock_vector_store = Mock(spec=VectorStore)
+        mock_vector_store = _mock_vector_store()
         mock_vector_store.vectorstore = None
         retriever = DocumentRetriever(vector_store=mock_vector_store)
         
         with pytest.raises(RuntimeError):
             retriever.get_retriever()
     
-    def test_returns_retriever_instance(self, set_test_api_key: str):
+    def test_returns_retriever_instance(self):
         """Test that method returns a retriever instance."""
         mock_vectorstore = Mock()
         mock_vectorstore.as_retriever.return_value = Mock()
         
-        mock_vector_store = Mock(spec=VectorStore)
+        mock_vector_store = _mock_vector_store()
         mock_vector_store.vectorstore = mock_vectorstore
         
         retriever = DocumentRetriever(vector_store=mock_vector_store)
@@ -89,12 +99,12 @@ class TestGetRetriever:
         
         assert result is not None
     
-    def test_calls_as_retriever_method(self, set_test_api_key: str):
+    def test_calls_as_retriever_method(self):
         """Test that as_retriever is called on vectorstore."""
         mock_vectorstore = Mock()
         mock_vectorstore.as_retriever.return_value = Mock()
         
-        mock_vector_store = Mock(spec=VectorStore)
+        mock_vector_store = _mock_vector_store()
         mock_vector_store.vectorstore = mock_vectorstore
         
         retriever = DocumentRetriever(vector_store=mock_vector_store)
@@ -102,12 +112,12 @@ class TestGetRetriever:
         
         mock_vectorstore.as_retriever.assert_called_once()
     
-    def test_passes_search_type_to_retriever(self, set_test_api_key: str):
+    def test_passes_search_type_to_retriever(self):
         """Test that search_type is passed to as_retriever."""
         mock_vectorstore = Mock()
         mock_vectorstore.as_retriever.return_value = Mock()
         
-        mock_vector_store = Mock(spec=VectorStore)
+        mock_vector_store = _mock_vector_store()
         mock_vector_store.vectorstore = mock_vectorstore
         
         retriever = DocumentRetriever(
@@ -119,12 +129,12 @@ class TestGetRetriever:
         call_kwargs = mock_vectorstore.as_retriever.call_args[1]
         assert call_kwargs['search_type'] == "mmr"
     
-    def test_passes_top_k_in_search_kwargs(self, set_test_api_key: str):
+    def test_passes_top_k_in_search_kwargs(self):
         """Test that top_k is passed in search_kwargs."""
         mock_vectorstore = Mock()
         mock_vectorstore.as_retriever.return_value = Mock()
         
-        mock_vector_store = Mock(spec=VectorStore)
+        mock_vector_store = _mock_vector_store()
         mock_vector_store.vectorstore = mock_vectorstore
         
         retriever = DocumentRetriever(
@@ -137,133 +147,179 @@ class TestGetRetriever:
         assert call_kwargs['search_kwargs']['k'] == 7
 
 
+@pytest.fixture
+def wired_retriever():
+    """
+    DocumentRetriever wired to a fully mocked vector store chain.
+
+    Returns (retriever, retriever_instance, vectorstore, vector_store)
+    so each test overrides only the piece it asserts on instead of
+    rebuilding the same three-mock chain.
+    """
+    retriever_instance = Mock()
+    retriever_instance.invoke.return_value = []
+
+    vectorstore = Mock()
+    vectorstore.as_retriever.return_value = retriever_instance
+
+    vector_store = _mock_vector_store()
+    vector_store.vectorstore = vectorstore
+
+    return (
+        DocumentRetriever(vector_store=vector_store),
+        retriever_instance,
+        vectorstore,
+        vector_store,
+    )
+
+
 class TestRetrieve:
     """Tests for retrieve method."""
-    
-    def test_returns_list_of_documents(
-        self,
-        set_test_api_key: str,
-        sample_query: str
-    ):
+
+    def test_returns_list_of_documents(self, wired_retriever, sample_query: str):
         """Test that retrieve returns a list of Documents."""
-        mock_docs = [Document(page_content="test")]
-        mock_retriever_instance = Mock()
-        mock_retriever_instance.invoke.return_value = mock_docs
-        
-        mock_vectorstore = Mock()
-        mock_vectorstore.as_retriever.return_value = mock_retriever_instance
-        
-        mock_vector_store = Mock(spec=VectorStore)
-        mock_vector_store.vectorstore = mock_vectorstore
-        
-        retriever = DocumentRetriever(vector_store=mock_vector_store)
+        retriever, retriever_instance, _, _ = wired_retriever
+        retriever_instance.invoke.return_value = [Document(page_content="test")]
+
         results = retriever.retrieve(sample_query)
-        
+
         assert isinstance(results, list)
-    
-    def test_calls_similarity_search(
-        self,
-        set_test_api_key: str,
-        sample_query: str
-    ):
+
+    def test_calls_similarity_search(self, wired_retriever, sample_query: str):
         """Test that retriever invoke is called."""
-        mock_retriever_instance = Mock()
-        mock_retriever_instance.invoke.return_value = []
-        
-        mock_vectorstore = Mock()
-        mock_vectorstore.as_retriever.return_value = mock_retriever_instance
-        
-        mock_vector_store = Mock(spec=VectorStore)
-        mock_vector_store.vectorstore = mock_vectorstore
-        
-        retriever = DocumentRetriever(vector_store=mock_vector_store)
+        retriever, retriever_instance, _, _ = wired_retriever
+
         retriever.retrieve(sample_query)
-        
-        mock_retriever_instance.invoke.assert_called_once()
-    
-    def test_uses_default_top_k(
-        self,
-        set_test_api_key: str,
-        sample_query: str
-    ):
+
+        retriever_instance.invoke.assert_called_once()
+
+    def test_uses_default_top_k(self, wired_retriever, sample_query: str):
         """Test that default top_k is used if not specified."""
-        mock_retriever_instance = Mock()
-        mock_retriever_instance.invoke.return_value = []
-        
-        mock_vectorstore = Mock()
-        mock_vectorstore.as_retriever.return_value = mock_retriever_instance
-        
-        mock_vector_store = Mock(spec=VectorStore)
-        mock_vector_store.vectorstore = mock_vectorstore
-        
-        retriever = DocumentRetriever(vector_store=mock_vector_store, top_k=5)
+        _, _, vectorstore, vector_store = wired_retriever
+
+        retriever = DocumentRetriever(vector_store=vector_store, top_k=5)
         retriever.retrieve(sample_query)
-        
+
         # Verify as_retriever was called with correct search_kwargs
-        call_kwargs = mock_vectorstore.as_retriever.call_args[1]
+        call_kwargs = vectorstore.as_retriever.call_args[1]
         assert call_kwargs['search_kwargs']['k'] == 5
-    
-    def test_uses_custom_k_parameter(
-        self,
-        set_test_api_key: str,
-        sample_query: str
-    ):
+
+    def test_uses_custom_k_parameter(self, wired_retriever, sample_query: str):
         """Test that custom k parameter overrides default top_k."""
-        mock_retriever_instance = Mock()
-        mock_retriever_instance.invoke.return_value = []
-        
-        mock_vectorstore = Mock()
-        mock_vectorstore.as_retriever.return_value = mock_retriever_instance
-        
-        mock_vector_store = Mock(spec=VectorStore)
-        mock_vector_store.vectorstore = mock_vectorstore
-        
-        retriever = DocumentRetriever(vector_store=mock_vector_store, top_k=5)
+        _, retriever_instance, _, vector_store = wired_retriever
+
+        retriever = DocumentRetriever(vector_store=vector_store, top_k=5)
         # First call will use top_k=5, but we're calling with k=3
         retriever.top_k = 3  # Simulate the k parameter override
         retriever.retrieve(sample_query, k=3)
-        
+
         # Verify invoke was called
-        mock_retriever_instance.invoke.assert_called_once()
-    
+        retriever_instance.invoke.assert_called_once()
+
     def test_passes_query_to_similarity_search(
+        self, wired_retriever, sample_query: str
+    ):
+        """Test that query is passed to retriever invoke."""
+        retriever, retriever_instance, _, _ = wired_retriever
+
+        retriever.retrieve(sample_query)
+
+        # Verify invoke was called with the query — direct inspection
+        # of call_args skips assert_called_once_with's _Call building
+        # and diff formatting machinery
+        assert retriever_instance.invoke.call_count == 1
+        assert retriever_instance.invoke.call_args.args == (sample_query,)
+
+    def test_returns_all_document_instances(
+        self,
+        wired_retriever,
+        sample_query: str,
+        sample_documents: list[Document]
+    ):
+        """Test that all returned items are Document instances."""
+        retriever, retriever_instance, _, _ = wired_retriever
+        retriever_instance.invoke.return_value = sample_documents
+
+        results = retriever.retrieve(sample_query)
+
+        assert all(isinstance(doc, Document) for doc in results)
+
+
+class TestRetrieverCaching:
+    """Tests for per-k retriever instance caching."""
+
+    def test_reuses_retriever_instance(self):
+        """Test that repeated calls reuse the cached wrapper."""
+        mock_vectorstore = Mock()
+        mock_vector_store = _mock_vector_store()
+        mock_vector_store.vectorstore = mock_vectorstore
+
+        retriever = DocumentRetriever(vector_store=mock_vector_store)
+        first = retriever.get_retriever()
+        second = retriever.get_retriever()
+
+        assert first is second
+        mock_vectorstore.as_retriever.assert_called_once()
+
+    def test_different_k_builds_separate_instances(self):
+        """Test that each k value is memoized independently."""
+        mock_vectorstore = Mock()
+        mock_vectorstore.as_retriever.side_effect = [Mock(), Mock()]
+        mock_vector_store = _mock_vector_store()
+        mock_vector_store.vectorstore = mock_vectorstore
+
+        retriever = DocumentRetriever(vector_store=mock_vector_store, top_k=5)
+        default_retriever = retriever.get_retriever()
+        custom_retriever = retriever.get_retriever(k=3)
+
+        assert default_retriever is not custom_retriever
+        assert retriever.get_retriever(k=3) is custom_retriever
+
+
+class TestARetrieve:
+    """Tests for async aretrieve method."""
+
+    def test_returns_list_of_documents(
         self,
-        set_test_api_key: str,
         sample_query: str
     ):
-        """Test that query is passed to retriever invoke."""
+        """Test that aretrieve returns a list of Documents."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        mock_docs = [Document(page_content="test")]
         mock_retriever_instance = Mock()
-        mock_retriever_instance.invoke.return_value = []
-        
+        mock_retriever_instance.ainvoke = AsyncMock(return_value=mock_docs)
+
         mock_vectorstore = Mock()
         mock_vectorstore.as_retriever.return_value = mock_retriever_instance
-        
-        mock_vector_store = Mock(spec=VectorStore)
+
+        mock_vector_store = _mock_vector_store()
         mock_vector_store.vectorstore = mock_vectorstore
-        
+
         retriever = DocumentRetriever(vector_store=mock_vector_store)
-        retriever.retrieve(sample_query)
-        
-        # Verify invoke was called with the query
-        mock_retriever_instance.invoke.assert_called_once_with(sample_query)
-    
-    def test_returns_all_document_instances(
+        results = asyncio.run(retriever.aretrieve(sample_query))
+
+        assert results == mock_docs
+
+    def test_calls_async_invoke(
         self,
-        set_test_api_key: str,
-        sample_query: str,
-        sample_documents: list[Document]
+        sample_query: str
     ):
-        """Test that all returned items are Document instances."""
+        """Test that aretrieve uses the retriever's async invocation."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
         mock_retriever_instance = Mock()
-        mock_retriever_instance.invoke.return_value = sample_documents
-        
+        mock_retriever_instance.ainvoke = AsyncMock(return_value=[])
+
         mock_vectorstore = Mock()
         mock_vectorstore.as_retriever.return_value = mock_retriever_instance
-        
-        mock_vector_store = Mock(spec=VectorStore)
+
+        mock_vector_store = _mock_vector_store()
         mock_vector_store.vectorstore = mock_vectorstore
-        
+
         retriever = DocumentRetriever(vector_store=mock_vector_store)
-        results = retriever.retrieve(sample_query)
-        
-        assert all(isinstance(doc, Document) for doc in results)
+        asyncio.run(retriever.aretrieve(sample_query))
+
+        mock_retriever_instance.ainvoke.assert_called_once_with(sample_query)
@@ -0,0 +1,119 @@
+"""Unit tests for semantic_cache module."""
+
+from unittest.mock import MagicMock
+
+from langchain_core.documents import Document
+
+from src.ports.embedding_provider import BaseEmbeddingProvider
+from src.semantic_cache import SemanticQueryCache
+
+
+def make_provider(vectors_by_query: dict) -> BaseEmbeddingProvider:
+    """Build a mock provider returning a fixed vector per query string."""
+    provider = MagicMock(spec=BaseEmbeddingProvider)
+    provider.embed_query.side_effect = lambda q: vectors_by_query[q]
+    return provider
+
+
+class TestSemanticQueryCacheHits:
+    """Tests for cache hit and miss behavior."""
+
+    def test_empty_cache_misses(self):
+        """Test that an empty cache always misses."""
+        provider = make_provider({"q": [1.0, 0.0]})
+        cache = SemanticQueryCache(provider)
+        assert cache.get("q") is None
+
+    def test_identical_question_hits(self):
+        """Test that an exact re-ask returns the cached answer."""
+        provider = make_provider({"q": [1.0, 0.0]})
+        cache = SemanticQueryCache(provider)
+        sources = [Document(page_content="src")]
+        cache.put("q", "answer", sources)
+
+        assert cache.get("q") == ("answer", sources)
+
+    def test_similar_question_hits(self):
+        """Test that a near-identical embedding counts as a hit."""
+        provider = make_provider({
+            "original": [1.0, 0.0],
+            "rephrased": [0.999, 0.02],
+        })
+        cache = SemanticQueryCache(provider, threshold=0.95)
+        cache.put("original", "answer", [])
+
+        result = cache.get("rephrased")
+        assert result is not None
+        assert result[0] == "answer"
+
+    def test_dissimilar_question_misses(self):
+        """Test that an orthogonal embedding misses."""
+        provider = make_provider({
+            "original": [1.0, 0.0],
+            "unrelated": [0.0, 1.0],
+        })
+        cache = SemanticQueryCache(provider, threshold=0.95)
+        cache.put("original", "answer", [])
+
+        assert cache.get("unrelated") is None
+
+
+class TestSemanticQueryCacheEviction:
+    """Tests for LRU and TTL eviction."""
+
+    def test_lru_eviction_at_capacity(self):
+        """Test that the least recently used entry is evicted first."""
+        provider = make_provider({
+            "a": [1.0, 0.0, 0.0],
+            "b": [0.0, 1.0, 0.0],
+            "c": [0.0, 0.0, 1.0],
+        })
+        cache = SemanticQueryCache(provider, max_size=2)
+        cache.put("a", "answer-a", [])
+        cache.put("b", "answer-b", [])
+        cache.put("c", "answer-c", [])
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("c") == ("answer-c", [])
+
+    def test_hit_refreshes_recency(self):
+        """Test that a cache hit protects the entry from eviction."""
+        provider = make_provider({
+            "a": [1.0, 0.0, 0.0],
+            "b": [0.0, 1.0, 0.0],
+            "c": [0.0, 0.0, 1.0],
+        })
+        cache = SemanticQueryCache(provider, max_size=2)
+        cache.put("a", "answer-a", [])
+        cache.put("b", "answer-b", [])
+        cache.get("a")
+        cache.put("c", "answer-c", [])
+
+        assert cache.get("a") == ("answer-a", [])
+        assert cache.get("b") is None
+
+    def test_ttl_expires_entries(self, monkeypatch):
+        """Test that entries older than the TTL are dropped."""
+        import src.semantic_cache as semantic_cache_module
+
+        provider = make_provider({"q": [1.0, 0.0]})
+        cache = SemanticQueryCache(provider, ttl_seconds=10.0)
+
+        now = 1000.0
+        monkeypatch.setattr(
+            semantic_cache_module.time, "monotonic", lambda: now
+        )
+        cache.put("q", "answer", [])
+
+        now = 1011.0
+        assert cache.get("q") is None
+
+    def test_clear_empties_cache(self):
+        """Test that clear removes all entries."""
+        provider = make_provider({"q": [1.0, 0.0]})
+        cache = SemanticQueryCache(provider)
+        cache.put("q", "answer", [])
+        cache.clear()
+
+        assert len(cache) == 0
@@ -1,10 +1,9 @@
 """Unit tests for settings module."""
 
-import os
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
+from pydantic import ValidationError
 
 from config.settings import Settings, get_settings
 
@@ -12,10 +11,9 @@ from config.settings import Settings, get_settings
 class TestSettingsInitialization:
     """Tests for Settings initialization."""
     
-    def test_initialization_with_defaults(self):
+    def test_initialization_with_defaults(self, default_settings: Settings):
         """Test that Settings initializes with default values."""
-        settings = Settings()
-        assert settings is not None
+        assert default_settings is not None
     
     def test_openai_api_key_is_optional(self):
         """Test that openai_api_key can be None."""
@@ -27,176 +25,128 @@ class TestSettingsInitialization:
         settings = Settings(openai_api_key="test-key")
         assert settings.openai_api_key == "test-key"
     
-    def test_default_embedding_model(self):
-        """Test that default embedding_model is set."""
-        settings = Settings()
-        assert settings.openai_embedding_model is not None
-    
-    def test_default_chat_model(self):
-        """Test that default chat_model is set."""
-        settings = Settings()
-        assert settings.openai_chat_model is not None
-    
-    def test_default_temperature(self):
-        """Test that default temperature is set."""
-        settings = Settings()
-        assert settings.openai_temperature >= 0.0
-    
-    def test_temperature_is_float(self):
-        """Test that temperature is a float."""
-        settings = Settings()
-        assert isinstance(settings.openai_temperature, float)
-    
-    def test_default_chunk_size(self):
-        """Test that default chunk_size is positive."""
-        settings = Settings()
-        assert settings.chunk_size > 0
-    
-    def test_default_chunk_overlap(self):
-        """Test that default chunk_overlap is non-negative."""
-        settings = Settings()
-        assert settings.chunk_overlap >= 0
-    
-    def test_default_retrieval_top_k(self):
-        """Test that default retrieval_top_k is positive."""
-        settings = Settings()
-        assert settings.retrieval_top_k > 0
-    
-    def test_default_retrieval_search_type(self):
-        """Test that default retrieval_search_type is set."""
-        settings = Settings()
-        assert settings.retrieval_search_type is not None
+    @pytest.mark.parametrize(
+        ("attr", "check"),
+        [
+            pytest.param(
+                "openai_embedding_model", lambda v: v is not None, id="embedding_model"
+            ),
+            pytest.param("openai_chat_model", lambda v: v is not None, id="chat_model"),
+            pytest.param("openai_temperature", lambda v: v >= 0.0, id="temperature"),
+            pytest.param(
+                "openai_temperature",
+                lambda v: isinstance(v, float),
+                id="temperature_is_float",
+            ),
+            pytest.param("chunk_size", lambda v: v > 0, id="chunk_size"),
+            pytest.param("chunk_overlap", lambda v: v >= 0, id="chunk_overlap"),
+            pytest.param(
+                "embedding_batch_size", lambda v: v > 0, id="embedding_batch_size"
+            ),
+            pytest.param("retrieval_top_k", lambda v: v > 0, id="retrieval_top_k"),
+            pytest.param(
+                "retrieval_search_type",
+                lambda v: v is not None,
+                id="retrieval_search_type",
+            ),
+        ],
+    )
+    def test_default_values(self, default_settings: Settings, attr: str, check):
+        """Test that each default setting is present and in range."""
+        assert check(getattr(default_settings, attr))
 
 
 class TestSettingsCustomValues:
     """Tests for Settings with custom values."""
-    
-    def test_custom_embedding_model(self):
-        """Test that custom embedding_model is set correctly."""
-        settings = Settings(openai_embedding_model="text-embedding-ada-002")
-        assert settings.openai_embedding_model == "text-embedding-ada-002"
-    
-    def test_custom_chat_model(self):
-        """Test that custom chat_model is set correctly."""
-        settings = Settings(openai_chat_model="gpt-4")
-        assert settings.openai_chat_model == "gpt-4"
-    
-    def test_custom_temperature(self):
-        """Test that custom temperature is set correctly."""
-        settings = Settings(openai_temperature=0.7)
-        assert settings.openai_temperature == 0.7
-    
-    def test_custom_chunk_size(self):
-        """Test that custom chunk_size is set correctly."""
-        settings = Settings(chunk_size=500)
-        assert settings.chunk_size == 500
-    
-    def test_custom_chunk_overlap(self):
-        """Test that custom chunk_overlap is set correctly."""
-        settings = Settings(chunk_overlap=100)
-        assert settings.chunk_overlap == 100
-    
-    def test_custom_retrieval_top_k(self):
-        """Test that custom retrieval_top_k is set correctly."""
-        settings = Settings(retrieval_top_k=10)
-        assert settings.retrieval_top_k == 10
-    
-    def test_custom_retrieval_search_type(self):
-        """Test that custom retrieval_search_type is set correctly."""
-        settings = Settings(retrieval_search_type="mmr")
-        assert settings.retrieval_search_type == "mmr"
+
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            pytest.param(
+                "openai_embedding_model", "text-embedding-ada-002", id="embedding_model"
+            ),
+            pytest.param("openai_chat_model", "gpt-4", id="chat_model"),
+            pytest.param("openai_temperature", 0.7, id="temperature"),
+            pytest.param("chunk_size", 500, id="chunk_size"),
+            pytest.param("chunk_overlap", 100, id="chunk_overlap"),
+            pytest.param("retrieval_top_k", 10, id="retrieval_top_k"),
+            pytest.param("retrieval_search_type", "mmr", id="retrieval_search_type"),
+        ],
+    )
+    def test_custom_value_is_set(self, field: str, value):
+        """Test that each custom value is set correctly."""
+        settings = Settings(**{field: value})
+        assert getattr(settings, field) == value
 
 
 class TestSettingsValidation:
     """Tests for Settings validation rules."""
-    
-    def test_temperature_minimum_value(self):
-        """Test that temperature minimum value is enforced."""
-        settings = Settings(openai_temperature=0.0)
-        assert settings.openai_temperature == 0.0
-    
-    def test_temperature_maximum_value(self):
-        """Test that temperature maximum value is enforced."""
-        settings = Settings(openai_temperature=2.0)
-        assert settings.openai_temperature == 2.0
-    
-    def test_chunk_size_positive(self):
-        """Test that chunk_size must be positive."""
-        with pytest.raises(Exception):
-            Settings(chunk_size=0)
-    
-    def test_chunk_overlap_non_negative(self):
-        """Test that chunk_overlap can be zero."""
-        settings = Settings(chunk_overlap=0)
-        assert settings.chunk_overlap == 0
-    
-    def test_retrieval_top_k_positive(self):
-        """Test that retrieval_top_k must be positive."""
-        with pytest.raises(Exception):
-            Settings(retrieval_top_k=0)
+
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            pytest.param("openai_temperature", 0.0, id="temperature_minimum"),
+            pytest.param("openai_temperature", 2.0, id="temperature_maximum"),
+            pytest.param("chunk_overlap", 0, id="chunk_overlap_zero"),
+        ],
+    )
+    def test_boundary_value_accepted(self, field: str, value):
+        """Test that in-range boundary values pass validation."""
+        settings = Settings(**{field: value})
+        assert getattr(settings, field) == value
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"chunk_size": 0}, id="chunk_size_zero"),
+            pytest.param({"retrieval_top_k": 0}, id="retrieval_top_k_zero"),
+            pytest.param({"embedding_batch_size": 0}, id="embedding_batch_zero"),
+            pytest.param(
+                {"embedding_batch_size": 4096}, id="embedding_batch_over_limit"
+            ),
+        ],
+    )
+    def test_invalid_value_rejected(self, kwargs: dict):
+        """Test that out-of-range values raise ValidationError."""
+        with pytest.raises(ValidationError):
+            Settings(**kwargs)
 
 
 class TestSettingsPaths:
     """Tests for Settings path properties."""
-    
-    def test_base_dir_is_path(self):
+
+    def test_base_dir_is_path(self, default_settings: Settings):
         """Test that base_dir is a Path object."""
-        settings = Settings()
-        assert isinstance(settings.base_dir, Path)
-    
-    def test_data_dir_is_path(self):
-        """Test that data_dir is a Path object."""
-        settings = Settings()
-        assert isinstance(settings.data_dir, Path)
-    
-    def test_db_dir_is_path(self):
-        """Test that db_dir is a Path object."""
-        settings = Settings()
-        assert isinstance(settings.db_dir, Path)
-    
-    def test_logs_dir_is_path(self):
-        """Test that logs_dir is a Path object."""
-        settings = Settings()
-        assert isinstance(settings.logs_dir, Path)
-    
-    def test_vector_store_path_is_path(self):
-        """Test that vector_store_path is a Path object."""
-        settings = Settings()
-        assert isinstance(settings.vector_store_path, Path)
-    
-    def test_data_dir_is_subdirectory_of_base(self):
-        """Test that data_dir is under base_dir."""
-        settings = Settings()
-        assert settings.data_dir.parent == settings.base_dir
-    
-    def test_db_dir_is_subdirectory_of_base(self):
-        """Test that db_dir is under base_dir."""
-        settings = Settings()
-        assert settings.db_dir.parent == settings.base_dir
-    
-    def test_logs_dir_is_subdirectory_of_base(self):
-        """Test that logs_dir is under base_dir."""
-        settings = Settings()
-        assert settings.logs_dir.parent == settings.base_dir
-    
-    def test_vector_store_path_is_under_db_dir(self):
-        """Test that vector_store_path is under db_dir."""
-        settings = Settings()
-        assert settings.vector_store_path.parent == settings.db_dir
+        assert isinstance(default_settings.base_dir, Path)
+
+    @pytest.mark.parametrize(
+        ("attr", "parent_attr"),
+        [
+            pytest.param("data_dir", "base_dir", id="data_dir"),
+            pytest.param("db_dir", "base_dir", id="db_dir"),
+            pytest.param("logs_dir", "base_dir", id="logs_dir"),
+            pytest.param("vector_store_path", "db_dir", id="vector_store_path"),
+        ],
+    )
+    def test_path_under_parent(
+        self, default_settings: Settings, attr: str, parent_attr: str
+    ):
+        """Test that each derived path is a Path nested under its parent."""
+        path = getattr(default_settings, attr)
+        assert isinstance(path, Path)
+        assert path.parent == getattr(default_settings, parent_attr)
 
 
 class TestSettingsLogging:
     """Tests for Settings logging configuration."""
     
-    def test_default_log_level(self):
+    def test_default_log_level(self, default_settings: Settings):
         """Test that default log_level is set."""
-        settings = Settings()
-        assert settings.log_level is not None
+        assert default_settings.log_level is not None
     
-    def test_default_log_to_file(self):
+    def test_default_log_to_file(self, default_settings: Settings):
         """Test that default log_to_file is set."""
-        settings = Settings()
-        assert isinstance(settings.log_to_file, bool)
+        assert isinstance(default_settings.log_to_file, bool)
     
     def test_custom_log_level(self):
         """Test that custom log_level is set correctly."""
@@ -228,10 +178,22 @@ class TestGetSettings:
         settings1 = get_settings(chunk_size=500)
         settings2 = get_settings(chunk_size=600)
         assert settings1.chunk_size != settings2.chunk_size
-    
-    @patch.dict(os.environ, {"OPENAI_API_KEY": "env-test-key"})
-    def test_loads_from_environment(self):
+
+    def test_caches_identical_calls(self):
+        """Test that identical calls return the memoized instance."""
+        settings1 = get_settings(chunk_size=512)
+        settings2 = get_settings(chunk_size=512)
+        assert settings1 is settings2
+
+    def test_caches_no_arg_calls(self):
+        """Test that the no-override path returns the memoized instance."""
+        assert get_settings() is get_settings()
+
+    @pytest.mark.env_isolated
+    def test_loads_from_environment(self, monkeypatch):
         """Test that get_settings loads values from environment."""
+        monkeypatch.setenv("OPENAI_API_KEY", "env-test-key")
+        get_settings.cache_clear()
         settings = get_settings()
         assert settings.openai_api_key == "env-test-key"
     
@@ -245,35 +207,38 @@ class TestGetSettings:
         assert settings.chunk_size == 750
 
 
+@pytest.mark.env_isolated
 class TestSettingsEnvironmentVariables:
     """Tests for Settings loading from environment variables."""
-    
-    @patch.dict(os.environ, {"OPENAI_EMBEDDING_MODEL": "custom-embedding"})
-    def test_loads_embedding_model_from_env(self):
-        """Test that embedding_model is loaded from environment."""
-        settings = Settings()
-        assert settings.openai_embedding_model == "custom-embedding"
-    
-    @patch.dict(os.environ, {"OPENAI_CHAT_MODEL": "custom-chat"})
-    def test_loads_chat_model_from_env(self):
-        """Test that chat_model is loaded from environment."""
-        settings = Settings()
-        assert settings.openai_chat_model == "custom-chat"
-    
-    @patch.dict(os.environ, {"OPENAI_TEMPERATURE": "0.8"})
-    def test_loads_temperature_from_env(self):
-        """Test that temperature is loaded from environment."""
-        settings = Settings()
-        assert settings.openai_temperature == 0.8
-    
-    @patch.dict(os.environ, {"CHUNK_SIZE": "800"})
-    def test_loads_chunk_size_from_env(self):
-        """Test that chunk_size is loaded from environment."""
-        settings = Settings()
-        assert settings.chunk_size == 800
-    
-    @patch.dict(os.environ, {"LOG_LEVEL": "DEBUG"})
-    def test_loads_log_level_from_env(self):
-        """Test that log_level is loaded from environment."""
-        settings = Settings()
-        assert settings.log_level == "DEBUG"
+
+    @pytest.mark.parametrize(
+        ("env_var", "raw", "attr", "expected"),
+        [
+            pytest.param(
+                "OPENAI_EMBEDDING_MODEL",
+                "custom-embedding",
+                "openai_embedding_model",
+                "custom-embedding",
+                id="embedding_model",
+            ),
+            pytest.param(
+                "OPENAI_CHAT_MODEL",
+                "custom-chat",
+                "openai_chat_model",
+                "custom-chat",
+                id="chat_model",
+            ),
+            pytest.param(
+                "OPENAI_TEMPERATURE", "0.8", "openai_temperature", 0.8, id="temperature"
+            ),
+            pytest.param("CHUNK_SIZE", "800", "chunk_size", 800, id="chunk_size"),
+            pytest.param("LOG_LEVEL", "DEBUG", "log_level", "DEBUG", id="log_level"),
+        ],
+    )
+    def test_loads_value_from_env(
+        self, monkeypatch, env_var: str, raw: str, attr: str, expected
+    ):
+        """Test that each setting is loaded from its environment variable."""
+        monkeypatch.setenv(env_var, raw)
+        settings = Settings()
+        assert getattr(settings, attr) == expected
@@ -1,11 +1,39 @@
 """Unit tests for text_processor module."""
 
+from functools import lru_cache
+
+import numpy as np
 import pytest
 from langchain_core.documents import Document
 
 from src.text_processor import TextProcessor
 
 
+# Built once at import instead of per test invocation; string
+# multiplication allocates O(n) bytes each time.
+_LONG_SENTENCE_TEXT = " ".join(f"This is sentence number {i}." for i in range(200))
+_LONG_WORDS = "word " * 500
+_REPEATED_SENTENCES = "sentence " * 100
+_REPEATED_CONTENT = "Test content " * 100
+
+
+@pytest.fixture(scope="module")
+def make_processor():
+    """
+    Memoized TextProcessor factory keyed by (chunk_size, chunk_overlap).
+
+    Constructing a TextProcessor builds the underlying splitter each
+    time; sharing one instance per configuration avoids redoing that
+    for every test. Only read-only tests should use this — tests that
+    mutate processor state construct their own instance.
+    """
+    return lru_cache(maxsize=None)(
+        lambda chunk_size=None, chunk_overlap=None: TextProcessor(
+            chunk_size=chunk_size, chunk_overlap=chunk_overlap
+        )
+    )
+
+
 class TestTextProcessorInitialization:
     """Tests for TextProcessor initialization."""
     
@@ -39,97 +67,112 @@ class TestTextProcessorInitialization:
 class TestSplitDocuments:
     """Tests for split_documents method."""
     
-    def test_returns_list_of_documents(self, sample_documents: list[Document]):
+    def test_returns_list_of_documents(self, make_processor, sample_documents: list[Document]):
         """Test that method returns a list of Document objects."""
-        processor = TextProcessor(chunk_size=100, chunk_overlap=20)
+        processor = make_processor(100, 20)
         chunks = processor.split_documents(sample_documents)
         
         assert isinstance(chunks, list)
     
-    def test_splits_long_document_into_chunks(self, long_document: Document):
-        """Test that long document is split into multiple chunks."""
-        processor = TextProcessor(chunk_size=100, chunk_overlap=20)
-        chunks = processor.split_documents([long_document])
-        
-        assert len(chunks) > 1
-    
-    def test_small_document_remains_single_chunk(self):
-        """Test that small document is not split unnecessarily."""
-        small_doc = Document(page_content="Short text.")
-        processor = TextProcessor(chunk_size=1000, chunk_overlap=200)
-        chunks = processor.split_documents([small_doc])
-        
-        assert len(chunks) == 1
-    
-    def test_empty_document_list_returns_empty(self):
+    @pytest.mark.parametrize(
+        ("content", "chunk_size", "chunk_overlap", "check"),
+        [
+            pytest.param(
+                _LONG_SENTENCE_TEXT,
+                100,
+                20,
+                lambda chunks: len(chunks) > 1,
+                id="long_document_splits",
+            ),
+            pytest.param(
+                "Short text.",
+                1000,
+                200,
+                lambda chunks: len(chunks) == 1,
+                id="small_document_single_chunk",
+            ),
+            pytest.param(
+                _LONG_WORDS,
+                100,
+                20,
+                lambda chunks: np.fromiter(
+                    (len(c.page_content) for c in chunks), dtype=np.int64
+                ).max() <= 150,
+                id="chunk_size_respected",
+            ),
+            pytest.param(
+                _REPEATED_SENTENCES,
+                100,
+                50,
+                lambda chunks: len(chunks) > 1,
+                id="overlap_creates_redundancy",
+            ),
+        ],
+    )
+    def test_split_size_overlap_matrix(
+        self, make_processor, content: str, chunk_size: int, chunk_overlap: int, check
+    ):
+        """Test splitting behavior across (chunk_size, chunk_overlap) variants."""
+        processor = make_processor(chunk_size, chunk_overlap)
+        chunks = processor.split_documents([Document(page_content=content)])
+
+        assert check(chunks)
+
+    def test_empty_document_list_returns_empty(self, make_processor):
         """Test that empty document list returns empty chunks."""
-        processor = TextProcessor()
+        processor = make_processor()
         chunks = processor.split_documents([])
         
         assert chunks == []
     
-    def test_preserves_metadata_in_chunks(self):
+    def test_preserves_metadata_in_chunks(self, make_processor):
         """Test that document metadata is preserved in chunks."""
         doc = Document(
-            page_content="Test content " * 100,
+            page_content=_REPEATED_CONTENT,
             metadata={"source": "test.txt", "page": 1}
         )
-        processor = TextProcessor(chunk_size=100, chunk_overlap=20)
+        processor = make_processor(100, 20)
         chunks = processor.split_documents([doc])
         
-        assert all("source" in chunk.metadata for chunk in chunks)
+        # Hoist the attribute access out of the per-chunk check
+        metadatas = [chunk.metadata for chunk in chunks]
+        assert all("source" in metadata for metadata in metadatas)
     
-    def test_multiple_documents_are_all_chunked(self, sample_documents: list[Document]):
+    def test_multiple_documents_are_all_chunked(self, make_processor, sample_documents: list[Document]):
         """Test that multiple documents are all processed."""
-        processor = TextProcessor(chunk_size=50, chunk_overlap=10)
+        processor = make_processor(50, 10)
         chunks = processor.split_documents(sample_documents)
         
         assert len(chunks) >= len(sample_documents)
     
-    def test_chunk_size_respected(self):
-        """Test that chunks respect the specified size limit."""
-        doc = Document(page_content="word " * 500)
-        processor = TextProcessor(chunk_size=100, chunk_overlap=20)
-        chunks = processor.split_documents([doc])
-        
-        assert all(len(chunk.page_content) <= 150 for chunk in chunks)
-    
-    def test_chunk_overlap_creates_redundancy(self):
-        """Test that chunk overlap creates content redundancy between chunks."""
-        content = "sentence " * 100
-        doc = Document(page_content=content)
-        processor = TextProcessor(chunk_size=100, chunk_overlap=50)
-        chunks = processor.split_documents([doc])
-        
-        assert len(chunks) > 1
-    
-    def test_handles_document_with_metadata_only(self):
+    def test_handles_document_with_metadata_only(self, make_processor):
         """Test that documents with only metadata are handled."""
         doc = Document(page_content="", metadata={"source": "empty.txt"})
-        processor = TextProcessor()
+        processor = make_processor()
         chunks = processor.split_documents([doc])
         
         assert isinstance(chunks, list)
     
-    def test_returns_all_document_instances(self, long_document: Document):
+    def test_returns_all_document_instances(self, make_processor, long_document: Document):
         """Test that all returned items are Document instances."""
-        processor = TextProcessor(chunk_size=100, chunk_overlap=20)
+        processor = make_processor(100, 20)
         chunks = processor.split_documents([long_document])
         
-        assert all(isinstance(chunk, Document) for chunk in chunks)
+        # One set equality instead of an isinstance call per chunk
+        assert {type(chunk) for chunk in chunks} == {Document}
 
 
 class TestTextProcessorConfiguration:
     """Tests for TextProcessor configuration options."""
     
-    def test_default_chunk_size_from_settings(self):
+    def test_default_chunk_size_from_settings(self, make_processor):
         """Test that default chunk_size comes from settings."""
-        processor = TextProcessor()
+        processor = make_processor()
         assert processor.chunk_size > 0
     
-    def test_default_chunk_overlap_from_settings(self):
+    def test_default_chunk_overlap_from_settings(self, make_processor):
         """Test that default chunk_overlap comes from settings."""
-        processor = TextProcessor()
+        processor = make_processor()
         assert processor.chunk_overlap >= 0
     
     def test_custom_values_override_defaults(self):
@@ -138,12 +181,121 @@ class TestTextProcessorConfiguration:
         assert processor.chunk_size == 300
         assert processor.chunk_overlap == 75
     
-    def test_default_separators_include_paragraph_breaks(self):
+    def test_default_separators_include_paragraph_breaks(self, make_processor):
         """Test that default separators include paragraph breaks."""
-        processor = TextProcessor()
+        processor = make_processor()
         assert "\n\n" in processor.separators
     
-    def test_default_separators_include_line_breaks(self):
+    def test_default_separators_include_line_breaks(self, make_processor):
         """Test that default separators include line breaks."""
-        processor = TextProcessor()
+        processor = make_processor()
         assert "\n" in processor.separators
+
+
+class TestDeduplicateChunks:
+    """Tests for deduplicate_chunks method."""
+
+    def test_removes_exact_duplicates(self):
+        """Test that chunks with identical text are dropped."""
+        chunks = [
+            Document(page_content="unique text", metadata={"source": "a.txt"}),
+            Document(page_content="repeated footer", metadata={"source": "a.txt"}),
+            Document(page_content="repeated footer", metadata={"source": "b.txt"}),
+        ]
+        result = TextProcessor.deduplicate_chunks(chunks)
+        assert len(result) == 2
+
+    def test_keeps_first_occurrence(self):
+        """Test that the first occurrence of a duplicate is kept."""
+        chunks = [
+            Document(page_content="repeated footer", metadata={"source": "a.txt"}),
+            Document(page_content="repeated footer", metadata={"source": "b.txt"}),
+        ]
+        result = TextProcessor.deduplicate_chunks(chunks)
+        assert result[0].metadata["source"] == "a.txt"
+
+    def test_preserves_order(self):
+        """Test that unique chunks keep their original order."""
+        chunks = [
+            Document(page_content=f"chunk {i}", metadata={})
+            for i in range(5)
+        ]
+        result = TextProcessor.deduplicate_chunks(chunks)
+        assert [c.page_content for c in result] == [f"chunk {i}" for i in range(5)]
+
+    def test_empty_list_returns_empty(self):
+        """Test that an empty chunk list stays empty."""
+        assert TextProcessor.deduplicate_chunks([]) == []
+
+
+class TestFastSplitText:
+    """Tests for the vectorized fast splitting path."""
+
+    def test_default_separators_use_fast_path(self, make_processor):
+        """Test that the fast path is active for default separators."""
+        processor = make_processor()
+        assert processor._use_fast_path
+
+    def test_custom_separators_use_langchain_splitter(self):
+        """Test that custom separators fall back to the LangChain splitter."""
+        processor = TextProcessor(separators=["---", " "])
+        assert not processor._use_fast_path
+
+    def test_chunks_reference_original_offsets(self, make_processor):
+        """Test that start_index points at each chunk within the source."""
+        text = "First paragraph here.\n\n" + "word " * 100 + "\n\nLast one."
+        processor = make_processor(80, 20)
+
+        for start_index, chunk_text in processor._fast_split_text(text):
+            assert text[start_index:start_index + len(chunk_text)] == chunk_text
+
+    def test_chunks_respect_size_limit(self, make_processor):
+        """Test that fast-path chunks never exceed chunk_size."""
+        text = "word " * 500
+        processor = make_processor(100, 20)
+
+        chunks = processor._fast_split_text(text)
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 100 for _, chunk in chunks)
+
+    def test_whitespace_only_text_yields_no_chunks(self, make_processor):
+        """Test that whitespace-only content produces no chunks."""
+        processor = make_processor(100, 20)
+        assert processor._fast_split_text("   \n\n  ") == []
+
+    def test_start_index_in_chunk_metadata(self, make_processor, long_document: Document):
+        """Test that split_documents records start_index like the splitter."""
+        processor = make_processor(100, 20)
+        chunks = processor.split_documents([long_document])
+
+        assert all("start_index" in chunk.metadata for chunk in chunks)
+
+
+class TestTokenAnnotation:
+    """Tests for n_tokens metadata annotation."""
+
+    class _StubEncoder:
+        def encode_batch(self, texts):
+            return [text.split() for text in texts]
+
+    def test_annotates_token_counts(self):
+        """Test that each chunk gets an n_tokens metadata entry."""
+        processor = TextProcessor(chunk_size=1000, chunk_overlap=200)
+        processor._token_encoder = self._StubEncoder()
+
+        chunks = processor.split_documents(
+            [Document(page_content="three short words")]
+        )
+
+        assert all(chunk.metadata["n_tokens"] == 3 for chunk in chunks)
+
+    def test_missing_encoder_skips_annotation(self):
+        """Test that chunks are left untouched when tiktoken is unavailable."""
+        processor = TextProcessor(chunk_size=1000, chunk_overlap=200)
+        processor._token_encoder = False
+
+        chunks = processor.split_documents(
+            [Document(page_content="some content here")]
+        )
+
+        assert all("n_tokens" not in chunk.metadata for chunk in chunks)
@@ -7,7 +7,7 @@ import pytest
 from langchain_core.documents import Document
 
 from src.ports.embedding_provider import BaseEmbeddingProvider
-from src.vector_store import VectorStore
+from src.vector_store import VectorStore, _content_ids
 
 
 class TestVectorStoreInitialization:
@@ -70,7 +70,15 @@ class TestVectorStoreInitialization:
 class TestCreateFromDocuments:
     """Tests for create_from_documents method."""
 
-    @patch("src.vector_store.Chroma")
+    @pytest.fixture(autouse=True)
+    def mock_chroma(self, monkeypatch) -> MagicMock:
+        """Replace Chroma for every test in this class via one patch."""
+        chroma = MagicMock()
+        chroma.from_documents.return_value = Mock()
+        chroma.return_value = Mock()
+        monkeypatch.setattr("src.vector_store.Chroma", chroma)
+        return chroma
+
     def test_creates_vectorstore_from_documents(
         self,
         mock_chroma: MagicMock,
@@ -79,7 +87,6 @@ class TestCreateFromDocuments:
         temp_vector_store_path: Path,
     ):
         """Test that vectorstore is created from documents."""
-        mock_chroma.from_documents.return_value = Mock()
         store = VectorStore(
             embedding_provider=mock_embedding_provider,
             persist_directory=temp_vector_store_path,
@@ -87,7 +94,6 @@ class TestCreateFromDocuments:
         result = store.create_from_documents(sample_documents)
         assert result is not None
 
-    @patch("src.vector_store.Chroma")
     def test_calls_chroma_from_documents(
         self,
         mock_chroma: MagicMock,
@@ -96,7 +102,6 @@ class TestCreateFromDocuments:
         temp_vector_store_path: Path,
     ):
         """Test that Chroma.from_documents is called."""
-        mock_chroma.from_documents.return_value = Mock()
         store = VectorStore(
             embedding_provider=mock_embedding_provider,
             persist_directory=temp_vector_store_path,
@@ -104,7 +109,6 @@ class TestCreateFromDocuments:
         store.create_from_documents(sample_documents)
         mock_chroma.from_documents.assert_called_once()
 
-    @patch("src.vector_store.Chroma")
     def test_chroma_receives_embedding_provider(
         self,
         mock_chroma: MagicMock,
@@ -113,7 +117,6 @@ class TestCreateFromDocuments:
         temp_vector_store_path: Path,
     ):
         """Test that the embedding provider is forwarded to Chroma."""
-        mock_chroma.from_documents.return_value = Mock()
         store = VectorStore(
             embedding_provider=mock_embedding_provider,
             persist_directory=temp_vector_store_path,
@@ -122,7 +125,6 @@ class TestCreateFromDocuments:
         call_kwargs = mock_chroma.from_documents.call_args[1]
         assert call_kwargs["embedding"] is mock_embedding_provider
 
-    @patch("src.vector_store.Chroma")
     def test_creates_persist_directory(
         self,
         mock_chroma: MagicMock,
@@ -132,7 +134,6 @@ class TestCreateFromDocuments:
     ):
         """Test that nested persist directory is created if it doesn't exist."""
         nested_path = temp_directory / "nested" / "vector_db"
-        mock_chroma.from_documents.return_value = Mock()
         store = VectorStore(
             embedding_provider=mock_embedding_provider,
             persist_directory=nested_path,
@@ -140,28 +141,237 @@ class TestCreateFromDocuments:
         store.create_from_documents(sample_documents)
         assert nested_path.parent.exists()
 
-    @patch("src.vector_store.Chroma")
     def test_sets_vectorstore_attribute(
         self,
         mock_chroma: MagicMock,
         mock_embedding_provider: BaseEmbeddingProvider,
         sample_documents: list[Document],
-        temp_vector_store_path: Path,
+        existing_vector_store_path: Path,
     ):
         """Test that vectorstore attribute is set after creation."""
         mock_vs = Mock()
         mock_chroma.from_documents.return_value = mock_vs
         store = VectorStore(
             embedding_provider=mock_embedding_provider,
-            persist_directory=temp_vector_store_path,
+            persist_directory=existing_vector_store_path,
         )
         store.create_from_documents(sample_documents)
         assert store.vectorstore is mock_vs
 
 
+class TestEmbeddingBatching:
+    """Tests for batched embedding during store creation."""
+
+    @pytest.fixture(autouse=True)
+    def mock_chroma(self, monkeypatch) -> MagicMock:
+        """Replace Chroma for every test in this class via one patch."""
+        chroma = MagicMock()
+        chroma.from_documents.return_value = Mock()
+        chroma.return_value = Mock()
+        monkeypatch.setattr("src.vector_store.Chroma", chroma)
+        return chroma
+
+    def test_splits_documents_into_batches(
+        self,
+        mock_chroma: MagicMock,
+        mock_embedding_provider: BaseEmbeddingProvider,
+        temp_vector_store_path: Path,
+    ):
+        """Test that documents beyond the first batch go through add_documents."""
+        mock_vs = Mock()
+        mock_chroma.from_documents.return_value = mock_vs
+        store = VectorStore(
+            embedding_provider=mock_embedding_provider,
+            persist_directory=temp_vector_store_path,
+            embedding_batch_size=2,
+        )
+        documents = [
+            Document(page_content=f"doc {i}", metadata={"source": f"{i}.txt"})
+            for i in range(5)
+        ]
+        store.create_from_documents(documents)
+        # 5 docs with batch_size=2: first 2 create the store, then 2 + 1 appended
+        assert mock_chroma.from_documents.call_count == 1
+        assert mock_vs.add_documents.call_count == 2
+
+    def test_single_batch_skips_add_documents(
+        self,
+        mock_chroma: MagicMock,
+        mock_embedding_provider: BaseEmbeddingProvider,
+        sample_documents: list[Document],
+        temp_vector_store_path: Path,
+    ):
+        """Test that small document sets are created in a single call."""
+        mock_vs = Mock()
+        mock_chroma.from_documents.return_value = mock_vs
+        store = VectorStore(
+            embedding_provider=mock_embedding_provider,
+            persist_directory=temp_vector_store_path,
+            embedding_batch_size=16,
+        )
+        store.create_from_documents(sample_documents)
+        mock_vs.add_documents.assert_not_called()
+
+    def test_async_creation_adds_all_batches(
+        self,
+        mock_chroma: MagicMock,
+        mock_embedding_provider: BaseEmbeddingProvider,
+        temp_vector_store_path: Path,
+    ):
+        """Test that acreate_from_documents pushes every batch to the store."""
+        import asyncio
+
+        mock_vs = Mock()
+        mock_chroma.from_documents.return_value = mock_vs
+        store = VectorStore(
+            embedding_provider=mock_embedding_provider,
+            persist_directory=temp_vector_store_path,
+            embedding_batch_size=2,
+        )
+        documents = [
+            Document(page_content=f"doc {i}", metadata={"source": f"{i}.txt"})
+            for i in range(5)
+        ]
+        asyncio.run(store.acreate_from_documents(documents, concurrency=2))
+        assert mock_chroma.from_documents.call_count == 1
+        assert mock_vs.add_documents.call_count == 2
+
+    def test_add_documents_appends_in_batches(
+        self,
+        mock_chroma: MagicMock,
+        mock_embedding_provider: BaseEmbeddingProvider,
+        sample_documents: list[Document],
+        temp_vector_store_path: Path,
+    ):
+        """Test that add_documents batches appends to an existing store."""
+        mock_vs = Mock()
+        mock_chroma.from_documents.return_value = mock_vs
+        store = VectorStore(
+            embedding_provider=mock_embedding_provider,
+            persist_directory=temp_vector_store_path,
+            embedding_batch_size=2,
+        )
+        store.create_from_documents(sample_documents)
+        mock_vs.add_documents.reset_mock()
+
+        store.add_documents(sample_documents)
+        # 3 docs with batch_size=2 → 2 append calls
+        assert mock_vs.add_documents.call_count == 2
+
+    def test_add_documents_requires_initialized_store(
+        self,
+        mock_embedding_provider: BaseEmbeddingProvider,
+        sample_documents: list[Document],
+        temp_vector_store_path: Path,
+    ):
+        """Test that add_documents raises before the store is initialized."""
+        store = VectorStore(
+            embedding_provider=mock_embedding_provider,
+            persist_directory=temp_vector_store_path,
+        )
+        with pytest.raises(RuntimeError, match="not initialized"):
+            store.add_documents(sample_documents)
+
+    def test_batch_size_defaults_from_settings(
+        self,
+        mock_embedding_provider: BaseEmbeddingProvider,
+        temp_vector_store_path: Path,
+    ):
+        """Test that embedding_batch_size falls back to settings."""
+        store = VectorStore(
+            embedding_provider=mock_embedding_provider,
+            persist_directory=temp_vector_store_path,
+        )
+        assert store.embedding_batch_size > 0
+
+
+class TestContentDedup:
+    """Tests for content-hash deduplication on ingest."""
+
+    @pytest.fixture(autouse=True)
+    def mock_chroma(self, monkeypatch) -> MagicMock:
+        """Replace Chroma for every test in this class via one patch."""
+        chroma = MagicMock()
+        chroma.from_documents.return_value = Mock()
+        chroma.return_value = Mock()
+        monkeypatch.setattr("src.vector_store.Chroma", chroma)
+        return chroma
+
+    def test_content_ids_are_deterministic(self):
+        """Test that identical text maps to the same ID, distinct text differs."""
+        docs = [
+            Document(page_content="same text", metadata={"source": "a.txt"}),
+            Document(page_content="same text", metadata={"source": "b.txt"}),
+            Document(page_content="other text", metadata={"source": "c.txt"}),
+        ]
+        ids = _content_ids(docs)
+        assert ids[0] == ids[1]
+        assert ids[0] != ids[2]
+
+    def test_skips_already_stored_chunks(
+        self,
+        mock_chroma: MagicMock,
+        mock_embedding_provider: BaseEmbeddingProvider,
+        temp_vector_store_path: Path,
+    ):
+        """Test that add_documents drops chunks whose hash is already stored."""
+        documents = [
+            Document(page_content=f"doc {i}", metadata={"source": f"{i}.txt"})
+            for i in range(3)
+        ]
+        stored_id = _content_ids(documents[:1])[0]
+
+        mock_vs = Mock()
+        mock_chroma.from_documents.return_value = mock_vs
+        mock_vs.get.return_value = {"ids": [stored_id]}
+        store = VectorStore(
+            embedding_provider=mock_embedding_provider,
+            persist_directory=temp_vector_store_path,
+            embedding_batch_size=16,
+        )
+        store.create_from_documents(documents)
+
+        store.add_documents(documents)
+        (batch,), kwargs = mock_vs.add_documents.call_args
+        assert len(batch) == 2
+        assert documents[0] not in batch
+        assert kwargs["ids"] == _content_ids(batch)
+
+    def test_adds_everything_when_store_cannot_report_ids(
+        self,
+        mock_chroma: MagicMock,
+        mock_embedding_provider: BaseEmbeddingProvider,
+        sample_documents: list[Document],
+        temp_vector_store_path: Path,
+    ):
+        """Test that a failing ID lookup falls back to embedding all chunks."""
+        mock_vs = Mock()
+        mock_chroma.from_documents.return_value = mock_vs
+        mock_vs.get.side_effect = RuntimeError("collection unavailable")
+        store = VectorStore(
+            embedding_provider=mock_embedding_provider,
+            persist_directory=temp_vector_store_path,
+            embedding_batch_size=16,
+        )
+        store.create_from_documents(sample_documents)
+
+        store.add_documents(sample_documents)
+        (batch,), _ = mock_vs.add_documents.call_args
+        assert len(batch) == len(sample_documents)
+
+
 class TestLoadExisting:
     """Tests for load_existing method."""
 
+    @pytest.fixture(autouse=True)
+    def mock_chroma(self, monkeypatch) -> MagicMock:
+        """Replace Chroma for every test in this class via one patch."""
+        chroma = MagicMock()
+        chroma.from_documents.return_value = Mock()
+        chroma.return_value = Mock()
+        monkeypatch.setattr("src.vector_store.Chroma", chroma)
+        return chroma
+
     def test_raises_error_for_nonexistent_store(
         self,
         mock_embedding_provider: BaseEmbeddingProvider,
@@ -175,54 +385,46 @@ class TestLoadExisting:
         with pytest.raises(FileNotFoundError):
             store.load_existing()
 
-    @patch("src.vector_store.Chroma")
     def test_loads_existing_vectorstore(
         self,
         mock_chroma: MagicMock,
         mock_embedding_provider: BaseEmbeddingProvider,
-        temp_vector_store_path: Path,
+        existing_vector_store_path: Path,
     ):
         """Test that existing vectorstore is loaded successfully."""
-        temp_vector_store_path.mkdir(parents=True)
-        mock_chroma.return_value = Mock()
         store = VectorStore(
             embedding_provider=mock_embedding_provider,
-            persist_directory=temp_vector_store_path,
+            persist_directory=existing_vector_store_path,
         )
         result = store.load_existing()
         assert result is not None
 
-    @patch("src.vector_store.Chroma")
     def test_calls_chroma_constructor(
         self,
         mock_chroma: MagicMock,
         mock_embedding_provider: BaseEmbeddingProvider,
-        temp_vector_store_path: Path,
+        existing_vector_store_path: Path,
     ):
         """Test that Chroma constructor is called when loading."""
-        temp_vector_store_path.mkdir(parents=True)
-        mock_chroma.return_value = Mock()
         store = VectorStore(
             embedding_provider=mock_embedding_provider,
-            persist_directory=temp_vector_store_path,
+            persist_directory=existing_vector_store_path,
         )
         store.load_existing()
         mock_chroma.assert_called_once()
 
-    @patch("src.vector_store.Chroma")
     def test_sets_vectorstore_attribute(
         self,
         mock_chroma: MagicMock,
         mock_embedding_provider: BaseEmbeddingProvider,
-        temp_vector_store_path: Path,
+        existing_vector_store_path: Path,
     ):
         """Test that vectorstore attribute is set after loading."""
-        temp_vector_store_path.mkdir(parents=True)
         mock_vs = Mock()
         mock_chroma.return_value = mock_vs
         store = VectorStore(
             embedding_provider=mock_embedding_provider,
-            persist_directory=temp_vector_store_path,
+            persist_directory=existing_vector_store_path,
         )
         store.load_existing()
         assert store.vectorstore is mock_vs
@@ -231,24 +433,29 @@ class TestLoadExisting:
 class TestGetOrCreate:
     """Tests for get_or_create method."""
 
-    @patch("src.vector_store.Chroma")
+    @pytest.fixture(autouse=True)
+    def mock_chroma(self, monkeypatch) -> MagicMock:
+        """Replace Chroma for every test in this class via one patch."""
+        chroma = MagicMock()
+        chroma.from_documents.return_value = Mock()
+        chroma.return_value = Mock()
+        monkeypatch.setattr("src.vector_store.Chroma", chroma)
+        return chroma
+
     def test_loads_existing_if_available(
         self,
         mock_chroma: MagicMock,
         mock_embedding_provider: BaseEmbeddingProvider,
-        temp_vector_store_path: Path,
+        existing_vector_store_path: Path,
     ):
         """Test that existing store is loaded when directory exists."""
-        temp_vector_store_path.mkdir(parents=True)
-        mock_chroma.return_value = Mock()
         store = VectorStore(
             embedding_provider=mock_embedding_provider,
-            persist_directory=temp_vector_store_path,
+            persist_directory=existing_vector_store_path,
         )
         result = store.get_or_create()
         assert result is not None
 
-    @patch("src.vector_store.Chroma")
     def test_creates_new_if_not_exists(
         self,
         mock_chroma: MagicMock,
@@ -257,7 +464,6 @@ class TestGetOrCreate:
         temp_vector_store_path: Path,
     ):
         """Test that new store is created when directory does not exist."""
-        mock_chroma.from_documents.return_value = Mock()
         store = VectorStore(
             embedding_provider=mock_embedding_provider,
             persist_directory=temp_vector_store_path,
@@ -279,74 +485,239 @@ class TestGetOrCreate:
             store.get_or_create()
 
 
+class _FakeBackend:
+    """
+    Minimal stand-in for an initialized Chroma/FAISS store.
+
+    Fixed attribute layout and a plain call log instead of Mock's
+    auto-attribute and call-recording machinery.
+    """
+
+    def __init__(self, docs=None):
+        self._docs = list(docs or [])
+        self.calls: list = []
+
+    def similarity_search(self, query, k=4, **kwargs):
+        self.calls.append((query, k))
+        return self._docs[:k]
+
+
 class TestSimilaritySearch:
     """Tests for similarity_search method."""
 
-    def test_returns_list_of_documents(
+    @pytest.fixture
+    def primed_store(
         self,
         mock_embedding_provider: BaseEmbeddingProvider,
-        sample_query: str,
         temp_vector_store_path: Path,
     ):
-        """Test that similarity_search returns a list of Documents."""
-        mock_vs = Mock()
-        mock_vs.similarity_search.return_value = [Document(page_content="result")]
+        """
+        Provide a VectorStore pre-wired to a fake initialized backend.
+
+        One construction path and one attribute write shared by the
+        search tests, instead of repeating both in every body.
+        """
         store = VectorStore(
             embedding_provider=mock_embedding_provider,
             persist_directory=temp_vector_store_path,
         )
-        store.vectorstore = mock_vs
-        results = store.similarity_search(sample_query)
-        assert isinstance(results, list)
+        backend = _FakeBackend([Document(page_content="result")])
+        store.vectorstore = backend
+        return store, backend
+
+    @pytest.mark.parametrize(
+        ("k", "check"),
+        [
+            pytest.param(
+                4,
+                lambda backend, results: isinstance(results, list),
+                id="returns_list",
+            ),
+            pytest.param(
+                5,
+                lambda backend, results: len(backend.calls) == 1,
+                id="backend_called_once",
+            ),
+            pytest.param(
+                3,
+                lambda backend, results: backend.calls[0][1] == 3,
+                id="k_forwarded",
+            ),
+        ],
+    )
+    def test_similarity_search_behavior(
+        self, primed_store, sample_query: str, k: int, check
+    ):
+        """Test search delegation to the backend across k values."""
+        store, backend = primed_store
+        results = store.similarity_search(sample_query, k=k)
+        assert check(backend, results)
 
-    def test_calls_vectorstore_similarity_search(
+    def test_raises_if_not_initialized(
         self,
         mock_embedding_provider: BaseEmbeddingProvider,
         sample_query: str,
         temp_vector_store_path: Path,
     ):
-        """Test that vectorstore.similarity_search is called."""
-        mock_vs = Mock()
-        mock_vs.similarity_search.return_value = []
+        """Test that RuntimeError is raised when vectorstore is None."""
         store = VectorStore(
             embedding_provider=mock_embedding_provider,
             persist_directory=temp_vector_store_path,
         )
-        store.vectorstore = mock_vs
-        store.similarity_search(sample_query, k=5)
-        mock_vs.similarity_search.assert_called_once()
+        with pytest.raises(RuntimeError):
+            store.similarity_search(sample_query)
+
+
+
+
 
-    def test_passes_k_parameter(
+class TestFaissBackend:
+    """Tests for the FAISS vector store backend."""
+
+    def test_unsupported_backend_raises_error(
         self,
         mock_embedding_provider: BaseEmbeddingProvider,
-        sample_query: str,
         temp_vector_store_path: Path,
     ):
-        """Test that the k parameter is forwarded to similarity_search."""
-        mock_vs = Mock()
-        mock_vs.similarity_search.return_value = []
+        """Test that an unknown backend raises ValueError."""
+        with pytest.raises(ValueError, match="Unsupported vector backend"):
+            VectorStore(
+                embedding_provider=mock_embedding_provider,
+                persist_directory=temp_vector_store_path,
+                backend="annoy",
+            )
+
+    def test_default_backend_from_settings(
+        self,
+        mock_embedding_provider: BaseEmbeddingProvider,
+        temp_vector_store_path: Path,
+    ):
+        """Test that the backend defaults to the settings value."""
         store = VectorStore(
             embedding_provider=mock_embedding_provider,
             persist_directory=temp_vector_store_path,
         )
-        store.vectorstore = mock_vs
-        store.similarity_search(sample_query, k=3)
-        call_kwargs = mock_vs.similarity_search.call_args[1]
-        assert call_kwargs["k"] == 3
+        assert store.backend == "chroma"
 
-    def test_raises_if_not_initialized(
+    @patch("src.vector_store._faiss_class")
+    def test_create_uses_faiss_and_saves(
         self,
+        mock_faiss_class: MagicMock,
         mock_embedding_provider: BaseEmbeddingProvider,
-        sample_query: str,
+        sample_documents: list[Document],
         temp_vector_store_path: Path,
     ):
-        """Test that RuntimeError is raised when vectorstore is None."""
+        """Test that the faiss backend builds and persists a FAISS index."""
+        mock_faiss = MagicMock()
+        mock_store = Mock()
+        mock_faiss.from_documents.return_value = mock_store
+        mock_faiss_class.return_value = mock_faiss
+
         store = VectorStore(
             embedding_provider=mock_embedding_provider,
             persist_directory=temp_vector_store_path,
+            backend="faiss",
         )
-        with pytest.raises(RuntimeError):
-            store.similarity_search(sample_query)
+        result = store.create_from_documents(sample_documents)
+
+        assert result is mock_store
+        mock_faiss.from_documents.assert_called_once()
+        mock_store.save_local.assert_called_once_with(str(temp_vector_store_path))
+
+    @patch("src.vector_store._faiss_class")
+    def test_load_existing_uses_faiss_loader(
+        self,
+        mock_faiss_class: MagicMock,
+        mock_embedding_provider: BaseEmbeddingProvider,
+        existing_vector_store_path: Path,
+    ):
+        """Test that loading with the faiss backend calls load_local."""
+        mock_faiss = MagicMock()
+        mock_faiss.load_local.return_value = Mock()
+        mock_faiss_class.return_value = mock_faiss
+
+        store = VectorStore(
+            embedding_provider=mock_embedding_provider,
+            persist_directory=existing_vector_store_path,
+            backend="faiss",
+        )
+        store.load_existing()
+
+        mock_faiss.load_local.assert_called_once()
+
+    @patch("src.vector_store.Chroma")
+    def test_chroma_backend_does_not_save_local(
+        self,
+        mock_chroma: MagicMock,
+        mock_embedding_provider: BaseEmbeddingProvider,
+        sample_documents: list[Document],
+        temp_vector_store_path: Path,
+    ):
+        """Test that the chroma backend never calls save_local."""
+        mock_store = Mock()
+        mock_chroma.from_documents.return_value = mock_store
+
+        store = VectorStore(
+            embedding_provider=mock_embedding_provider,
+            persist_directory=temp_vector_store_path,
+        )
+        store.create_from_documents(sample_documents)
+
+        mock_store.save_local.assert_not_called()
+
+
+class TestTokenBudgetBatching:
+    """Tests for token-budget batch packing."""
+
+    def make_store(self, mock_embedding_provider, temp_vector_store_path):
+        return VectorStore(
+            embedding_provider=mock_embedding_provider,
+            persist_directory=temp_vector_store_path,
+            embedding_batch_size=2,
+        )
+
+    def test_packs_by_token_budget(
+        self,
+        mock_embedding_provider: BaseEmbeddingProvider,
+        temp_vector_store_path: Path,
+    ):
+        """Test that annotated documents are packed up to the token budget."""
+        store = self.make_store(mock_embedding_provider, temp_vector_store_path)
+        documents = [
+            Document(page_content="a", metadata={"n_tokens": 3000}),
+            Document(page_content="b", metadata={"n_tokens": 3000}),
+            Document(page_content="c", metadata={"n_tokens": 3000}),
+        ]
 
+        batches = list(store._iter_batches(documents))
+
+        assert [len(batch) for batch in batches] == [2, 1]
+
+    def test_oversized_document_gets_own_batch(
+        self,
+        mock_embedding_provider: BaseEmbeddingProvider,
+        temp_vector_store_path: Path,
+    ):
+        """Test that a single chunk over budget is still emitted alone."""
+        store = self.make_store(mock_embedding_provider, temp_vector_store_path)
+        documents = [
+            Document(page_content="big", metadata={"n_tokens": 9000}),
+            Document(page_content="small", metadata={"n_tokens": 10}),
+        ]
+
+        batches = list(store._iter_batches(documents))
+
+        assert [len(batch) for batch in batches] == [1, 1]
+
+    def test_falls_back_to_fixed_size_without_counts(
+        self,
+        mock_embedding_provider: BaseEmbeddingProvider,
+        temp_vector_store_path: Path,
+    ):
+        """Test that unannotated documents use embedding_batch_size slices."""
+        store = self.make_store(mock_embedding_provider, temp_vector_store_path)
+        documents = [Document(page_content=str(i)) for i in range(5)]
 
+        batches = list(store._iter_batches(documents))
 
+        assert [len(batch) for batch in batches] == [2, 2, 1]